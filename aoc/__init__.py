@@ -0,0 +1,6 @@
+"""
+Shared helpers for the Advent of Code solvers.
+
+The solvers are plain scripts, so they put the repository root on `sys.path`
+before importing from this package.
+"""
@@ -0,0 +1,173 @@
+"""
+Persistent cache of parsed inputs.
+
+Parsing the text input with string splitting is repeated on every run. With
+`load_cached(file_path, parser)` the result of `parser(file_path)` is stored as `.npy`
+files in a `.aoc_cache/` folder next to the input, and later runs memory-map them
+instead of parsing again.
+
+The parser must return a NumPy array or a dict of NumPy arrays (for example
+`{"targets": ..., "numbers": ..., "offsets": ...}` for ragged data).
+
+Cache entries are keyed by a hash of the input file content and of the bytecode of
+the parser and of the functions of its module it calls (see `parser_digest`), so they
+are invalidated automatically when either changes. Set the environment variable
+`AOC_CACHE=0` to bypass the cache, and `AOC_CACHE_REPORT=1` to print the hit/miss
+counts when the program exits.
+"""
+
+import atexit
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import types
+from collections import Counter
+
+import numpy as np
+
+CACHE_FOLDER = ".aoc_cache"
+SINGLE_ARRAY = "__array__"  # file name used when the parser returns a single array
+
+stats = Counter()
+
+
+def file_digest(file_path):
+    """Hash of the content of a file."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def parser_code(parser):
+    """
+    The code objects the parser runs: its own, those of the functions defined inside it,
+    and those of the functions of its module it calls by name, and so on.
+
+    Functions of other modules (NumPy, aoc, ...) are not followed: a change there needs
+    the cache to be cleared by hand (or AOC_CACHE=0).
+    """
+    found = []
+    seen = set()
+    pending = [parser.__code__]
+    while pending:
+        code = pending.pop()
+        if code in seen:
+            continue
+        seen.add(code)
+        found.append(code)
+        pending.extend(const for const in code.co_consts if hasattr(const, "co_code"))
+        for name in code.co_names:
+            helper = parser.__globals__.get(name)
+            helper = getattr(helper, "__wrapped__", helper)  # the function under a decorator
+            if getattr(helper, "__module__", None) == parser.__module__ and hasattr(helper, "__code__"):
+                pending.append(helper.__code__)
+    return found
+
+
+def global_fingerprint(value):
+    """
+    What a global read by the parser contributes to its hash: the version of a module,
+    the value of a simple constant, nothing for the rest (functions are hashed by code).
+    """
+    if isinstance(value, types.ModuleType):
+        return f"{value.__name__} {getattr(value, '__version__', '')}"
+    if isinstance(value, (bool, int, float, complex, str, bytes, tuple, frozenset, type(None))):
+        return repr(value)
+    return ""
+
+
+def parser_digest(parser):
+    """Hash of the parser's code and its helpers', so that changing them invalidates its entries."""
+    digest = hashlib.blake2b(digest_size=8)
+    for code in parser_code(parser):
+        # nested code objects are hashed on their own: their repr holds their address
+        consts = [const for const in code.co_consts if not hasattr(const, "co_code")]
+        # co_names holds the globals and attributes used (np.int64, int, ...)
+        names = [(name, global_fingerprint(parser.__globals__.get(name))) for name in code.co_names]
+        digest.update(code.co_code + repr((consts, names, code.co_varnames)).encode())
+    return digest.hexdigest()
+
+
+def cache_entry_path(file_path, parser):
+    """
+    Folder holding the cached result of `parser(file_path)`.
+
+    Returns:
+        tuple: (folder of this entry, prefix shared by all the entries of this input file
+        and parser, whatever the versions of the file content and of the parser code)
+    """
+    folder = os.path.join(os.path.dirname(os.path.abspath(file_path)), CACHE_FOLDER)
+    prefix = f"{os.path.basename(file_path)}.{parser.__module__}.{parser.__name__}."
+    return os.path.join(folder, f"{prefix}{parser_digest(parser)}.{file_digest(file_path)}"), prefix
+
+
+def save_entry(entry_path, result):
+    """Write the arrays to a temporary folder first, so a crash never leaves half an entry."""
+    arrays = result if isinstance(result, dict) else {SINGLE_ARRAY: result}
+    parent = os.path.dirname(entry_path)
+    os.makedirs(parent, exist_ok=True)
+
+    staging = tempfile.mkdtemp(dir=parent)
+    try:
+        for name, array in arrays.items():
+            np.save(os.path.join(staging, f"{name}.npy"), np.asarray(array))
+        os.rename(staging, entry_path)
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)  # another process stored the same entry first
+        if not os.path.isdir(entry_path):
+            raise
+
+
+def load_entry(entry_path):
+    arrays = {
+        os.path.splitext(name)[0]: np.load(os.path.join(entry_path, name), mmap_mode="r")
+        for name in os.listdir(entry_path)
+    }
+    return arrays[SINGLE_ARRAY] if SINGLE_ARRAY in arrays else arrays
+
+
+def remove_stale_entries(entry_path, prefix):
+    """Remove the entries of older versions of the same input file and parser."""
+    folder = os.path.dirname(entry_path)
+    for name in os.listdir(folder):
+        path = os.path.join(folder, name)
+        if name.startswith(prefix) and path != entry_path:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def load_cached(file_path, parser):
+    """
+    Return `parser(file_path)`, from the cache when possible.
+
+    Cached arrays are memory-mapped read-only; copy them before modifying them. If the
+    cache cannot be written (read-only input folder), the parsed result is returned as is.
+    """
+    if os.environ.get("AOC_CACHE") == "0":
+        stats["bypassed"] += 1
+        return parser(file_path)
+
+    entry_path, prefix = cache_entry_path(file_path, parser)
+    if os.path.isdir(entry_path):
+        stats["hits"] += 1
+        return load_entry(entry_path)
+
+    stats["misses"] += 1
+    result = parser(file_path)
+    try:
+        save_entry(entry_path, result)
+        remove_stale_entries(entry_path, prefix)
+    except OSError:  # e.g. the folder of the input is read-only: parse again next time
+        stats["unwritable"] += 1
+    return result
+
+
+def report():
+    print(f"Input cache: {stats['hits']} hits, {stats['misses']} misses", file=sys.stderr)
+
+
+if os.environ.get("AOC_CACHE_REPORT") == "1":
+    atexit.register(report)
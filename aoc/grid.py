@@ -0,0 +1,52 @@
+"""
+Compact NumPy grids for the 2D puzzles.
+
+A map is stored as a 2D `uint8` array holding the ASCII code of every cell, read from
+the file in a single bulk read. Compare cells with byte literals converted by `ord`
+(or with `cell(b"#")`), e.g. `grid == ord("#")`.
+"""
+
+import numpy as np
+
+NEWLINE = ord("\n")
+
+
+def cell(char):
+    """The uint8 value of a single character, e.g. cell("#") == 35."""
+    return np.uint8(ord(char))
+
+
+def grid_from_bytes(data):
+    """
+    Turn the bytes of a map (lines of equal length) into a 2D uint8 array.
+
+    Args:
+        data (bytes or np.ndarray): The map, with or without a trailing newline.
+
+    Returns:
+        np.ndarray: Array of shape (rows, cols) with the ASCII code of every cell.
+    """
+    data = np.frombuffer(data, dtype=np.uint8) if isinstance(data, (bytes, bytearray)) else data
+    data = data[data != ord("\r")]
+    while len(data) and data[-1] == NEWLINE:
+        data = data[:-1]
+
+    newlines = np.flatnonzero(data == NEWLINE)
+    cols = int(newlines[0]) if len(newlines) else len(data)
+    rows = len(newlines) + 1
+    if len(data) != rows * (cols + 1) - 1:
+        raise ValueError("All lines of a grid must have the same length.")
+
+    # Re-append the last newline so every row is `cols` cells + 1 newline, then drop the newlines
+    data = np.append(data, np.uint8(NEWLINE))
+    return data.reshape(rows, cols + 1)[:, :cols].copy()
+
+
+def load_grid(file_path):
+    """Read a map file into a 2D uint8 array in one go."""
+    return grid_from_bytes(np.fromfile(file_path, dtype=np.uint8))
+
+
+def load_digit_grid(file_path):
+    """Read a map of digits (like a topographic map) into a 2D uint8 array of their values."""
+    return load_grid(file_path) - cell("0")
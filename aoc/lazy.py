@@ -0,0 +1,41 @@
+"""
+Lazy imports for heavy dependencies (networkx, matplotlib, pulp, ...).
+
+Importing networkx or matplotlib often takes longer than solving the puzzle.
+`lazy_import` returns a stand-in module that performs the real import the first time
+one of its attributes is used, so solvers only pay for the import on the code paths
+that need it (a visualization, an ILP fallback, ...):
+
+    nx = lazy_import("networkx")
+    plt = lazy_import("matplotlib.pyplot")
+
+    graph = nx.DiGraph()  # networkx is imported here
+
+`python benchmark.py --import-time` reports how much import time each solver pays.
+"""
+
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    """Module stand-in that imports the real module on first attribute access."""
+
+    def __getattr__(self, attribute):
+        # Only called for attributes that are not set yet, i.e. before the real import.
+        # __import__ rather than importlib.import_module, so that `-X importtime` sees it.
+        __import__(self.__name__)
+        module = sys.modules[self.__name__]
+        self.__dict__.update(module.__dict__)  # later lookups no longer come through here
+        return getattr(module, attribute)
+
+    def __repr__(self):
+        loaded = "loaded" if self.__name__ in sys.modules else "not loaded yet"
+        return f"<lazy module {self.__name__!r} ({loaded})>"
+
+
+def lazy_import(name):
+    """Return the module `name` if it is already imported, otherwise a lazy stand-in for it."""
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name)
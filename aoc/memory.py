@@ -0,0 +1,87 @@
+"""
+Peak memory of the stages of a solver (parse, build, solve, ...), measured with tracemalloc.
+
+Mark the stages with `stage`, as a decorator or a context manager:
+
+    @stage("parse")
+    def parse_disk_map(filename):
+        ...
+
+    with stage("solve"):
+        checksum = calculate_checksum(compact_disk(disk_map))
+
+Nothing is measured unless the environment variable `AOC_MEMORY` names a file. Then
+tracemalloc is started and every completed stage appends a JSON line to that file:
+
+    {"stage": "parse", "peak_bytes": 1048576, "retained_bytes": 524288}
+
+- peak_bytes: highest memory allocated during the stage, above what was allocated
+  when the stage started
+- retained_bytes: memory still allocated when the stage ended (its result)
+
+Modules imported during a stage count towards it, e.g. a lazily imported networkx in
+the stage building the graph.
+
+`python benchmark.py --memory --sizes ...` runs the solvers with it and flags the
+stages whose peak grows faster than linearly with the input size.
+"""
+
+import contextlib
+import json
+import os
+import tracemalloc
+
+OUTPUT = os.environ.get("AOC_MEMORY")
+
+_stages = []  # stack of the open stages: [memory at start, highest peak of nested stages]
+
+
+class stage(contextlib.ContextDecorator):
+    """Measure the peak memory of a stage of a solver (when `AOC_MEMORY` is set)."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        if not OUTPUT:
+            return self
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        current, peak = tracemalloc.get_traced_memory()
+        if _stages:
+            _stages[-1][1] = max(_stages[-1][1], peak)  # the outer stage's peak so far
+        tracemalloc.reset_peak()
+        _stages.append([current, current])
+        return self
+
+    def __exit__(self, *exc_info):
+        if not OUTPUT:
+            return False
+        current, peak = tracemalloc.get_traced_memory()
+        start, nested_peak = _stages.pop()
+        peak = max(peak, nested_peak)
+        if _stages:
+            _stages[-1][1] = max(_stages[-1][1], peak)
+
+        with open(OUTPUT, "a") as f:
+            f.write(json.dumps({
+                "stage": self.name,
+                "peak_bytes": peak - start,
+                "retained_bytes": current - start,
+            }) + "\n")
+        return False
+
+
+def read_stages(file_path):
+    """
+    Read the stages written by a run.
+
+    Returns:
+        dict: stage name -> highest peak_bytes over all the times the stage ran.
+    """
+    peaks = {}
+    with open(file_path, "r") as f:
+        for line in f:
+            record = json.loads(line)
+            peaks[record["stage"]] = max(peaks.get(record["stage"], 0), record["peak_bytes"])
+    return peaks
@@ -0,0 +1,113 @@
+"""
+Process pools that share NumPy grids instead of pickling them into every task.
+
+Passing a grid as a task argument (`pool.starmap(f, [(chunk, grid) ...])` or
+`executor.map(f, positions, [grid] * n)`) pickles the whole grid for every task, and
+for short tasks that IPC costs more than the work itself. `parallel_map` publishes the
+arrays once in `multiprocessing.shared_memory`; the workers attach to them when they
+start, without copying, and the tasks are sent in chunks:
+
+    def is_loop(obstruction, grid, start):
+        ...
+
+    loops = parallel_map(is_loop, candidates, shared={"grid": grid}, constants={"start": start})
+
+The function is called as `function(task, **shared, **constants)`. The shared arrays
+are read-only in the workers. With a single process (or few tasks) everything runs in
+this process, on the original arrays.
+"""
+
+import math
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Arrays and constants of the worker process, set by `_initialize_worker`
+_worker_arguments = {}
+_worker_memory = []  # keeps the shared memory blocks attached while the worker lives
+
+
+class SharedArray:
+    """A copy of a NumPy array in a shared memory block, to be attached by other processes."""
+
+    def __init__(self, array):
+        array = np.ascontiguousarray(array)
+        self.memory = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self.array = np.ndarray(array.shape, dtype=array.dtype, buffer=self.memory.buf)
+        self.array[...] = array
+
+    @property
+    def spec(self):
+        """What a worker needs to attach: (memory name, shape, dtype), cheap to pickle."""
+        return self.memory.name, self.array.shape, self.array.dtype.str
+
+    def close(self):
+        del self.array  # release the buffer before closing the block
+        self.memory.close()
+        self.memory.unlink()
+
+
+def attach(spec):
+    """Attach to a `SharedArray` published by the parent process, without copying it."""
+    name, shape, dtype = spec
+    memory = shared_memory.SharedMemory(name=name)
+    _worker_memory.append(memory)
+    array = np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+    array.flags.writeable = False
+    return array
+
+
+def _initialize_worker(specs, constants):
+    _worker_arguments.update({name: attach(spec) for name, spec in specs.items()})
+    _worker_arguments.update(constants)
+
+
+def _run_chunk(function, chunk):
+    return [function(task, **_worker_arguments) for task in chunk]
+
+
+def chunked(tasks, chunk_size):
+    return [tasks[i:i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+
+
+def parallel_map(function, tasks, shared=None, constants=None, processes=None,
+                 chunks_per_process=4, min_tasks=2):
+    """
+    Return `[function(task, **shared, **constants) for task in tasks]`, computed in a
+    process pool.
+
+    Args:
+        function: Module-level function (it must be picklable).
+        tasks (list): One argument per call, sent to the workers in chunks.
+        shared (dict): name -> NumPy array, published once in shared memory.
+        constants (dict): name -> small picklable value, sent once to every worker.
+        processes (int): Pool size, all CPUs by default.
+        chunks_per_process (int): Chunks per worker; more chunks balance uneven tasks
+            better, fewer chunks cost less IPC.
+        min_tasks (int): Below this many tasks, run in this process.
+
+    Returns:
+        list: The results, in the order of the tasks.
+    """
+    tasks = list(tasks)
+    shared = shared or {}
+    constants = constants or {}
+    processes = processes or os.cpu_count() or 1
+
+    if processes == 1 or len(tasks) < min_tasks:
+        return [function(task, **shared, **constants) for task in tasks]
+
+    chunk_size = math.ceil(len(tasks) / (processes * chunks_per_process))
+    published = {name: SharedArray(array) for name, array in shared.items()}
+    try:
+        specs = {name: array.spec for name, array in published.items()}
+        with multiprocessing.Pool(processes, _initialize_worker, (specs, constants)) as pool:
+            chunk_results = pool.starmap(
+                _run_chunk, [(function, chunk) for chunk in chunked(tasks, chunk_size)], chunksize=1
+            )
+    finally:
+        for array in published.values():
+            array.close()
+    return [result for chunk in chunk_results for result in chunk]
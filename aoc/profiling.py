@@ -0,0 +1,155 @@
+"""
+Opt-in counters for the hot functions of the solvers.
+
+Decorate the functions doing the bulk of the work with `@hot`:
+
+    @hot
+    def simulate_with_obstruction(obstruction, grid, start_pos, start_dir):
+        ...
+
+Profiling is off by default and `hot` then returns the function unchanged, so it costs
+nothing. Enable it with the environment variable `AOC_PROFILE=1` (or
+`AOC_PROFILE=some/file.folded`), or with `python run.py --profile`. For every hot
+function the run records:
+- the number of calls
+- the cumulative wall time and thread CPU time (a wall time much larger than the CPU
+  time means the calls were waiting, e.g. threads queueing for the GIL)
+- the net number of memory blocks allocated by the calls (`sys.getallocatedblocks`)
+
+At exit a table is printed to stderr and the time spent in every stack of hot functions
+is written in the collapsed-stack format of flamegraph.pl / speedscope / inferno, one
+line per stack, e.g. `MainThread;find_best_sequence;pseudorandom_sequence 812345`
+(self time in microseconds). Worker processes that exit normally write their own
+`<file>.<pid>.folded`; workers killed by `Pool.terminate()` write nothing.
+"""
+
+import functools
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+
+DEFAULT_OUTPUT = "profile.folded"
+
+ENABLED = os.environ.get("AOC_PROFILE", "0") not in ("", "0")
+
+_lock = threading.Lock()
+_local = threading.local()
+_main_pid = os.getpid()
+
+calls = Counter()
+wall_time = defaultdict(float)
+cpu_time = defaultdict(float)
+allocated_blocks = Counter()
+stack_self_time = defaultdict(float)  # (thread, outer function, ..., function) -> seconds
+
+
+def enable(output=None):
+    """Turn profiling on for the functions decorated from now on (and for child processes)."""
+    global ENABLED
+    ENABLED = True
+    os.environ["AOC_PROFILE"] = output or DEFAULT_OUTPUT
+    _register_report()
+
+
+def output_path():
+    path = os.environ.get("AOC_PROFILE", "1")
+    path = DEFAULT_OUTPUT if path == "1" else path
+    if os.getpid() != _main_pid:
+        path = f"{os.path.splitext(path)[0]}.{os.getpid()}.folded"
+    return path
+
+
+def hot(function):
+    """Count the calls, time and allocations of `function` when profiling is enabled."""
+    if not ENABLED:
+        return function
+
+    name = function.__qualname__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = [threading.current_thread().name]
+            _local.child_time = [0.0]
+        stack.append(name)
+        _local.child_time.append(0.0)
+
+        start = time.perf_counter()
+        cpu_before = time.thread_time()
+        blocks_before = sys.getallocatedblocks()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            blocks = sys.getallocatedblocks() - blocks_before
+            cpu = time.thread_time() - cpu_before
+            elapsed = time.perf_counter() - start
+            children = _local.child_time.pop()
+            _local.child_time[-1] += elapsed
+            with _lock:
+                key = tuple(stack)
+                calls[name] += 1
+                stack_self_time[key] += elapsed - children
+                if name not in stack[1:-1]:  # count recursive calls once in the cumulative time
+                    wall_time[name] += elapsed
+                    cpu_time[name] += cpu
+                    allocated_blocks[name] += blocks
+            stack.pop()
+
+    return wrapper
+
+
+def write_folded(file_path):
+    with open(file_path, "w") as f:
+        for stack, seconds in sorted(stack_self_time.items()):
+            f.write(f"{';'.join(stack)} {max(round(seconds * 1e6), 0)}\n")
+
+
+def report():
+    if not calls:
+        return
+    file_path = output_path()
+    write_folded(file_path)
+
+    print(f"\nHot functions (pid {os.getpid()}), flamegraph stacks in {file_path}:", file=sys.stderr)
+    print(f"  {'function':<40} {'calls':>12} {'wall':>10} {'CPU':>10} {'blocks':>12}", file=sys.stderr)
+    for name in sorted(calls, key=wall_time.get, reverse=True):
+        print(
+            f"  {name:<40} {calls[name]:>12} {wall_time[name]:>9.3f}s {cpu_time[name]:>9.3f}s "
+            f"{allocated_blocks[name]:>12}",
+            file=sys.stderr,
+        )
+
+
+def _reset_in_child(_):
+    """Forked workers start with empty counters instead of a copy of the parent's."""
+    for stats in (calls, wall_time, cpu_time, allocated_blocks, stack_self_time):
+        stats.clear()
+    _local.__dict__.clear()
+    _register_report()
+
+
+class _ForkHook:
+    """multiprocessing only keeps weak references to its after-fork callbacks' objects."""
+
+
+_fork_hook = _ForkHook()
+_registered_pids = set()
+
+
+def _register_report():
+    """Report at exit, in this process and in worker processes that exit normally."""
+    if os.getpid() in _registered_pids:
+        return
+    _registered_pids.add(os.getpid())
+    # multiprocessing runs its finalizers at the exit of the main process and of its
+    # workers, which never run atexit handlers
+    from multiprocessing import util
+    util.Finalize(None, report, exitpriority=0)
+    util.register_after_fork(_fork_hook, _reset_in_child)
+
+
+if ENABLED:
+    _register_report()
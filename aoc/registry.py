@@ -0,0 +1,78 @@
+"""
+Registry of the solvers, used by `run.py`.
+
+A solver is a function taking the path of a puzzle input and returning the answer.
+Each day registers its solvers with the `register` decorator:
+
+    @register(day=9, part=1)
+    def solve(input_path: str) -> int:
+        ...
+
+Solver files can still be run as scripts; they get their input path from
+`input_path(day)`, which honours a path given on the command line and otherwise
+points at the day's input next to the script, whatever the working directory.
+"""
+
+import glob
+import importlib
+import os
+import sys
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+Answer = Union[int, str]
+Solver = Callable[[str], Answer]
+
+SOLVERS: Dict[Tuple[int, int], Solver] = {}
+
+
+def register(day: int, part: int) -> Callable[[Solver], Solver]:
+    """Decorator registering `solve(input_path) -> answer` as the solver of a day and part."""
+    def decorator(solver: Solver) -> Solver:
+        SOLVERS[(day, part)] = solver
+        return solver
+    return decorator
+
+
+def default_input_path(day: int) -> str:
+    """The puzzle input of a day, e.g. <repository>/day_09/day_09_input.txt."""
+    return os.path.join(ROOT, f"day_{day:02d}", f"day_{day:02d}_input.txt")
+
+
+def input_path(day: int, argv: Optional[List[str]] = None) -> str:
+    """
+    Input path for a solver run as a script: the first command line argument that is
+    not a flag (e.g. `python day_09/day_09_part_2.py big_input.txt`), or the day's
+    default input.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    paths = [arg for arg in argv if not arg.startswith("-")]
+    return paths[0] if paths else default_input_path(day)
+
+
+def solver_files() -> List[str]:
+    """All solver files that register a solver."""
+    files = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "day_*", "day_*.py"))):
+        with open(path, "r", encoding="utf-8") as f:
+            if "@register(" in f.read():
+                files.append(path)
+    return files
+
+
+def load_solvers(days: Optional[List[int]] = None) -> Dict[Tuple[int, int], Solver]:
+    """
+    Import the solver files (of the given days) so that they register themselves.
+
+    Returns:
+        dict: (day, part) -> solver, sorted by day and part.
+    """
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    for path in solver_files():
+        folder = os.path.basename(os.path.dirname(path))
+        if days and int(folder[4:]) not in days:
+            continue
+        importlib.import_module(f"{folder}.{os.path.splitext(os.path.basename(path))[0]}")
+    return dict(sorted(SOLVERS.items()))
@@ -0,0 +1,83 @@
+"""
+Count the placements of small 2D patterns (stencils) in uint8 grids, with NumPy.
+
+A stencil is written like the puzzle diagrams, with a wildcard for the cells that
+do not matter:
+
+    X_MAS = ("M.S",
+             ".A.",
+             "M.S")
+
+    count_stencil(grid, X_MAS)  # in all its rotations and reflections
+
+The grid is viewed as every window of the stencil's size at once
+(`sliding_window_view`, nothing is copied), and the placements are the windows whose
+cells match every non-wildcard cell of the stencil: one comparison of a strided view
+per such cell, whatever the size of the grid. A new shape is just a new stencil.
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+WILDCARD = "."
+
+
+def parse_stencil(lines, wildcard=WILDCARD):
+    """
+    Returns:
+        tuple: (values, mask), two arrays of the stencil's shape: the uint8 value of
+        every cell, and whether it must match (False for the wildcards)
+    """
+    if len({len(line) for line in lines}) != 1:
+        raise ValueError("All lines of a stencil must have the same length.")
+    values = np.array([[ord(char) for char in line] for line in lines], dtype=np.uint8)
+    return values, values != ord(wildcard)
+
+
+def orientations(values, mask):
+    """
+    The distinct rotations and reflections of a stencil (up to 8, fewer for symmetric
+    stencils), as (values, mask) pairs.
+    """
+    distinct = {}
+    for flipped_values, flipped_mask in ((values, mask), (np.fliplr(values), np.fliplr(mask))):
+        for turns in range(4):
+            rotated_values, rotated_mask = np.rot90(flipped_values, turns), np.rot90(flipped_mask, turns)
+            # the wildcards' values do not matter: two orientations are the same if they match the same cells
+            key = (rotated_values.shape, rotated_mask.tobytes(), np.where(rotated_mask, rotated_values, 0).tobytes())
+            distinct.setdefault(key, (rotated_values, rotated_mask))
+    return list(distinct.values())
+
+
+def match_stencil(grid, values, mask):
+    """
+    Returns:
+        np.ndarray: bool array, True at the top left corner of every placement of the
+        stencil in the grid (of shape grid.shape - stencil.shape + 1)
+    """
+    height, width = values.shape
+    if grid.shape[0] < height or grid.shape[1] < width:
+        return np.zeros((0, 0), dtype=bool)
+    windows = sliding_window_view(grid, values.shape)  # windows[y, x] is grid[y:y + height, x:x + width]
+    matches = np.ones(windows.shape[:2], dtype=bool)
+    for dy, dx in zip(*np.nonzero(mask)):
+        matches &= windows[:, :, dy, dx] == values[dy, dx]
+    return matches
+
+
+def count_stencil(grid, lines, wildcard=WILDCARD, all_orientations=True):
+    """
+    Count the placements of a stencil in the grid.
+
+    Args:
+        grid (np.ndarray): 2D uint8 grid (see aoc/grid.py)
+        lines (sequence of str): the stencil, one string per row
+        wildcard (str): character of the cells that match anything
+        all_orientations (bool): also count its distinct rotations and reflections
+
+    Returns:
+        int: the number of (placement, orientation) pairs that match
+    """
+    values, mask = parse_stencil(lines, wildcard)
+    stencils = orientations(values, mask) if all_orientations else [(values, mask)]
+    return sum(int(np.count_nonzero(match_stencil(grid, *stencil))) for stencil in stencils)
@@ -0,0 +1,117 @@
+"""
+Solve many puzzle inputs at once, e.g. the inputs of every player.
+
+Every input file under the given folder is matched to its day by a `day_XX` in its
+folder or file name (`inputs/day_09/alice.txt`, `inputs/day_09_bob.txt`, ...), and
+every registered part of that day (see aoc/registry.py) is a job.
+
+The jobs run in a process pool. Each worker imports all the solvers once when it
+starts, so the imports, and whatever the solvers cache in memory or on disk (see
+aoc/cache.py), are reused from one job to the next. The workers pull the next job
+as soon as they are done with the previous one, biggest inputs first, so a slow input
+does not hold up the others.
+
+The results are streamed as JSON lines, as soon as each job is done:
+
+    {"day": 9, "part": 2, "input": "inputs/day_09/alice.txt", "answer": 6427437134372, "seconds": 0.41, "worker": 1234}
+
+Usage:
+    python batch.py inputs/
+    python batch.py inputs/ --days 9 10 --processes 4 --output results.jsonl
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from aoc.registry import load_solvers
+from run import run_warm
+
+DAY = re.compile(r"day_?(\d{1,2})(?!\d)")
+
+_solvers = {}  # (day, part) -> solver, in each worker
+
+
+def find_inputs(folder, days=None):
+    """
+    Returns:
+        list: (day, path) of every input file under the folder, biggest first.
+    """
+    inputs = []
+    for directory, folders, files in os.walk(folder):
+        folders[:] = [name for name in folders if not name.startswith(".")]  # e.g. .aoc_cache
+        for name in files:
+            path = os.path.join(directory, name)
+            # the file name wins over the folder name, e.g. day_09/day_10_input.txt is day 10
+            match = DAY.search(name) or DAY.search(os.path.relpath(directory, folder))
+            if not match or name.startswith("."):
+                continue
+            day = int(match.group(1))
+            if days and day not in days:
+                continue
+            inputs.append((day, path))
+    return sorted(inputs, key=lambda item: os.path.getsize(item[1]), reverse=True)
+
+
+def initialize_worker(days):
+    _solvers.update(load_solvers(days))
+
+
+def solve_job(job):
+    day, part, path = job
+    result = {"day": day, "part": part, "input": path, "worker": os.getpid()}
+    try:
+        answer, wall_time, _ = run_warm(_solvers[(day, part)], path)
+        result.update(answer=answer, seconds=round(wall_time, 6))
+    except Exception as e:
+        result.update(error=f"{type(e).__name__}: {e}")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solve every input file under a folder.")
+    parser.add_argument("folder", help="folder of input files, with day_XX in their folder or file names")
+    parser.add_argument("--days", type=int, nargs="+", help="only solve these days")
+    parser.add_argument("--processes", type=int, help="worker processes (default: all CPUs)")
+    parser.add_argument("--output", help="write the JSON lines to this file instead of stdout")
+    args = parser.parse_args()
+
+    inputs = find_inputs(args.folder, args.days)
+    days = sorted({day for day, _ in inputs})
+    parts = sorted(load_solvers(days))
+    jobs = [(day, part, path) for day, path in inputs for solved_day, part in parts if solved_day == day]
+    if not jobs:
+        raise SystemExit(f"No inputs of a solved day found under {args.folder}")
+
+    output = open(args.output, "w") if args.output else sys.stdout
+    failed = 0
+    start_time = time.perf_counter()
+    try:
+        # Not a multiprocessing.Pool: its daemonic workers could not run the solvers that
+        # start a process pool of their own (day 6 part 2, day 7 part 2)
+        with ProcessPoolExecutor(args.processes, initializer=initialize_worker, initargs=(days,)) as executor:
+            # One job per task: a free worker takes the next job instead of a fixed share of them
+            futures = [executor.submit(solve_job, job) for job in jobs]
+            for future in as_completed(futures):
+                result = future.result()
+                failed += "error" in result
+                output.write(json.dumps(result) + "\n")
+                output.flush()
+    finally:
+        if args.output:
+            output.close()
+    elapsed = time.perf_counter() - start_time
+
+    print(
+        f"{len(inputs)} inputs, {len(jobs)} jobs ({failed} failed) in {elapsed:.2f}s: "
+        f"{len(inputs) / elapsed:.2f} inputs/s, {len(jobs) / elapsed:.2f} jobs/s",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,456 @@
+"""
+Benchmark suite for all the solvers in this repository.
+
+Every `day_XX/day_XX_*.py` file is treated as a solver. Variants of the same day
+and part (for example all the `day_06_part_2*` implementations) are grouped
+together, run repeatedly against the same input and compared with the baseline
+of their group, the solver registered for the day and part (see `baseline_key`). Variants
+without a part in their name (`day_01_optimised.py`) are grouped with part 1, and are
+still compared with the original part 1 solver.
+
+For each variant we report:
+- wall time (mean and best over all runs)
+- CPU time (user + system, including child processes of pools)
+- peak RSS
+- speedup of the mean wall time relative to the baseline
+
+With `--sizes` the solvers are run against generated inputs of growing size instead
+(see `generators/`), and the growth of the runtime is summarised as the exponent k
+of a fitted `time ~ bytes^k`: about 1 for linear solvers, 2 for quadratic ones.
+
+With `--memory` the solvers run once per input size with `AOC_MEMORY` set (see
+aoc/memory.py), and the peak memory of each of their stages (parse, build, solve, ...)
+is reported with its growth `peak ~ bytes^k`. Stages growing faster than linearly
+(k > 1.2) are flagged, as candidates for a streaming rewrite.
+
+With `--import-time` each solver is run under `python -X importtime` instead, and the
+time spent importing modules (beyond what every interpreter imports at startup) is
+reported with the heaviest imports, to keep the cold start of every day low.
+
+Usage:
+    python benchmark.py                          # all days
+    python benchmark.py --days 6 --repeat 5      # only the day 6 variants
+    python benchmark.py --match threads          # only files containing "threads"
+    python benchmark.py --days 9 --sizes 1000 10000 100000 --plot scaling.png
+    python benchmark.py --days 9 10 16 --memory --sizes 1000 10000 100000
+    python benchmark.py --import-time
+"""
+
+import argparse
+import glob
+import math
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Solvers that are not meaningful to benchmark (day 14 part 2 renders 10000 images)
+EXCLUDED_BY_DEFAULT = {"day_14_part_2"}
+
+# e.g. day_06_part_2_threads.py -> day 6, part 2. Files without a part (or with a
+# typo such as day_18_part_18_RAM_Run.py) count as part 1.
+SOLVER_NAME = re.compile(r"day_(\d+)_(?:part_([12])(?!\d))?")
+
+REGISTERED = re.compile(r"@register\(day=(\d+), part=(\d+)\)")
+
+# Stages whose peak memory grows faster than bytes^SUPERLINEAR are flagged
+SUPERLINEAR = 1.2
+
+
+def discover_solvers(days=None, match=None, include_excluded=False):
+    """
+    Find all solver files and group them by (day, part).
+
+    Returns:
+        dict: (day, part) -> list of solver paths, baseline first.
+    """
+    groups = {}
+    for path in sorted(glob.glob(os.path.join(ROOT, "day_*", "day_*.py"))):
+        name = os.path.splitext(os.path.basename(path))[0]
+        parsed = SOLVER_NAME.match(name)
+        if not parsed:
+            continue
+        if name in EXCLUDED_BY_DEFAULT and not include_excluded:
+            continue
+        if match and match not in name:
+            continue
+
+        day = int(parsed.group(1))
+        part = int(parsed.group(2) or 1)
+        if days and day not in days:
+            continue
+        groups.setdefault((day, part), []).append(path)
+
+    for (day, part), variants in groups.items():
+        variants.sort(key=lambda p: baseline_key(p, day, part))
+    return groups
+
+
+def baseline_key(path, day, part):
+    """
+    Sort key of the variants of a group, baseline first. The baseline is the solver
+    registered for the day and part (the one run.py runs, e.g.
+    day_04_part_1_ceres_search.py rather than day_04_part_1_vectorized.py), then the
+    variants with the part in their name, then the others, shortest names first.
+    """
+    name = os.path.basename(path)
+    with open(path, "r", encoding="utf-8") as f:
+        if (str(day), str(part)) in REGISTERED.findall(f.read()):
+            return 0, len(name), path
+    return (1 if SOLVER_NAME.match(name).group(2) else 2), len(name), path
+
+
+def run_once(path, input_file, timeout, extra_env=None):
+    """
+    Run a solver in a fresh interpreter and measure it. The solvers read the input file
+    given on their command line, or their day's input when `input_file` is None.
+
+    Returns:
+        dict: wall time, CPU time, peak RSS in MB and whether the run succeeded.
+    """
+    env = dict(os.environ, MPLBACKEND="Agg")  # never open a plot window while measuring
+    env.update(extra_env or {})
+
+    with tempfile.TemporaryFile() as stderr:
+        start_time = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, path] + ([input_file] if input_file else []), cwd=ROOT, env=env,
+            stdout=subprocess.DEVNULL, stderr=stderr,
+        )
+        timer = threading.Timer(timeout, process.kill)
+        timer.start()
+        try:
+            # wait4 gives us the resource usage of exactly this child (and its pool workers)
+            _, status, usage = os.wait4(process.pid, 0)
+        finally:
+            timer.cancel()
+        wall_time = time.perf_counter() - start_time
+        process.returncode = os.waitstatus_to_exitcode(status)
+
+        error = None
+        if process.returncode != 0:
+            stderr.seek(0)
+            lines = stderr.read().decode(errors="replace").strip().splitlines()
+            error = lines[-1] if lines else f"killed after {timeout}s"
+
+    return {
+        "wall": wall_time,
+        "cpu": usage.ru_utime + usage.ru_stime,
+        "rss_mb": usage.ru_maxrss / 1024,  # ru_maxrss is in KB on Linux
+        "error": error,
+    }
+
+
+def benchmark_variant(path, repeat, timeout, input_file=None):
+    """Run one solver `repeat` times and aggregate the measurements."""
+    runs = []
+    for _ in range(repeat):
+        run = run_once(path, input_file, timeout)
+        if run["error"]:
+            return {"error": run["error"]}
+        runs.append(run)
+
+    walls = [run["wall"] for run in runs]
+    return {
+        "wall_mean": statistics.mean(walls),
+        "wall_best": min(walls),
+        "cpu_mean": statistics.mean(run["cpu"] for run in runs),
+        "rss_mb": max(run["rss_mb"] for run in runs),
+        "error": None,
+    }
+
+
+def measure_memory(path, timeout, input_file=None):
+    """
+    Run a solver once with the stage memory tracing of aoc.memory enabled.
+
+    Returns:
+        dict: peak bytes of every stage, peak RSS in MB and whether the run succeeded.
+    """
+    from aoc.memory import read_stages
+
+    with tempfile.TemporaryDirectory() as scratch:
+        stages_file = os.path.join(scratch, "stages.jsonl")
+        run = run_once(path, input_file, timeout, extra_env={"AOC_MEMORY": stages_file})
+        stages = read_stages(stages_file) if os.path.exists(stages_file) else {}
+    return {"stages": stages, "rss_mb": run["rss_mb"], "error": run["error"]}
+
+
+def benchmark_memory(day, variants, sizes, timeout, seed):
+    """
+    Measure the stages of every variant of a day, against generated inputs of the given
+    sizes, or against the day's input without sizes.
+
+    Returns:
+        dict: solver path -> list of (input bytes, result) tuples.
+    """
+    from aoc.registry import default_input_path
+    from generators import write_input
+
+    results = {path: [] for path in variants}
+    with tempfile.TemporaryDirectory() as scratch:
+        for size in sizes or [None]:
+            if size is None:
+                input_file = default_input_path(day)
+                input_bytes = os.path.getsize(input_file)
+            else:
+                input_file = os.path.join(scratch, f"day_{day:02d}_input_{size}.txt")
+                input_bytes = write_input(day, size, input_file, seed=seed)
+            for path in variants:
+                if results[path] and results[path][-1][1]["error"]:
+                    continue  # already failed or timed out on a smaller input
+                print(f"Measuring memory of {os.path.basename(path)} with {input_bytes} bytes ...", file=sys.stderr)
+                results[path].append((input_bytes, measure_memory(path, timeout, input_file)))
+    return results
+
+
+def print_memory_report(memory):
+    for day, results in memory.items():
+        print(f"Day {day:02d}")
+        for path, runs in results.items():
+            print(f"  {os.path.basename(path)}")
+            for size, result in runs:
+                if result["error"]:
+                    print(f"    {size:>12} bytes  FAILED: {result['error']}")
+                else:
+                    print(f"    {size:>12} bytes  peak RSS {result['rss_mb']:>8.1f}MB")
+
+            stages = list(dict.fromkeys(stage for _, result in runs if not result["error"] for stage in result["stages"]))
+            if not stages:
+                print("    no stages marked with aoc.memory.stage")
+            for stage in stages:
+                peaks = [(size, result["stages"][stage]) for size, result in runs
+                         if not result["error"] and result["stages"].get(stage, 0) > 0]
+                exponent = fit_exponent(peaks)
+                growth = f"peak ~ bytes^{exponent:.2f}" if exponent is not None else ""
+                flag = "  <- grows faster than linear" if exponent is not None and exponent > SUPERLINEAR else ""
+                largest = max(peak for _, peak in peaks) / 1024 ** 2 if peaks else 0
+                print(f"    stage {stage:<12} up to {largest:>9.2f}MB  {growth}{flag}")
+
+
+def imported_modules(stderr):
+    """
+    Parse the output of `python -X importtime`.
+
+    Returns:
+        dict: top-level module -> cumulative import time in seconds
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name.startswith("  "):
+            continue  # imported by another module, already part of its cumulative time
+        modules[name.strip()] = modules.get(name.strip(), 0) + int(cumulative) / 1e6
+    return modules
+
+
+def startup_modules():
+    """Modules imported by every interpreter at startup, before any solver code runs."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "pass"], capture_output=True, text=True)
+    return set(imported_modules(result.stderr))
+
+
+def measure_import_time(path, timeout, ignored_modules):
+    """
+    Run a solver under `python -X importtime`.
+
+    Returns:
+        dict: total import time of the solver's own imports and the list of
+        (module, seconds) tuples, heaviest first.
+    """
+    env = dict(os.environ, MPLBACKEND="Agg")
+    try:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", path], cwd=ROOT,
+            env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return {"error": f"killed after {timeout}s"}
+
+    modules = {
+        name: seconds for name, seconds in imported_modules(result.stderr).items()
+        if name not in ignored_modules
+    }
+    return {
+        "total": sum(modules.values()),
+        "modules": sorted(modules.items(), key=lambda item: item[1], reverse=True),
+        "error": None if result.returncode == 0 else result.stderr.strip().splitlines()[-1],
+    }
+
+
+def print_import_report(results):
+    print(f"{'solver':<45} {'imports':>9}  heaviest imports")
+    for path, result in results:
+        name = os.path.basename(path)
+        if result.get("total") is None:
+            print(f"  {name:<43} FAILED: {result['error']}")
+            continue
+        heaviest = ", ".join(f"{module} {seconds * 1000:.0f}ms" for module, seconds in result["modules"][:3])
+        print(f"  {name:<43} {result['total'] * 1000:>7.0f}ms  {heaviest}")
+
+
+def print_report(results):
+    header = f"{'variant':<45} {'wall mean':>10} {'wall best':>10} {'cpu':>9} {'peak rss':>10} {'speedup':>8}"
+    print(header)
+    print("-" * len(header))
+    for (day, part), variants in results.items():
+        print(f"Day {day:02d}, part {part}")
+        baseline = variants[0][1]
+        for path, result in variants:
+            name = os.path.basename(path)
+            if result["error"]:
+                print(f"  {name:<43} FAILED: {result['error']}")
+                continue
+            if baseline["error"]:
+                speedup = "n/a"
+            else:
+                speedup = f"{baseline['wall_mean'] / result['wall_mean']:.2f}x"
+            print(
+                f"  {name:<43} {result['wall_mean']:>9.3f}s {result['wall_best']:>9.3f}s "
+                f"{result['cpu_mean']:>8.3f}s {result['rss_mb']:>8.1f}MB {speedup:>8}"
+            )
+
+
+def benchmark_scaling(day, variants, sizes, repeat, timeout, seed):
+    """
+    Run every variant of a day against generated inputs of the given sizes.
+
+    The inputs are written to a scratch folder and passed to the solvers on their
+    command line.
+
+    Returns:
+        dict: solver path -> list of (input bytes, result) tuples.
+    """
+    from generators import write_input
+
+    results = {path: [] for path in variants}
+    with tempfile.TemporaryDirectory() as scratch:
+        for size in sizes:
+            input_file = os.path.join(scratch, f"day_{day:02d}_input_{size}.txt")
+            input_bytes = write_input(day, size, input_file, seed=seed)
+            for path in variants:
+                if results[path] and results[path][-1][1]["error"]:
+                    continue  # already failed or timed out on a smaller input
+                print(f"Benchmarking {os.path.basename(path)} with size {size} ...", file=sys.stderr)
+                results[path].append((input_bytes, benchmark_variant(path, repeat, timeout, input_file)))
+    return results
+
+
+def fit_exponent(points):
+    """Least-squares slope of log(time) against log(bytes), i.e. k in time ~ bytes^k."""
+    xs = [math.log(x) for x, _ in points]
+    ys = [math.log(y) for _, y in points]
+    if len(points) < 2 or max(xs) == min(xs):
+        return None
+    x_mean, y_mean = statistics.mean(xs), statistics.mean(ys)
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / sum((x - x_mean) ** 2 for x in xs)
+
+
+def print_scaling_report(scaling):
+    for day, results in scaling.items():
+        print(f"Day {day:02d}")
+        for path, runs in results.items():
+            name = os.path.basename(path)
+            timings = [(size, result["wall_mean"]) for size, result in runs if not result["error"]]
+            exponent = fit_exponent(timings)
+            exponent = f"time ~ bytes^{exponent:.2f}" if exponent is not None else "not enough data"
+            print(f"  {name:<43} {exponent}")
+            for size, result in runs:
+                if result["error"]:
+                    print(f"    {size:>12} bytes  FAILED: {result['error']}")
+                else:
+                    print(f"    {size:>12} bytes  {result['wall_mean']:>9.3f}s {result['rss_mb']:>8.1f}MB")
+
+
+def plot_scaling(scaling, file_path):
+    """Plot runtime against input size on log-log axes, one line per solver."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(10, 7))
+    for results in scaling.values():
+        for path, runs in results.items():
+            timings = [(size, result["wall_mean"]) for size, result in runs if not result["error"]]
+            if timings:
+                plt.loglog(*zip(*timings), marker="o", label=os.path.basename(path))
+    plt.xlabel("input size (bytes)")
+    plt.ylabel("wall time (s)")
+    plt.legend(fontsize="small")
+    plt.grid(True, which="both", alpha=0.3)
+    plt.savefig(file_path, bbox_inches="tight")
+    plt.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark all solver variants side by side.")
+    parser.add_argument("--days", type=int, nargs="+", help="only benchmark these days")
+    parser.add_argument("--match", help="only benchmark solvers whose file name contains this")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per variant (default: 3)")
+    parser.add_argument("--timeout", type=float, default=600, help="seconds before a run is killed")
+    parser.add_argument("--all", action="store_true", help="also run solvers excluded by default")
+    parser.add_argument("--sizes", type=int, nargs="+", help="benchmark against generated inputs of these sizes")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the generated inputs")
+    parser.add_argument("--plot", help="with --sizes: save a runtime vs input size plot to this file")
+    parser.add_argument("--import-time", action="store_true", help="report the import time of each solver")
+    parser.add_argument("--memory", action="store_true", help="report the peak memory of each solver stage")
+    args = parser.parse_args()
+
+    groups = discover_solvers(args.days, args.match, args.all)
+
+    if args.memory:
+        from generators import available_days
+
+        memory = {}
+        for (day, part), variants in groups.items():
+            if args.sizes and day not in available_days():
+                continue
+            results = benchmark_memory(day, variants, args.sizes, args.timeout, args.seed)
+            memory.setdefault(day, {}).update(results)
+        print_memory_report(memory)
+        return
+
+    if args.import_time:
+        ignored_modules = startup_modules()
+        results = []
+        for variants in groups.values():
+            for path in variants:
+                print(f"Measuring imports of {os.path.basename(path)} ...", file=sys.stderr)
+                results.append((path, measure_import_time(path, args.timeout, ignored_modules)))
+        print_import_report(results)
+        return
+
+    if args.sizes:
+        from generators import available_days
+
+        scaling = {}
+        for (day, part), variants in groups.items():
+            if day not in available_days():
+                continue
+            results = benchmark_scaling(day, variants, args.sizes, args.repeat, args.timeout, args.seed)
+            scaling.setdefault(day, {}).update(results)
+        print_scaling_report(scaling)
+        if args.plot:
+            plot_scaling(scaling, args.plot)
+        return
+
+    results = {}
+    for key, variants in groups.items():
+        results[key] = []
+        for path in variants:
+            print(f"Benchmarking {os.path.basename(path)} ...", file=sys.stderr)
+            results[key].append((path, benchmark_variant(path, args.repeat, args.timeout)))
+
+    print_report(results)
+
+
+if __name__ == "__main__":
+    main()
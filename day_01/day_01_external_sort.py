@@ -0,0 +1,152 @@
+"""
+Both parts of day 1 for location lists larger than the memory.
+
+The file is read in chunks of a bounded number of bytes. Each chunk's two columns are sorted and written to
+disk as runs of raw int32 (4 bytes per ID, instead of ~36 bytes in a Python list).
+The runs of each column are then k-way merged with `heapq.merge`, reading them
+sequentially in blocks through memory maps:
+- total distance: the two merged columns side by side
+- similarity score: a merge join of the two merged columns, counting each ID on both
+  sides
+
+Memory stays bounded by one chunk while writing the runs, and by one block per run
+while merging.
+
+Usage:
+    python day_01/day_01_external_sort.py big_input.txt --run-megabytes 64 --temp-dir /scratch
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import heapq
+import itertools
+import tempfile
+import time
+
+import numpy as np
+
+from aoc.memory import stage
+from aoc.registry import input_path
+
+RUN_BYTES = 16 << 20  # input bytes sorted in memory at once, about 1.2 million lines
+BLOCK_SIZE = 1 << 12  # IDs read from a run at once while merging (16KB of int32)
+INT32_MAX = np.iinfo(np.int32).max
+
+
+def parse_chunk(chunk):
+    """The two columns of complete lines of the input, as int64 arrays."""
+    numbers = np.fromstring(chunk.decode(), dtype=np.int64, sep=" ")  # any whitespace separates
+    if len(numbers) % 2:
+        raise ValueError("Every line must hold two location IDs.")
+    pairs = numbers.reshape(-1, 2)
+    return pairs[:, 0], pairs[:, 1]
+
+
+def read_chunks(file_path, run_bytes):
+    """Yield the two columns of about every `run_bytes` bytes of the input."""
+    rest = b""
+    with open(file_path, "rb") as file:
+        while block := file.read(run_bytes):
+            block = rest + block
+            end = block.rfind(b"\n") + 1  # the last line may continue in the next block
+            block, rest = block[:end], block[end:]
+            if block:
+                yield parse_chunk(block)
+    if rest.strip():
+        yield parse_chunk(rest)
+
+
+def write_run(ids, file_path):
+    """Sort one chunk of a column and write it as raw int32."""
+    if len(ids) and (ids.min() < 0 or ids.max() > INT32_MAX):
+        raise ValueError("Location IDs must fit in an int32.")
+    np.sort(ids).astype(np.int32).tofile(file_path)
+
+
+@stage("build")
+def write_sorted_runs(file_path, folder, run_bytes=RUN_BYTES):
+    """
+    Split both columns into sorted runs on disk.
+
+    Returns:
+        tuple: (paths of the runs of the first column, paths of the runs of the second)
+    """
+    first_runs, second_runs = [], []
+    for i, (first, second) in enumerate(read_chunks(file_path, run_bytes)):
+        first_runs.append(os.path.join(folder, f"first_{i:05d}.int32"))
+        second_runs.append(os.path.join(folder, f"second_{i:05d}.int32"))
+        write_run(first, first_runs[-1])
+        write_run(second, second_runs[-1])
+    return first_runs, second_runs
+
+
+def read_run(file_path):
+    """Yield the IDs of a run, reading it sequentially one block at a time."""
+    if os.path.getsize(file_path) == 0:
+        return
+    run = np.memmap(file_path, dtype=np.int32, mode="r")
+    for start in range(0, len(run), BLOCK_SIZE):
+        yield from run[start:start + BLOCK_SIZE].tolist()
+
+
+def merged(runs):
+    """All the IDs of a column in sorted order, k-way merged from its runs."""
+    return heapq.merge(*(read_run(run) for run in runs))
+
+
+def counted(ids):
+    """(id, number of times) for a sorted stream of IDs."""
+    for number, group in itertools.groupby(ids):
+        yield number, sum(1 for _ in group)
+
+
+@stage("solve")
+def total_distance(first_runs, second_runs):
+    distance = 0
+    for a, b in zip(merged(first_runs), merged(second_runs)):
+        distance += abs(a - b)
+    return distance
+
+
+@stage("solve")
+def similarity_score(first_runs, second_runs):
+    """Merge join of the two sorted columns: every ID times its counts on both sides."""
+    score = 0
+    first, second = counted(merged(first_runs)), counted(merged(second_runs))
+    second_id, second_count = next(second, (None, 0))
+    for first_id, first_count in first:
+        while second_id is not None and second_id < first_id:
+            second_id, second_count = next(second, (None, 0))
+        if second_id == first_id:
+            score += first_id * first_count * second_count
+    return score
+
+
+def solve(file_path, run_bytes=RUN_BYTES, temp_dir=None):
+    """
+    Returns:
+        tuple: (total distance, similarity score)
+    """
+    with tempfile.TemporaryDirectory(dir=temp_dir) as folder:
+        first_runs, second_runs = write_sorted_runs(file_path, folder, run_bytes)
+        return total_distance(first_runs, second_runs), similarity_score(first_runs, second_runs)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Day 1 with an external merge sort.")
+    parser.add_argument("input", nargs="?", default=input_path(1, []), help="input file")
+    parser.add_argument("--run-megabytes", type=float, default=RUN_BYTES / (1 << 20),
+                        help="input megabytes sorted in memory at once")
+    parser.add_argument("--temp-dir", help="folder for the sorted runs (default: the system's)")
+    args = parser.parse_args()
+
+    start_time = time.time()
+    distance, similarity = solve(args.input, int(args.run_megabytes * (1 << 20)), args.temp_dir)
+
+    print("Absolute Differences:", distance)
+    print("Similarity score:", similarity)
+    print(f"Execution Time: {time.time() - start_time:.4f} seconds")
@@ -0,0 +1,175 @@
+"""
+Both answers of day 1, kept up to date while location pairs are appended.
+
+Recomputing the answers sorts both lists again for every new pair. This engine updates
+them per appended pair instead.
+
+Similarity score: with a `Counter` of each list, a new pair (a, b) adds
+a * (count of a in the right list) + b * (count of b in the left list), in O(1).
+
+Total distance: with CL(x) and CR(x) the number of IDs <= x in the left and right
+lists, the sum of the distances between the sorted lists is
+
+    sum(|L_i - R_i|) = sum over x of |CL(x) - CR(x)|
+
+Appending (a, b) adds 1 to CL(x) for x >= a and to CR(x) for x >= b, so the difference
+D(x) = CL(x) - CR(x) changes by +1 on [a, b) (or -1 on [b, a)) and nowhere else, and
+every x in that range changes the distance by +1 or -1 depending on the sign of D(x).
+D is kept in blocks of about sqrt(ID range) values, each with a lazy offset and a
+histogram of its values, so that a range update and its change of the distance cost
+O(sqrt(ID range)) instead of a full recomputation. (A Fenwick tree alone cannot count
+the signs of D over a range under range updates, hence the blocks.)
+
+Usage:
+    python day_01/day_01_incremental.py                        # the answers for the input
+    python day_01/day_01_incremental.py pairs.txt --follow     # and then for every appended line
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import math
+import time
+from collections import Counter
+
+from aoc.registry import input_path
+
+MAX_ID = 99_999  # five-digit location IDs
+
+
+class IncrementalReconciliation:
+    """Total distance and similarity score of two location lists that only grow."""
+
+    def __init__(self, max_id=MAX_ID):
+        self.max_id = max_id
+        self.block_size = math.isqrt(max_id + 1) + 1
+        block_count = (max_id + 1 + self.block_size - 1) // self.block_size
+
+        self.left_counts = Counter()
+        self.right_counts = Counter()
+        self.pairs = 0
+        self.distance = 0
+        self.similarity = 0
+
+        # D(x) = stored[x] + offset[block of x]
+        self.stored = [0] * (max_id + 1)
+        self.offset = [0] * block_count
+        self.histogram = [Counter({0: self.block_length(block)}) for block in range(block_count)]
+        self.non_negative = [self.block_length(block) for block in range(block_count)]  # D(x) >= 0
+
+    def block_length(self, block):
+        return min(self.block_size, self.max_id + 1 - block * self.block_size)
+
+    def append(self, left, right):
+        """Add a location pair and update both answers."""
+        if not (0 <= left <= self.max_id and 0 <= right <= self.max_id):
+            raise ValueError(f"Location IDs must be between 0 and {self.max_id}.")
+
+        self.similarity += left * self.right_counts[left]
+        self.left_counts[left] += 1
+        self.similarity += right * self.left_counts[right]
+        self.right_counts[right] += 1
+        self.pairs += 1
+
+        if left < right:
+            self.distance += self.add_to_range(left, right, +1)
+        elif right < left:
+            self.distance += self.add_to_range(right, left, -1)
+
+    def add_to_range(self, start, end, delta):
+        """
+        Add delta (+1 or -1) to D(x) for start <= x < end.
+
+        Returns:
+            int: the change of the total distance, sum of |D(x) + delta| - |D(x)|
+        """
+        change = 0
+        x = start
+        while x < end:
+            block = x // self.block_size
+            block_start = block * self.block_size
+            block_end = block_start + self.block_length(block)
+            if x == block_start and end >= block_end:
+                change += self.add_to_block(block, delta)
+                x = block_end
+            else:
+                for position in range(x, min(end, block_end)):
+                    change += self.add_to_position(block, position, delta)
+                x = min(end, block_end)
+        return change
+
+    def add_to_block(self, block, delta):
+        """Add delta to the whole block through its offset, in O(1)."""
+        offset, histogram = self.offset[block], self.histogram[block]
+        zeros = histogram[-offset]  # positions where D(x) == 0
+        length = self.block_length(block)
+        if delta > 0:
+            # |D + 1| - |D| is +1 where D >= 0 and -1 elsewhere
+            change = 2 * self.non_negative[block] - length
+            self.non_negative[block] += histogram[-offset - 1]  # the -1s become 0s
+        else:
+            # |D - 1| - |D| is +1 where D <= 0 and -1 elsewhere
+            non_positive = length - self.non_negative[block] + zeros
+            change = 2 * non_positive - length
+            self.non_negative[block] -= zeros  # the 0s become -1s
+        self.offset[block] += delta
+        return change
+
+    def add_to_position(self, block, position, delta):
+        value = self.stored[position] + self.offset[block]
+        histogram = self.histogram[block]
+        histogram[self.stored[position]] -= 1
+        self.stored[position] += delta
+        histogram[self.stored[position]] += 1
+
+        if delta > 0:
+            if value == -1:
+                self.non_negative[block] += 1
+            return 1 if value >= 0 else -1
+        if value == 0:
+            self.non_negative[block] -= 1
+        return 1 if value <= 0 else -1
+
+
+def parse_pair(line):
+    left, right = map(int, line.split())
+    return left, right
+
+
+def follow(file, reconciliation, interval=1.0):
+    """Apply the lines appended to the file, forever, printing the answers after each batch."""
+    pending = ""
+    while True:
+        data = file.read()
+        if not data:
+            time.sleep(interval)
+            continue
+        lines = (pending + data).split("\n")
+        pending = lines.pop()  # the last line may not be complete yet
+        for line in lines:
+            if line.strip():
+                reconciliation.append(*parse_pair(line))
+        print(f"{reconciliation.pairs} pairs: distance {reconciliation.distance}, "
+              f"similarity {reconciliation.similarity}", flush=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Day 1 with incremental updates.")
+    parser.add_argument("input", nargs="?", default=input_path(1, []), help="input file")
+    parser.add_argument("--follow", action="store_true", help="keep applying the lines appended to the input")
+    parser.add_argument("--max-id", type=int, default=MAX_ID, help="largest location ID")
+    args = parser.parse_args()
+
+    reconciliation = IncrementalReconciliation(args.max_id)
+    with open(args.input, "r") as file:
+        for line in file:
+            if line.strip():
+                reconciliation.append(*parse_pair(line))
+        print("Absolute Differences:", reconciliation.distance)
+        print("Similarity score:", reconciliation.similarity)
+
+        if args.follow:
+            follow(file, reconciliation)
@@ -0,0 +1,118 @@
+"""
+Both parts of day 1 from a single bulk parse.
+
+The two columns are read into integer arrays in one pass with NumPy, sorted once (with a
+counting sort when the location IDs are small, like the five-digit IDs of the puzzle),
+and the total distance and the similarity score are computed from the same arrays.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+
+import numpy as np
+
+from aoc.memory import stage
+from aoc.registry import input_path
+
+# Counting sort up to this many buckets (a 10^6 bucket histogram is 8MB)
+MAX_COUNTING_SORT_ID = 1_000_000
+
+
+def column_values(digits):
+    """The numbers written in a (lines, digits) array of digit values."""
+    powers = 10 ** np.arange(digits.shape[1] - 1, -1, -1, dtype=np.int64)
+    return digits.astype(np.int64) @ powers
+
+
+def parse_fixed_width(data):
+    """
+    Fast path for lines of equal length (five-digit IDs): view the bytes as a
+    (lines, line length) array and read both columns with one matrix product each.
+    Returns None when the lines are not laid out the same way.
+    """
+    newlines = np.flatnonzero(data[:64] == ord("\n"))
+    if not len(newlines):
+        return None
+    width = int(newlines[0]) + 1
+    if len(data) % width == width - 1:
+        data = np.append(data, np.uint8(ord("\n")))  # no trailing newline
+    if len(data) % width:
+        return None
+
+    rows = data.reshape(-1, width)
+    digits = rows[:, :-1] - np.uint8(ord("0"))
+    is_digit = digits <= 9  # uint8 wraps around below "0"
+    separator = np.flatnonzero(~is_digit[0])
+    # digits, one run of separators, digits, newline: the same on every line
+    if (not len(separator) or separator[0] == 0 or separator[-1] == width - 2
+            or separator[-1] - separator[0] + 1 != len(separator)
+            or (rows[:, -1] != ord("\n")).any() or (is_digit != is_digit[0]).any()):
+        return None
+    return column_values(digits[:, :separator[0]]), column_values(digits[:, separator[-1] + 1:])
+
+
+@stage("parse")
+def load_lists(file_path):
+    """Parse both columns into int64 arrays, without a Python loop over the lines."""
+    data = np.fromfile(file_path, dtype=np.uint8)
+    columns = parse_fixed_width(data)
+    if columns is not None:
+        return columns
+
+    numbers = np.fromfile(file_path, dtype=np.int64, sep=" ")  # any whitespace separates
+    if len(numbers) % 2:
+        raise ValueError("Every line must hold two location IDs.")
+    pairs = numbers.reshape(-1, 2)
+    return pairs[:, 0], pairs[:, 1]
+
+
+def counts_of(ids, size):
+    """Histogram of the IDs: counts[id] is the number of times id appears."""
+    return np.bincount(ids, minlength=size)
+
+
+def sorted_from_counts(counts):
+    """Counting sort: every ID repeated as many times as it appears, in O(n + max ID)."""
+    return np.repeat(np.arange(len(counts)), counts)
+
+
+@stage("solve")
+def total_distance_and_similarity(first, second):
+    """
+    Returns:
+        tuple: (total distance between the sorted lists, similarity score)
+    """
+    if len(first) != len(second):
+        raise ValueError("Lists must be of the same length to calculate differences.")
+    if len(first) == 0:
+        return 0, 0
+
+    size = int(max(first.max(), second.max())) + 1
+    if min(first.min(), second.min()) >= 0 and size <= MAX_COUNTING_SORT_ID:
+        first_counts, second_counts = counts_of(first, size), counts_of(second, size)
+        sorted_first, sorted_second = sorted_from_counts(first_counts), sorted_from_counts(second_counts)
+        # Every ID of the left list times the number of times it appears in the right list
+        similarity = int(np.dot(np.arange(size) * first_counts, second_counts))
+    else:
+        sorted_first, sorted_second = np.sort(first), np.sort(second)
+        ids, second_counts = np.unique(second, return_counts=True)
+        positions = np.searchsorted(ids, first).clip(max=len(ids) - 1)
+        similarity = int(np.sum(first * np.where(ids[positions] == first, second_counts[positions], 0)))
+
+    distance = int(np.abs(sorted_first - sorted_second).sum())
+    return distance, similarity
+
+
+if __name__ == "__main__":
+    start_time = time.time()
+
+    first, second = load_lists(input_path(1))  # Pass another input file on the command line
+    distance, similarity = total_distance_and_similarity(first, second)
+
+    print("Absolute Differences:", distance)
+    print("Similarity score:", similarity)
+    print(f"Execution Time: {time.time() - start_time:.4f} seconds")
@@ -36,15 +36,23 @@
 #
 # Your actual left and right lists contain many location IDs. What is the total distance between your lists?
 
-import bisect
+import os
+import sys
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+from aoc.memory import stage
+from aoc.registry import input_path, register
+
+@stage("parse")
 def process_file(file_path):
-    # Initialize sorted lists for the first and second numbers
+    # Initialize the lists for the first and second numbers
     first_numbers = []
     second_numbers = []
 
     # Read the file line by line
-    with open("day_01_input.txt", 'r') as file:
+    with open(file_path, 'r') as file:
         for line in file:
             # Parse the two numbers in the line
             try:
@@ -53,12 +61,16 @@ def process_file(file_path):
                 print(f"Skipping invalid line: {line.strip()}")
                 continue
 
-            # Insert each number into the respective sorted list
-            bisect.insort(first_numbers, num1)
-            bisect.insort(second_numbers, num2)
+            first_numbers.append(num1)
+            second_numbers.append(num2)
 
+    # Sort once at the end: inserting every number in order with bisect.insort is
+    # quadratic because of the list shifting
+    first_numbers.sort()
+    second_numbers.sort()
     return first_numbers, second_numbers
 
+@stage("solve")
 def calculate_absolute_differences(first_list, second_list):
     # Ensure both lists are the same length
     if len(first_list) != len(second_list):
@@ -68,7 +80,12 @@ def calculate_absolute_differences(first_list, second_list):
     differences = [abs(a - b) for a, b in zip(first_list, second_list)]
     return sum(differences)
 
-file_path = 'day_01_input.txt'  # Replace with the path to your file
-sorted_first, sorted_second = process_file(file_path)
-sum_absolute_differences = calculate_absolute_differences(sorted_first, sorted_second)
-print("Absolute Differences:", sum_absolute_differences)
\ No newline at end of file
+@register(day=1, part=1)
+def solve(input_path: str) -> int:
+    sorted_first, sorted_second = process_file(input_path)
+    return calculate_absolute_differences(sorted_first, sorted_second)
+
+if __name__ == "__main__":
+    file_path = input_path(1)  # Pass another input file on the command line
+    sum_absolute_differences = solve(file_path)
+    print("Absolute Differences:", sum_absolute_differences)
@@ -27,16 +27,24 @@ So, for these example lists, the similarity score at the end of this process is
 
 Once again consider your left and right lists. What is their similarity score?"""
 
-import bisect
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from collections import Counter
 
+from aoc.memory import stage
+from aoc.registry import input_path, register
+
+@stage("parse")
 def process_file(file_path):
-    # Initialize sorted lists for the first and second numbers
+    # Initialize the lists for the first and second numbers
     first_numbers = []
     second_numbers = []
 
     # Read the file line by line
-    with open("day_01_input.txt", 'r') as file:
+    with open(file_path, 'r') as file:
         for line in file:
             # Parse the two numbers in the line
             try:
@@ -45,12 +53,16 @@ def process_file(file_path):
                 print(f"Skipping invalid line: {line.strip()}")
                 continue
 
-            # Insert each number into the respective sorted list
-            bisect.insort(first_numbers, num1)
-            bisect.insort(second_numbers, num2)
+            first_numbers.append(num1)
+            second_numbers.append(num2)
 
+    # Sort once at the end: inserting every number in order with bisect.insort is
+    # quadratic because of the list shifting
+    first_numbers.sort()
+    second_numbers.sort()
     return first_numbers, second_numbers
 
+@stage("solve")
 def calculate_similarity_score(first_list, second_list):
     # Count occurrences of each number in the second list
     second_list_counts = Counter(second_list)
@@ -63,7 +75,12 @@ def calculate_similarity_score(first_list, second_list):
 
     return similarity_score
 
-file_path = 'day_01_input.txt'  # Replace with the path to your file
-sorted_first, sorted_second = process_file(file_path)
-similarity_score = calculate_similarity_score(sorted_first, sorted_second)
-print("Similarity score:", similarity_score)
\ No newline at end of file
+@register(day=1, part=2)
+def solve(input_path: str) -> int:
+    sorted_first, sorted_second = process_file(input_path)
+    return calculate_similarity_score(sorted_first, sorted_second)
+
+if __name__ == "__main__":
+    file_path = input_path(1)  # Pass another input file on the command line
+    similarity_score = solve(file_path)
+    print("Similarity score:", similarity_score)
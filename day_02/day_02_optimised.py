@@ -0,0 +1,156 @@
+"""
+Both parts of day 2 for all the reports at once, with NumPy.
+
+The reports are loaded into one (reports, longest report) array of levels, padded with
+zeros, and the number of levels of each report. The checks then run on whole arrays:
+- every step (difference of adjacent levels) is checked for an increase or a decrease
+  of 1 to 3, with the steps past the end of a report counted as fine
+- a report is safe if all its steps increase, or all decrease
+- with the Problem Dampener, removing level k leaves the steps before k - 1 and after
+  k unchanged and replaces the two steps around k by one step from level k - 1 to
+  level k + 1. Running "all" of the steps from the left and from the right gives every
+  removal of every report in O(levels) instead of re-checking each copy of the report.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+
+import numpy as np
+
+from aoc.memory import stage
+from aoc.registry import input_path
+
+IS_SPACE = np.zeros(256, dtype=bool)  # lookup table by byte value
+IS_SPACE[list(b" \t\r\n\v\f")] = True
+
+
+def pad_reports(values, lengths):
+    """
+    Lay the levels of the reports out in rows, padded with zeros.
+
+    Args:
+        values: the levels of all the reports, one after the other
+        lengths: the number of levels of each report
+
+    Returns:
+        tuple: (levels, lengths) with levels a (reports, width) int64 array
+    """
+    width = max(int(lengths.max(initial=0)), 3)  # at least one step "around" a removed level
+    rows = np.repeat(np.arange(len(lengths)), lengths)
+    columns = np.arange(len(values)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    levels = np.zeros((len(lengths), width), dtype=np.int64)
+    levels[rows, columns] = values
+    return levels, lengths
+
+
+def parse_reports(data):
+    """
+    Parse the reports in a uint8 array of the bytes of whole lines, without a Python
+    loop over the lines. Blank lines are skipped.
+    """
+    digits = data - np.uint8(ord("0"))
+    in_number = digits <= 9  # uint8 wraps around below "0"
+    minus = data == ord("-")
+    if not (in_number | IS_SPACE[data] | (minus & np.concatenate((in_number[1:], [False])))).all():
+        raise ValueError("Reports must only hold levels (integers).")
+    starts = np.flatnonzero(in_number & ~np.concatenate(([False], in_number[:-1])))
+    ends = np.flatnonzero(in_number & ~np.concatenate((in_number[1:], [False]))) + 1
+
+    # Read all the numbers at once, one digit position at a time
+    values = np.zeros(len(starts), dtype=np.int64)
+    for position in range(int((ends - starts).max(initial=0))):
+        index = starts + position
+        inside = index < ends
+        values[inside] = values[inside] * 10 + digits[index[inside]]
+    negative = minus[np.maximum(starts - 1, 0)] & (starts > 0)
+    values[negative] *= -1
+
+    # numbers on each line: the numbers before each newline, minus those before the previous one
+    numbers_before = np.searchsorted(starts, np.flatnonzero(data == ord("\n")))
+    lengths = np.diff(numbers_before, prepend=0, append=len(starts))
+    return pad_reports(values, lengths[lengths > 0])
+
+
+@stage("parse")
+def load_reports(file_path):
+    return parse_reports(np.fromfile(file_path, dtype=np.uint8))
+
+
+def step_checks(levels, lengths):
+    """
+    Returns:
+        tuple: two (reports, width - 1) bool arrays, True where the step from a level to
+        the next one increases (decreases) by 1 to 3, or lies past the end of the report
+    """
+    steps = np.diff(levels, axis=1)
+    past_end = np.arange(steps.shape[1]) >= (lengths - 1)[:, None]
+    increasing = ((steps >= 1) & (steps <= 3)) | past_end
+    decreasing = ((steps <= -1) & (steps >= -3)) | past_end
+    return increasing, decreasing
+
+
+def safe_reports(levels, lengths):
+    """Boolean array, True for the reports that are safe as they are."""
+    increasing, decreasing = step_checks(levels, lengths)
+    return increasing.all(axis=1) | decreasing.all(axis=1)
+
+
+def safe_after_removal(levels, lengths, good_steps, good):
+    """
+    For every report and every level k, whether the report without level k only has
+    good steps.
+
+    Args:
+        good_steps: (reports, width - 1) bool array of the good steps (see step_checks)
+        good: function telling the good steps of an array of steps apart
+    """
+    reports, width = levels.shape
+    ok_before = np.ones((reports, width), dtype=bool)  # ok_before[:, i]: steps 0..i-1 are all good
+    ok_before[:, 1:] = np.logical_and.accumulate(good_steps, axis=1)
+    ok_after = np.ones((reports, width), dtype=bool)  # ok_after[:, i]: steps i.. are all good
+    ok_after[:, :-1] = np.logical_and.accumulate(good_steps[:, ::-1], axis=1)[:, ::-1]
+
+    k = np.arange(width)
+    # steps before level k - 1, and after level k + 1
+    remaining = ok_before[:, np.maximum(k - 1, 0)] & ok_after[:, np.minimum(k + 1, width - 1)]
+
+    # the step from level k - 1 to level k + 1, for the levels with a neighbour on both sides
+    bridge = np.ones((reports, width), dtype=bool)
+    bridge[:, 1:-1] = good(levels[:, 2:] - levels[:, :-2]) | (k[1:-1] >= (lengths - 1)[:, None])
+
+    return remaining & bridge & (k < lengths[:, None])
+
+
+def safe_reports_with_dampener(levels, lengths):
+    """Boolean array, True for the reports that are safe once at most one level is removed."""
+    increasing, decreasing = step_checks(levels, lengths)
+    safe = increasing.all(axis=1) | decreasing.all(axis=1)
+    removals = (
+        safe_after_removal(levels, lengths, increasing, lambda steps: (steps >= 1) & (steps <= 3))
+        | safe_after_removal(levels, lengths, decreasing, lambda steps: (steps <= -1) & (steps >= -3))
+    )
+    return safe | removals.any(axis=1)
+
+
+@stage("solve")
+def count_safe(levels, lengths):
+    """
+    Returns:
+        tuple: (safe reports, safe reports with the Problem Dampener)
+    """
+    return int(safe_reports(levels, lengths).sum()), int(safe_reports_with_dampener(levels, lengths).sum())
+
+
+if __name__ == "__main__":
+    start_time = time.time()
+
+    levels, lengths = load_reports(input_path(2))  # Pass another input file on the command line
+    safe_count, dampened_count = count_safe(levels, lengths)
+
+    print("Number of safe reports:", safe_count)
+    print("Number of safe reports with Problem Dampener:", dampened_count)
+    print(f"Execution Time: {time.time() - start_time:.4f} seconds")
@@ -0,0 +1,90 @@
+"""
+Both parts of day 2 for report files of many gigabytes, on all CPUs.
+
+The file is split into byte ranges that start and end on line boundaries. Every
+worker reads only its ranges, parses and checks their reports with the NumPy engine
+of day_02_optimised.py, and returns two counts per range; the counts are then added
+up. Memory stays bounded by one range per worker.
+
+Usage:
+    python day_02/day_02_parallel.py reports.txt --chunk-megabytes 64 --processes 8
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import time
+
+import numpy as np
+
+from aoc.parallel import parallel_map
+from aoc.registry import input_path
+from day_02.day_02_optimised import parse_reports, safe_reports, safe_reports_with_dampener
+
+CHUNK_BYTES = 64 << 20  # bytes of reports parsed at once by a worker
+
+
+def line_ranges(file_path, chunk_bytes=CHUNK_BYTES):
+    """
+    Split the file into (start, end) byte ranges of about `chunk_bytes`, each moved
+    forward to the start of the next line.
+    """
+    size = os.path.getsize(file_path)
+    boundaries = [0]
+    with open(file_path, "rb") as file:
+        while boundaries[-1] + chunk_bytes < size:
+            file.seek(boundaries[-1] + chunk_bytes)
+            file.readline()  # the rest of the line belongs to this range
+            if file.tell() >= size:
+                break
+            boundaries.append(file.tell())
+    boundaries.append(size)
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def count_safe_in_range(byte_range, file_path):
+    """
+    Returns:
+        tuple: (safe reports, safe reports with the Problem Dampener) in the byte range
+    """
+    start, end = byte_range
+    with open(file_path, "rb") as file:
+        file.seek(start)
+        data = np.frombuffer(file.read(end - start), dtype=np.uint8)
+    levels, lengths = parse_reports(data)
+    return int(safe_reports(levels, lengths).sum()), int(safe_reports_with_dampener(levels, lengths).sum())
+
+
+def count_safe(file_path, chunk_bytes=CHUNK_BYTES, processes=None):
+    """
+    Returns:
+        tuple: (safe reports, safe reports with the Problem Dampener)
+    """
+    ranges = line_ranges(file_path, chunk_bytes)
+    counts = parallel_map(
+        count_safe_in_range,
+        ranges,
+        constants={"file_path": file_path},
+        processes=processes,
+        chunks_per_process=len(ranges),  # one range per task, for a free worker to take
+    )
+    return sum(safe for safe, _ in counts), sum(dampened for _, dampened in counts)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Day 2 on byte ranges of the input, in parallel.")
+    parser.add_argument("input", nargs="?", default=input_path(2, []), help="input file")
+    parser.add_argument("--chunk-megabytes", type=float, default=CHUNK_BYTES / (1 << 20),
+                        help="megabytes of reports parsed at once by a worker")
+    parser.add_argument("--processes", type=int, help="worker processes (default: all CPUs)")
+    args = parser.parse_args()
+
+    start_time = time.time()
+    safe_count, dampened_count = count_safe(args.input, int(args.chunk_megabytes * (1 << 20)), args.processes)
+
+    print("Number of safe reports:", safe_count)
+    print("Number of safe reports with Problem Dampener:", dampened_count)
+    print(f"Execution Time: {time.time() - start_time:.4f} seconds")
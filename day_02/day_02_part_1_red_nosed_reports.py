@@ -33,6 +33,13 @@ So, in this example, 2 reports are safe.
 Analyze the unusual data from the engineers. How many reports are safe?
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.registry import input_path, register
+
 def is_safe_report(levels):
     """Check if a report (list of levels) is safe."""
     increasing = all(levels[i] < levels[i + 1] for i in range(len(levels) - 1))
@@ -59,7 +66,11 @@ def count_safe_reports(file_path):
 
     return safe_count
 
-# Example usage
-file_path = 'day_02_input.txt'
-safe_reports_count = count_safe_reports(file_path)
-print("Number of safe reports:", safe_reports_count)
\ No newline at end of file
+@register(day=2, part=1)
+def solve(input_path: str) -> int:
+    return count_safe_reports(input_path)
+
+if __name__ == "__main__":
+    file_path = input_path(2)  # Pass another input file on the command line
+    safe_reports_count = count_safe_reports(file_path)
+    print("Number of safe reports:", safe_reports_count)
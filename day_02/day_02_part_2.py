@@ -19,21 +19,47 @@ Thanks to the Problem Dampener, 4 reports are actually safe!
 Update your analysis by handling situations where the Problem Dampener can remove a single level from unsafe reports. How many reports are now safe?
 """
 
-def is_safe_report(levels):
-    """Check if a report (list of levels) is safe."""
-    increasing = all(levels[i] < levels[i + 1] for i in range(len(levels) - 1))
-    decreasing = all(levels[i] > levels[i + 1] for i in range(len(levels) - 1))
-    valid_difference = all(1 <= abs(levels[i] - levels[i + 1]) <= 3 for i in range(len(levels) - 1))
-    return (increasing or decreasing) and valid_difference
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.registry import input_path, register
+
+def first_bad_step(levels, direction, skip=None):
+    """
+    Find the first adjacent pair that doesn't step by 1 to 3 in the given direction.
+
+    Args:
+        levels (list): the levels of the report
+        direction (int): 1 for increasing, -1 for decreasing
+        skip (int): index of a level to leave out, without copying the list
+
+    Returns:
+        int: index of the first level of the bad pair, or None if every step is fine
+    """
+    previous = None
+    for i, level in enumerate(levels):
+        if i == skip:
+            continue
+        if previous is not None and not 1 <= (level - levels[previous]) * direction <= 3:
+            return previous
+        previous = i
+    return None
 
 def is_safe_with_dampener(levels):
-    """Check if a report can be safe by removing one bad level."""
-    n = len(levels)
-    for i in range(n):
-        # Create a new report with the i-th level removed
-        modified_levels = levels[:i] + levels[i + 1:]
-        # Check if the modified report is safe
-        if is_safe_report(modified_levels):
+    """
+    Check if a report is safe, or can be made safe by removing one bad level, in O(n).
+
+    For a given direction, the first bad pair (i, j) stays in the report unless one of
+    its two levels is removed, so only those two removals need to be checked.
+    """
+    for direction in (1, -1):
+        i = first_bad_step(levels, direction)
+        if i is None:
+            return True
+        j = i + 1  # the pair is adjacent when nothing is skipped
+        if first_bad_step(levels, direction, skip=i) is None or first_bad_step(levels, direction, skip=j) is None:
             return True
     return False
 
@@ -48,13 +74,17 @@ def count_safe_reports_with_dampener(file_path):
             except ValueError:
                 continue
 
-            # Check if the report is safe directly or with the dampener
-            if is_safe_report(levels) or is_safe_with_dampener(levels):
+            # Safe directly or with the dampener
+            if is_safe_with_dampener(levels):
                 safe_count += 1
 
     return safe_count
 
-# Example usage
-file_path = 'day_02_input.txt' 
-safe_reports_count = count_safe_reports_with_dampener(file_path)
-print("Number of safe reports with Problem Dampener:", safe_reports_count)
\ No newline at end of file
+@register(day=2, part=2)
+def solve(input_path: str) -> int:
+    return count_safe_reports_with_dampener(input_path)
+
+if __name__ == "__main__":
+    file_path = input_path(2)  # Pass another input file on the command line
+    safe_reports_count = count_safe_reports_with_dampener(file_path)
+    print("Number of safe reports with Problem Dampener:", safe_reports_count)
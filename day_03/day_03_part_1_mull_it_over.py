@@ -18,8 +18,15 @@ Only the four highlighted sections are real mul instructions. Adding up the resu
 Scan the corrupted memory for uncorrupted mul instructions. What do you get if you add up all of the results of the multiplications?
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import re
 
+from aoc.registry import input_path, register
+
 def extract_and_sum_multiplications(file_path):
     """
     Extract valid `mul(X,Y)` instructions from the corrupted memory
@@ -42,6 +49,11 @@ def extract_and_sum_multiplications(file_path):
     return total_sum
 
 
-file_path = "day_03_input.txt" 
-result = extract_and_sum_multiplications(file_path)
-print("Total Sum of Multiplications:", result)
\ No newline at end of file
+@register(day=3, part=1)
+def solve(input_path: str) -> int:
+    return extract_and_sum_multiplications(input_path)
+
+if __name__ == "__main__":
+    file_path = input_path(3)  # Pass another input file on the command line
+    result = extract_and_sum_multiplications(file_path)
+    print("Total Sum of Multiplications:", result)
@@ -18,8 +18,15 @@ This time, the sum of the results is 48 (2*4 + 8*5).
 Handle the new instructions; what do you get if you add up all of the results of just the enabled multiplications?
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import re
 
+from aoc.registry import input_path, register
+
 def calculate_enabled_multiplications(file_path):
     """
     Process the file and calculate the sum of enabled multiplications,
@@ -56,7 +63,11 @@ def calculate_enabled_multiplications(file_path):
 
     return total_sum
 
-# Example usage
-file_path = "day_03_input.txt"  # Replace with the actual file path
-result = calculate_enabled_multiplications(file_path)
-print("Total Sum of Enabled Multiplications:", result)
\ No newline at end of file
+@register(day=3, part=2)
+def solve(input_path: str) -> int:
+    return calculate_enabled_multiplications(input_path)
+
+if __name__ == "__main__":
+    file_path = input_path(3)  # Pass another input file on the command line
+    result = calculate_enabled_multiplications(file_path)
+    print("Total Sum of Enabled Multiplications:", result)
@@ -0,0 +1,225 @@
+"""
+Both parts of day 3 for corrupted memory dumps of any size, on all CPUs.
+
+The file is memory-mapped and scanned as bytes, without ever decoding it to str, by a
+compiled bytes pattern, one fixed-size window at a time:
+- the pattern runs on the map directly (`finditer(data, start, end)`), so a window is
+  not even copied (the dfa engine below reads a copy of its window)
+- an instruction that starts in a window may end in the next one, so every window is
+  scanned up to OVERLAP bytes further, and only the instructions starting inside the
+  window are counted
+- each task maps only its window and the OVERLAP bytes after it (from the page
+  boundary before the window, as mmap offsets must be aligned), and unmaps them when
+  done, so memory stays constant whatever the size of the file
+
+The do()/don't() state seems to make the scan sequential, but a window can be
+summarised without knowing the state it starts in:
+
+    (sum of all the multiplications, sum if it starts enabled, sum if it starts disabled,
+     state at its end or None if it has no do()/don't())
+
+Two summaries of adjacent windows combine into the summary of both (`combine`), so the
+windows are summarised in parallel and folded in order, and the fold of all of them,
+starting enabled, is exactly the sequential answer.
+
+The instructions are found by one of two engines (`--engine`):
+- regex: the compiled bytes pattern, with a match object and two int() per instruction
+- dfa: a table-driven state machine over the bytes, which reads the operands into
+  integers as it goes, without backtracking or allocating anything per instruction
+
+Usage:
+    python day_03/day_03_streaming.py memory_dump.bin --window-megabytes 16 --processes 8
+    python -m generators 3 --size 100000000 -o dump.txt
+    python day_03/day_03_streaming.py dump.txt --engine dfa
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import functools
+import mmap
+import re
+import time
+
+from aoc.parallel import parallel_map
+from aoc.registry import input_path
+
+INSTRUCTION = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|do\(\)|don't\(\)")
+OVERLAP = len(b"mul(123,456)") - 1  # the longest instruction, but its first byte
+WINDOW_BYTES = 16 << 20
+
+EMPTY = (0, 0, 0, None)  # summary of a window without instructions
+
+DO, DONT = -1, -2  # yielded by the engines for do() and don't(), products for mul()
+
+MUL_DONE, DO_DONE, DONT_DONE = 19, 20, 21  # states of the dfa engine reading a ")"
+STATES = 22  # the final states are left like state 0
+
+
+def regex_instructions(data, start, end):
+    """Yield the instructions starting in data[start:end], found by the regex."""
+    for match in INSTRUCTION.finditer(data, start, min(end + OVERLAP, len(data))):
+        if match.start() >= end:
+            break  # counted in the next window
+        instruction = match[0]
+        if instruction == b"do()":
+            yield DO
+        elif instruction == b"don't()":
+            yield DONT
+        else:
+            yield int(match[1]) * int(match[2])
+
+
+def build_dfa():
+    """
+    Transition table of the state machine: TABLE[state][byte] is the next state.
+
+    State 0 is between instructions. Any byte that does not continue an instruction
+    goes to where it leads from state 0, so an "m" or a "d" starts a new instruction
+    (no instruction contains one of them after its first byte).
+    """
+    def word(first, text):
+        """States reading text, numbered from first: {state: {byte: next state}}."""
+        return {first + i: {byte: first + i + 1} for i, byte in enumerate(text)}
+
+    states = {0: {ord("m"): 1, ord("d"): 12}}
+    states.update(word(1, b"ul("))  # 1 -> 4: "mul(" read
+    # 5, 6, 7: one, two, three digits of X read; 8: "," read; 9, 10, 11: digits of Y
+    states.update({4: {}, 5: {ord(","): 8}, 6: {ord(","): 8}, 7: {ord(","): 8},
+                   8: {}, 9: {ord(")"): MUL_DONE}, 10: {ord(")"): MUL_DONE}, 11: {ord(")"): MUL_DONE}})
+    for digit in b"0123456789":
+        states[4][digit], states[5][digit], states[6][digit] = 5, 6, 7
+        states[8][digit], states[9][digit], states[10][digit] = 9, 10, 11
+    states.update(word(12, b"o("))  # 12 -> 14: "do(" read
+    states[13][ord("n")] = 15
+    states.update({14: {ord(")"): DO_DONE}})
+    states.update(word(15, b"'t("))  # 15 -> 18: "don't(" read
+    states.update({18: {ord(")"): DONT_DONE}})
+
+    table = []
+    for state in range(STATES):
+        row = [states[0].get(byte, 0) for byte in range(256)]  # restart from state 0
+        for byte, following in states.get(state, {}).items():
+            row[byte] = following
+        table.append(row)
+    return table
+
+
+TABLE = build_dfa()
+
+
+def dfa_instructions(data, start, end):
+    """Yield the instructions starting in data[start:end], found by the state machine."""
+    table = TABLE
+    state = x = y = 0
+    window = data[start:min(end + OVERLAP, len(data))]  # bytes, never decoded
+    for position, byte in enumerate(window, start):
+        state = table[state][byte]
+        if state == 0:
+            if position >= end:
+                break
+        elif state == 1 or state == 12:
+            if position >= end:
+                break  # starts in the next window
+        elif state == 5:
+            x = byte - 48
+        elif state == 6 or state == 7:
+            x = x * 10 + byte - 48
+        elif state == 9:
+            y = byte - 48
+        elif state == 10 or state == 11:
+            y = y * 10 + byte - 48
+        elif state == MUL_DONE:
+            yield x * y
+        elif state == DO_DONE:
+            yield DO
+        elif state == DONT_DONE:
+            yield DONT
+
+
+ENGINES = {"regex": regex_instructions, "dfa": dfa_instructions}
+
+
+def summarise_window(data, start, end, engine="regex"):
+    """
+    Run the instructions starting in data[start:end], for both possible states at the start.
+
+    Returns:
+        tuple: (sum of all the multiplications, sum of the enabled ones if the window
+        starts enabled, the same if it starts disabled, state at the end or None if unchanged)
+    """
+    total = if_enabled = if_disabled = 0
+    state = None  # the state the window started in, until the first do() or don't()
+    for instruction in ENGINES[engine](data, start, end):
+        if instruction == DO:
+            state = True
+        elif instruction == DONT:
+            state = False
+        else:  # the product of a mul()
+            total += instruction
+            if state is None:
+                if_enabled += instruction
+            elif state:
+                if_enabled += instruction
+                if_disabled += instruction
+    return total, if_enabled, if_disabled, state
+
+
+def combine(first, second):
+    """Summary of two adjacent windows from theirs (associative, see summarise_window)."""
+    total, if_enabled, if_disabled, state = first
+    after_enabled = True if state is None else state  # state entering the second window
+    after_disabled = False if state is None else state
+    return (
+        total + second[0],
+        if_enabled + (second[1] if after_enabled else second[2]),
+        if_disabled + (second[1] if after_disabled else second[2]),
+        state if second[3] is None else second[3],
+    )
+
+
+def summarise_range(byte_range, file_path, engine="regex"):
+    """Summarise the window file[start:end], mapping only the part of the file it reads."""
+    start, end = byte_range
+    offset = start - start % mmap.ALLOCATIONGRANULARITY
+    with open(file_path, "rb") as file:
+        length = min(end + OVERLAP, os.fstat(file.fileno()).st_size) - offset
+        with mmap.mmap(file.fileno(), length, access=mmap.ACCESS_READ, offset=offset) as data:
+            if hasattr(data, "madvise"):
+                data.madvise(mmap.MADV_SEQUENTIAL)
+            return summarise_window(data, start - offset, end - offset, engine)
+
+
+def scan_file(file_path, window_bytes=WINDOW_BYTES, processes=None, engine="regex"):
+    """
+    Returns:
+        tuple: (sum of all the multiplications, sum of the enabled ones)
+    """
+    size = os.path.getsize(file_path)  # an empty file cannot be mapped, and has no windows
+    windows = [(start, min(start + window_bytes, size)) for start in range(0, size, window_bytes)]
+    summaries = parallel_map(
+        summarise_range, windows, constants={"file_path": file_path, "engine": engine}, processes=processes
+    )
+    total, if_enabled, _, _ = functools.reduce(combine, summaries, EMPTY)
+    return total, if_enabled
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Day 3 on a memory-mapped dump, one window at a time.")
+    parser.add_argument("input", nargs="?", default=input_path(3, []), help="input file")
+    parser.add_argument("--window-megabytes", type=float, default=WINDOW_BYTES / (1 << 20),
+                        help="megabytes scanned per window")
+    parser.add_argument("--processes", type=int, help="worker processes (default: all CPUs)")
+    parser.add_argument("--engine", choices=ENGINES, default="regex", help="how to find the instructions")
+    args = parser.parse_args()
+
+    start_time = time.time()
+    window_bytes = max(int(args.window_megabytes * (1 << 20)), 1)
+    total, enabled_total = scan_file(args.input, window_bytes, args.processes, args.engine)
+
+    print("Total Sum of Multiplications:", total)
+    print("Total Sum of Enabled Multiplications:", enabled_total)
+    print(f"Execution Time: {time.time() - start_time:.4f} seconds")
@@ -0,0 +1,139 @@
+"""
+Day 4 word search for many words at once, with an Aho-Corasick automaton.
+
+Every way of reading the grid is a line of bytes: the rows, the columns, both families
+of diagonals, and all of them reversed. The lines are joined with newlines (which no
+word contains) and a single automaton built from all the words runs over them once:
+- every node of the automaton is a prefix of some word, with a child for each byte
+  that extends it, and a failure link to its longest proper suffix that is also a
+  prefix. A byte without a child follows the failure links until one has it (or the
+  root is reached), which never reads the text back: each byte moves at most one node
+  deeper, so the links followed are amortised to one per byte
+- every node knows the words ending there (itself and its suffixes), which are
+  counted when it is reached
+
+The search takes time linear in the size of the grid plus the number of matches,
+whatever the number of words, instead of a pass over the grid per word and direction,
+and the automaton takes memory linear in the total length of the words (a dict of the
+children per node, not a table of 256 transitions).
+
+Usage:
+    python day_04/day_04_multi_word_search.py --words XMAS SAMX MAS
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import time
+from collections import deque
+
+import numpy as np
+
+from aoc.grid import load_grid
+from aoc.registry import input_path
+
+SEPARATOR = b"\n"
+
+
+class AhoCorasick:
+    """Automaton counting the occurrences of a set of words (bytes) in a text."""
+
+    def __init__(self, words):
+        self.words = list(words)
+        if any(SEPARATOR in word or not word for word in self.words):
+            raise ValueError("Words must be non-empty and on a single line.")
+
+        # Trie of the words: children[node] maps a byte to the child node
+        children = [{}]
+        ends = [[]]  # ends[node]: indices of the words ending at this node
+        for index, word in enumerate(self.words):
+            node = 0
+            for byte in word:
+                if byte not in children[node]:
+                    children[node][byte] = len(children)
+                    children.append({})
+                    ends.append([])
+                node = children[node][byte]
+            ends[node].append(index)
+
+        # Breadth first, so that the node a failure link points to is complete first
+        self.children = children
+        self.fail = [0] * len(children)  # longest proper suffix in the trie
+        self.matches = [None] * len(children)  # words ending at a node, or at its suffixes
+        self.matches[0] = ends[0]
+        queue = deque(children[0].values())
+        for child in queue:
+            self.matches[child] = ends[child]
+        while queue:
+            node = queue.popleft()
+            for byte, child in children[node].items():
+                self.fail[child] = self.step(self.fail[node], byte)
+                self.matches[child] = ends[child] + self.matches[self.fail[child]]
+                queue.append(child)
+
+    def step(self, node, byte):
+        """The node reached from node by reading byte."""
+        children, fail = self.children, self.fail
+        while node and byte not in children[node]:
+            node = fail[node]
+        return children[node].get(byte, 0)
+
+    def count(self, text):
+        """
+        Returns:
+            list: the number of occurrences of every word in the text, overlaps included
+        """
+        counts = [0] * len(self.words)
+        children, fail, matches = self.children, self.fail, self.matches
+        node = 0
+        for byte in text:
+            while node and byte not in children[node]:  # inlined step()
+                node = fail[node]
+            node = children[node].get(byte, 0)
+            for index in matches[node]:
+                counts[index] += 1
+        return counts
+
+
+def grid_lines(grid):
+    """
+    The rows, columns and diagonals (both ways) of the grid as bytes, each read forwards.
+    """
+    rows, cols = grid.shape
+    flipped = np.fliplr(grid)
+    lines = [row.tobytes() for row in grid]
+    lines += [column.tobytes() for column in grid.T]
+    lines += [np.diagonal(grid, offset).tobytes() for offset in range(1 - rows, cols)]
+    lines += [np.diagonal(flipped, offset).tobytes() for offset in range(1 - rows, cols)]
+    return lines
+
+
+def count_words(grid, words):
+    """
+    Count the occurrences of every word in the grid, in all 8 directions.
+
+    Returns:
+        dict: word -> number of occurrences
+    """
+    automaton = AhoCorasick(word.encode() for word in words)
+    text = SEPARATOR.join(grid_lines(grid))
+    # the reversed text holds every line reversed, i.e. the 4 other directions
+    counts = automaton.count(text + SEPARATOR + text[::-1])
+    return dict(zip(words, counts))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Count many words in the day 4 word search at once.")
+    parser.add_argument("input", nargs="?", default=input_path(4, []), help="input file")
+    parser.add_argument("--words", nargs="+", default=["XMAS"], help="words to count")
+    args = parser.parse_args()
+
+    start_time = time.time()
+    counts = count_words(load_grid(args.input), args.words)
+
+    for word, count in counts.items():
+        print(f"The word '{word}' appears {count} times in the word search.")
+    print(f"Execution Time: {time.time() - start_time:.4f} seconds")
@@ -39,6 +39,15 @@ S.S.S.S.SS
 Take a look at the little Elf's word search. How many times does XMAS appear?
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.profiling import hot
+from aoc.registry import input_path, register
+
+@hot
 def count_word_in_grid(grid, word):
     rows, cols = len(grid), len(grid[0])
     word_len = len(word)
@@ -69,15 +78,24 @@ def count_word_in_grid(grid, word):
     return count
 
 
-file_path = "day_04_input.txt" 
-with open(file_path, 'r') as file:
-    word_search = file.read().splitlines()
+def read_grid(file_path):
+    with open(file_path, 'r') as file:
+        word_search = file.read().splitlines()
+
+    # Convert input to a grid of characters
+    return [list(row) for row in word_search]
+
+
+@register(day=4, part=1)
+def solve(input_path: str) -> int:
+    return count_word_in_grid(read_grid(input_path), "XMAS")
+
 
-# Convert input to a grid of characters
-grid = [list(row) for row in word_search]
+if __name__ == "__main__":
+    grid = read_grid(input_path(4))  # Pass another input file on the command line
 
-# Search for XMAS in the grid
-word_to_find = "XMAS"
-result = count_word_in_grid(grid, word_to_find)
+    # Search for XMAS in the grid
+    word_to_find = "XMAS"
+    result = count_word_in_grid(grid, word_to_find)
 
-print(f"The word '{word_to_find}' appears {result} times in the word search.")
\ No newline at end of file
+    print(f"The word '{word_to_find}' appears {result} times in the word search.")
@@ -0,0 +1,75 @@
+"""
+Part 1 of day 4 with NumPy: every start cell and every direction at once.
+
+A word can be read in 8 directions, which are 4 axes (right, down, down-right,
+down-left) read forwards or backwards. Reading a word backwards along an axis is
+reading the reversed word forwards, so for each axis:
+- the i-th letter of every possible start cell is a shifted view of the grid (a slice,
+  nothing is copied)
+- the starts of the word are the cells where all `len(word)` views hold the right
+  letters, one boolean AND per letter, and the same for the reversed word
+
+The whole search is 4 * len(word) slices and comparisons, instead of a Python loop over
+every cell, direction and letter.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+
+import numpy as np
+
+from aoc.grid import load_grid
+from aoc.registry import input_path
+
+# (dy, dx) of the axes; their reversals are the 4 other directions
+AXES = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+def letter_views(grid, length, dy, dx):
+    """
+    The cells `i` steps away from every start cell in direction (dy, dx), for i in
+    range(length), as views of the grid. Only the start cells from which a word of
+    this length fits in the grid are included.
+    """
+    rows, cols = grid.shape
+    span_y, span_x = (length - 1) * dy, (length - 1) * abs(dx)
+    if span_y >= rows or span_x >= cols:
+        return []
+    first_x = span_x if dx < 0 else 0  # reading left, the word starts at least span_x in
+    height, width = rows - span_y, cols - span_x
+    return [
+        grid[i * dy:i * dy + height, first_x + i * dx:first_x + i * dx + width]
+        for i in range(length)
+    ]
+
+
+def count_word(grid, word):
+    """Count the occurrences of word in the grid, in all 8 directions."""
+    letters = np.frombuffer(word.encode(), dtype=np.uint8)
+    count = 0
+    for dy, dx in AXES:
+        views = letter_views(grid, len(letters), dy, dx)
+        if not views:
+            continue
+        forwards = np.ones(views[0].shape, dtype=bool)
+        backwards = np.ones(views[0].shape, dtype=bool)
+        for view, letter, reversed_letter in zip(views, letters, letters[::-1]):
+            forwards &= view == letter
+            backwards &= view == reversed_letter
+        count += int(np.count_nonzero(forwards)) + int(np.count_nonzero(backwards))
+    return count
+
+
+if __name__ == "__main__":
+    start_time = time.time()
+
+    grid = load_grid(input_path(4))  # Pass another input file on the command line
+    word_to_find = "XMAS"
+    result = count_word(grid, word_to_find)
+
+    print(f"The word '{word_to_find}' appears {result} times in the word search.")
+    print(f"Execution Time: {time.time() - start_time:.4f} seconds")
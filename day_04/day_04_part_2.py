@@ -26,50 +26,44 @@ In this example, an X-MAS appears 9 times.
 Flip the word search from the instructions back over to the word search side and try again. How many times does an X-MAS appear?
 """
 
-import time
-
-def count_x_mas(grid):
-    rows, cols = len(grid), len(grid[0])
-    count = 0
+import os
+import sys
 
-    # Function to check if a 3x3 window forms an X-MAS
-    def is_x_mas(r, c):
-        if r - 1 < 0 or r + 1 >= rows or c - 1 < 0 or c + 1 >= cols:
-            return False
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-        # Check the diagonals
-        top_left = grid[r - 1][c - 1] + grid[r][c] + grid[r + 1][c + 1]
-        bottom_left = grid[r - 1][c + 1] + grid[r][c] + grid[r + 1][c - 1]
-
-        return (
-            top_left in {"MAS", "SAM"} and bottom_left in {"MAS", "SAM"}
-        )
+import time
 
-    # Iterate over the grid
-    for r in range(1, rows - 1):
-        for c in range(1, cols - 1):
-            if is_x_mas(r, c):
-                count += 1
+from aoc.grid import load_grid
+from aoc.profiling import hot
+from aoc.registry import input_path, register
+from aoc.stencil import count_stencil
 
-    return count
+# Each MAS can be written forwards or backwards: the rotations and reflections of this
+X_MAS = (
+    "M.S",
+    ".A.",
+    "M.S",
+)
 
-def solve_by_single_process():
-    file_path = "day_04_input.txt"
-    with open(file_path, 'r') as file:
-        word_search = file.read().splitlines()
+@hot
+def count_x_mas(grid):
+    # Every 3x3 window of the grid against the 4 distinct orientations of the X
+    return count_stencil(grid, X_MAS)
 
-    # Convert the input to a grid of characters
-    grid = [list(row) for row in word_search]
+@register(day=4, part=2)
+def solve_by_single_process(file_path: str) -> int:
+    # Load the input as a uint8 grid
+    grid = load_grid(file_path)
 
     # Count X-MAS patterns
     return count_x_mas(grid)
 
-def benchmark(func):
+def benchmark(func, *args):
     start_time = time.time()
-    result = func()
+    result = func(*args)
     end_time = time.time()
     return result, end_time - start_time
 
 if __name__ == "__main__":
-    result, benchmarked_time = benchmark(solve_by_single_process)
-    print(f"Result = {result}, Time = {benchmarked_time:.4f} seconds")
\ No newline at end of file
+    result, benchmarked_time = benchmark(solve_by_single_process, input_path(4))
+    print(f"Result = {result}, Time = {benchmarked_time:.4f} seconds")
@@ -1,61 +1,67 @@
-import multiprocessing
-import time
-
-def count_x_mas_in_chunk(chunk, rows, cols, grid):
-    count = 0
-
-    # Function to check if a 3x3 window forms an X-MAS
-    def is_x_mas(r, c):
-        if r - 1 < 0 or r + 1 >= rows or c - 1 < 0 or c + 1 >= cols:
-            return False
-
-        # Check the diagonals
-        top_left = grid[r - 1][c - 1] + grid[r][c] + grid[r + 1][c + 1]
-        bottom_left = grid[r - 1][c + 1] + grid[r][c] + grid[r + 1][c - 1]
+import os
+import sys
 
-        return top_left in {"MAS", "SAM"} and bottom_left in {"MAS", "SAM"}
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-    # Process the assigned rows in the chunk
-    for r in chunk:
-        for c in range(1, cols - 1):
-            if grid[r][c] == "A" and is_x_mas(r, c):
-                count += 1
+import math
+import time
 
-    return count
+from aoc.grid import load_grid
+from aoc.parallel import parallel_map
+from aoc.profiling import hot
+from aoc.registry import input_path
+from aoc.stencil import count_stencil
+from day_04.day_04_part_2 import X_MAS
 
+# Cells per tile: enough work (~0.1s) to pay for sending it to a worker
+TILE_CELLS = 1 << 22
 
-def parallel_count_x_mas(grid):
-    rows, cols = len(grid), len(grid[0])
-    num_processes = multiprocessing.cpu_count()  # Use all available CPUs
-    print(num_processes)
-    chunk_size = rows // num_processes  # Divide rows into chunks
+@hot
+def count_x_mas_in_band(band, grid):
+    # The X-MAS centred on the rows of the band, read from the band plus one halo row
+    # above and below (the grid is shared, so only these rows are touched)
+    first, last = band
+    return count_stencil(grid[first - 1:last + 1], X_MAS)
 
-    # Divide the rows into chunks for each process
-    chunks = [range(i * chunk_size, (i + 1) * chunk_size if i < num_processes - 1 else rows)
-              for i in range(num_processes)]
 
-    with multiprocessing.Pool(num_processes) as pool:
-        results = pool.starmap(count_x_mas_in_chunk, [(chunk, rows, cols, grid) for chunk in chunks])
+def row_bands(rows, tiles):
+    """Split the rows an X can be centred on (all but the first and last) into bands."""
+    centres = rows - 2
+    tiles = max(1, min(tiles, centres))
+    bounds = [1 + centres * i // tiles for i in range(tiles + 1)]
+    return list(zip(bounds, bounds[1:]))
 
-    return sum(results)
 
-def benchmark(func):
+def parallel_count_x_mas(grid):
+    rows, cols = grid.shape
+    if rows < 3:
+        return 0
+
+    # As many tiles as the size of the grid calls for, not one per CPU: a small grid is
+    # counted in this process, as starting a pool would take longer than the work
+    tiles = max(1, rows * cols // TILE_CELLS)
+    bands = row_bands(rows, tiles)
+    if len(bands) == 1:
+        return count_x_mas_in_band(bands[0], grid)
+
+    # The grid is published once in shared memory, every task is one band
+    processes = min(os.cpu_count() or 1, len(bands))
+    return sum(parallel_map(count_x_mas_in_band, bands, shared={"grid": grid},
+                            processes=processes, chunks_per_process=math.ceil(len(bands) / processes)))
+
+def benchmark(func, *args):
     start_time = time.time()
-    result = func()
+    result = func(*args)
     end_time = time.time()
     return result, end_time - start_time
 
-def solve_by_multiprocessing():
-    file_path = "day_04_input.txt"
-    with open(file_path, 'r') as file:
-        word_search = file.read().splitlines()
-
-    # Convert the input to a grid of characters
-    grid = [list(row) for row in word_search]
+def solve_by_multiprocessing(file_path):
+    # Load the input as a uint8 grid, which can be shared between processes
+    grid = load_grid(file_path)
 
     # Count X-MAS patterns using parallel processing
     return parallel_count_x_mas(grid)
 
 if __name__ == "__main__":
-    result, benchmarked_time = benchmark(solve_by_multiprocessing)
-    print(f"Result = {result}, Time = {benchmarked_time:.4f} seconds")
\ No newline at end of file
+    result, benchmarked_time = benchmark(solve_by_multiprocessing, input_path(4))
+    print(f"Result = {result}, Time = {benchmarked_time:.4f} seconds")
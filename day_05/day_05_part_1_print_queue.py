@@ -75,55 +75,85 @@ Of course, you'll need to be careful: the actual list of page ordering rules is
 Determine which updates are already in the correct order. What do you get if you add up the middle page number from those correctly-ordered updates?
 """
 
-import networkx as nx
-
-# Load data from file
-with open("day_05_input.txt", "r") as f:
-    lines = f.read().strip().split("\n")
-
-# Parse the dependency rules and updates
-rules = []
-updates = []
-is_parsing_updates = False
-
-for line in lines:
-    if not is_parsing_updates and "|" in line:
-        # Parse dependency rules
-        x, y = map(int, line.split("|"))
-        rules.append((x, y))
-    elif is_parsing_updates or "," in line:
-        # Parse updates
-        is_parsing_updates = True
-        update = list(map(int, line.split(",")))
-        updates.append(update)
-
-# Build the directed graph from rules
-graph = nx.DiGraph()
-graph.add_edges_from(rules)
-
-def is_valid_update(graph, update):
-    """Check if the given update is a valid topological order in the graph."""
-    positions = {page: i for i, page in enumerate(update)}
-    for u, v in graph.edges():
-        if u in positions and v in positions:
-            if positions[u] > positions[v]:  # Rule violated
-                return False
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.profiling import hot
+from aoc.registry import input_path, register
+
+PAGES = 100  # page numbers have two digits
+
+def read_input(file_path):
+    """Load the dependency rules and the updates."""
+    with open(file_path, "r") as f:
+        lines = f.read().strip().split("\n")
+
+    # Parse the dependency rules and updates
+    rules = []
+    updates = []
+    is_parsing_updates = False
+
+    for line in lines:
+        if not is_parsing_updates and "|" in line:
+            # Parse dependency rules
+            x, y = map(int, line.split("|"))
+            rules.append((x, y))
+        elif is_parsing_updates or "," in line:
+            # Parse updates
+            is_parsing_updates = True
+            update = list(map(int, line.split(",")))
+            updates.append(update)
+    return rules, updates
+
+def build_rule_index(rules):
+    """
+    Index the rules by page: successors[x] is a bitset of the pages y with a rule x|y
+    (bit y set), so any set of pages can be checked against them with one AND.
+    """
+    successors = [0] * PAGES
+    for x, y in rules:
+        if not (0 <= x < PAGES and 0 <= y < PAGES):
+            raise ValueError(f"Page numbers must be below {PAGES}.")
+        successors[x] |= 1 << y
+    return successors
+
+@hot
+def is_valid_update(successors, update):
+    """Check if the given update respects every rule between its pages, in O(len(update))."""
+    printed = 0  # bitset of the pages before the current one
+    for page in update:
+        if successors[page] & printed:  # Rule violated: the page should come before one of them
+            return False
+        printed |= 1 << page
     return True
 
-# Validate updates and find middle page numbers
-valid_updates = []
-middle_pages = []
-
-for update in updates:
-    subgraph = graph.subgraph(update)  # Extract relevant subgraph
-    if is_valid_update(subgraph, update):
-        valid_updates.append(update)
-        middle_pages.append(update[len(update) // 2])  # Middle element
-
-# Sum of middle pages from valid updates
-result = sum(middle_pages)
-
-# Outputs
-print("Valid Updates:", valid_updates)
-print("Middle Pages:", middle_pages)
-print("Sum of Middle Pages:", result)
\ No newline at end of file
+def find_valid_updates(successors, updates):
+    """Validate updates and find middle page numbers."""
+    valid_updates = []
+    middle_pages = []
+
+    for update in updates:
+        if is_valid_update(successors, update):
+            valid_updates.append(update)
+            middle_pages.append(update[len(update) // 2])  # Middle element
+    return valid_updates, middle_pages
+
+@register(day=5, part=1)
+def solve(input_path: str) -> int:
+    rules, updates = read_input(input_path)
+    _, middle_pages = find_valid_updates(build_rule_index(rules), updates)
+    return sum(middle_pages)
+
+if __name__ == "__main__":
+    rules, updates = read_input(input_path(5))  # Pass another input file on the command line
+    valid_updates, middle_pages = find_valid_updates(build_rule_index(rules), updates)
+
+    # Sum of middle pages from valid updates
+    result = sum(middle_pages)
+
+    # Outputs
+    print("Valid Updates:", valid_updates)
+    print("Middle Pages:", middle_pages)
+    print("Sum of Middle Pages:", result)
@@ -12,66 +12,120 @@ After taking only the incorrectly-ordered updates and ordering them correctly, t
 Find the updates which are not in the correct order. What do you get if you add up the middle page numbers after correctly ordering just those updates?
 """
 
-import networkx as nx
-import time
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-start_time = time.time()
-
-# Load data from file
-with open("day_05_input.txt", "r") as f:
-    lines = f.read().strip().split("\n")
-
-# Parse the dependency rules and updates
-rules = []
-updates = []
-is_parsing_updates = False
-
-for line in lines:
-    if not is_parsing_updates and "|" in line:
-        # Parse dependency rules
-        x, y = map(int, line.split("|"))
-        rules.append((x, y))
-    elif is_parsing_updates or "," in line:
-        # Parse updates
-        is_parsing_updates = True
-        update = list(map(int, line.split(",")))
-        updates.append(update)
-
-# Build the directed graph from rules
-graph = nx.DiGraph()
-graph.add_edges_from(rules)
-
-def is_valid_update(graph, update):
-    """Check if the given update is a valid topological order in the graph."""
-    positions = {page: i for i, page in enumerate(update)}
-    for u, v in graph.edges():
-        if u in positions and v in positions:
-            if positions[u] > positions[v]:  # Rule violated
-                return False
-    return True
-
-def correct_update(graph, update):
-    """Reorder the update based on the topological sorting."""
-    subgraph = graph.subgraph(update)  # Extract relevant subgraph
-    return list(nx.topological_sort(subgraph))
-
-# Validate updates and correct the invalid ones
-invalid_updates = []
-corrected_middle_pages = []
-
-for update in updates:
-    if not is_valid_update(graph, update):
-        invalid_updates.append(update)
-        corrected_update = correct_update(graph, update)
-        corrected_middle_pages.append(corrected_update[len(corrected_update) // 2])
-
-# Sum of middle pages from corrected updates
-result = sum(corrected_middle_pages)
-
-# Outputs
-print("Invalid Updates:", invalid_updates)
-print("Corrected Middle Pages:", corrected_middle_pages)
-print("Sum of Corrected Middle Pages:", result)
-
-end_time = time.time()  # End timer
-print(f"Execution Time: {end_time - start_time:.4f} seconds")
\ No newline at end of file
+import time
+from collections import deque
+
+from aoc.profiling import hot
+from aoc.registry import input_path, register
+from day_05.day_05_part_1_print_queue import build_rule_index, is_valid_update
+
+def read_input(file_path):
+    """Load the dependency rules and the updates."""
+    with open(file_path, "r") as f:
+        lines = f.read().strip().split("\n")
+
+    # Parse the dependency rules and updates
+    rules = []
+    updates = []
+    is_parsing_updates = False
+
+    for line in lines:
+        if not is_parsing_updates and "|" in line:
+            # Parse dependency rules
+            x, y = map(int, line.split("|"))
+            rules.append((x, y))
+        elif is_parsing_updates or "," in line:
+            # Parse updates
+            is_parsing_updates = True
+            update = list(map(int, line.split(",")))
+            updates.append(update)
+    return rules, updates
+
+@hot
+def correct_update(successors, update):
+    """
+    Reorder the update with a topological sort of its pages (Kahn's algorithm).
+
+    A page is printed once all the pages of the update that must come before it are.
+    Pages that no rule orders keep their order in the update, so with rules missing
+    the result is one of the valid orders, not necessarily the only one.
+    """
+    # predecessors[page]: number of pages of the update with a rule before this one
+    predecessors = {page: sum(successors[other] >> page & 1 for other in update) for page in update}
+    ready = deque(page for page in update if not predecessors[page])
+    order = []
+    while ready:
+        page = ready.popleft()
+        order.append(page)
+        for following in update:
+            if successors[page] >> following & 1:
+                predecessors[following] -= 1
+                if not predecessors[following]:
+                    ready.append(following)
+    if len(order) != len(update):
+        raise ValueError("The rules between the pages of the update have a cycle.")
+    return order
+
+@hot
+def middle_page(successors, update):
+    """
+    Find the middle page of the corrected update without reordering it.
+
+    When the rules order every pair of pages of an update, the page with k of the
+    pages after it is the (k + 1)-th from the end of the corrected update: one AND of
+    bitsets and a bit count per page. The order this gives is only trusted if it is
+    the unique one, i.e. it breaks no rule and every page has a rule before the next
+    one; otherwise (rules missing) the middle page is taken from correct_update.
+    """
+    pages = 0  # bitset of the pages of the update
+    for page in update:
+        pages |= 1 << page
+    order = [None] * len(update)
+    for page in update:
+        after = (successors[page] & pages).bit_count()
+        if after >= len(update) or order[-1 - after] is not None:
+            return correct_update(successors, update)[len(update) // 2]
+        order[-1 - after] = page
+    if not (is_valid_update(successors, order)
+            and all(successors[page] >> following & 1 for page, following in zip(order, order[1:]))):
+        return correct_update(successors, update)[len(update) // 2]
+    return order[len(update) // 2]
+
+def correct_invalid_updates(successors, updates):
+    """Validate updates and correct the invalid ones."""
+    invalid_updates = []
+    corrected_middle_pages = []
+
+    for update in updates:
+        if not is_valid_update(successors, update):
+            invalid_updates.append(update)
+            corrected_middle_pages.append(middle_page(successors, update))
+    return invalid_updates, corrected_middle_pages
+
+@register(day=5, part=2)
+def solve(input_path: str) -> int:
+    rules, updates = read_input(input_path)
+    _, corrected_middle_pages = correct_invalid_updates(build_rule_index(rules), updates)
+    return sum(corrected_middle_pages)
+
+if __name__ == "__main__":
+    start_time = time.time()
+
+    rules, updates = read_input(input_path(5))  # Pass another input file on the command line
+    invalid_updates, corrected_middle_pages = correct_invalid_updates(build_rule_index(rules), updates)
+
+    # Sum of middle pages from corrected updates
+    result = sum(corrected_middle_pages)
+
+    # Outputs
+    print("Invalid Updates:", invalid_updates)
+    print("Corrected Middle Pages:", corrected_middle_pages)
+    print("Sum of Corrected Middle Pages:", result)
+
+    end_time = time.time()  # End timer
+    print(f"Execution Time: {end_time - start_time:.4f} seconds")
@@ -1,72 +1,65 @@
-import networkx as nx
-from concurrent.futures import ThreadPoolExecutor
-from functools import lru_cache
-import time
+import os
+import sys
 
-start_time = time.time()
-# Load data from file
-with open("day_05_input.txt", "r") as f:
-    lines = f.read().strip().split("\n")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Parse the dependency rules and updates
-rules = []
-updates = []
-is_parsing_updates = False
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+import time
 
-for line in lines:
-    if not is_parsing_updates and "|" in line:
-        # Parse dependency rules
-        x, y = map(int, line.split("|"))
-        rules.append((x, y))
-    elif is_parsing_updates or "," in line:
-        # Parse updates
-        is_parsing_updates = True
-        update = list(map(int, line.split(",")))
-        updates.append(update)
+from aoc.registry import input_path
+from day_05.day_05_part_1_print_queue import build_rule_index, is_valid_update
+from day_05.day_05_part_2 import middle_page
 
-# Build the directed graph from rules
-graph = nx.DiGraph()
-graph.add_edges_from(rules)
+# Middle pages remembered, for updates seen again; the least recently used go first
+MAX_CACHED_UPDATES = 4096
 
-# Precompute dependency subgraphs for updates
-@lru_cache(maxsize=None)  # Cache results for efficiency
-def get_subgraph_nodes(update):
-    return set(update) & set(graph.nodes)
+# Load data from file
+def read_input(file_path):
+    """Load the dependency rules and the updates."""
+    with open(file_path, "r") as f:
+        lines = f.read().strip().split("\n")
 
-def is_valid_update(graph, update):
-    """Check if the given update is a valid topological order in the graph."""
-    positions = {page: i for i, page in enumerate(update)}
-    for u, v in graph.edges():
-        if u in positions and v in positions:
-            if positions[u] > positions[v]:  # Rule violated
-                return False
-    return True
+    # Parse the dependency rules and updates
+    rules = []
+    updates = []
+    is_parsing_updates = False
 
-def correct_update(graph, update):
-    """Reorder the update based on the topological sorting."""
-    subgraph_nodes = get_subgraph_nodes(tuple(update))
-    subgraph = graph.subgraph(subgraph_nodes)  # Extract relevant subgraph
-    return list(nx.topological_sort(subgraph))
+    for line in lines:
+        if not is_parsing_updates and "|" in line:
+            # Parse dependency rules
+            x, y = map(int, line.split("|"))
+            rules.append((x, y))
+        elif is_parsing_updates or "," in line:
+            # Parse updates
+            is_parsing_updates = True
+            update = list(map(int, line.split(",")))
+            updates.append(update)
+    return rules, updates
 
 # Process updates in parallel
-def process_update(update):
+def process_update(successors, cached_middle_page, update):
     """Validate and correct a single update."""
-    if not is_valid_update(graph, update):
-        corrected_update = correct_update(graph, update)
-        middle_page = corrected_update[len(corrected_update) // 2]
-        return middle_page
+    if not is_valid_update(successors, update):
+        return cached_middle_page(tuple(update))
     return None
 
-# Use ThreadPoolExecutor for parallel processing
-corrected_middle_pages = []
-with ThreadPoolExecutor() as executor:
-    results = executor.map(process_update, updates)
-    corrected_middle_pages = [res for res in results if res is not None]
+if __name__ == "__main__":
+    start_time = time.time()
+    rules, updates = read_input(input_path(5))  # Pass another input file on the command line
+    successors = build_rule_index(rules)
+    cached_middle_page = lru_cache(maxsize=MAX_CACHED_UPDATES)(partial(middle_page, successors))
+
+    # Use ThreadPoolExecutor for parallel processing
+    corrected_middle_pages = []
+    with ThreadPoolExecutor() as executor:
+        results = executor.map(partial(process_update, successors, cached_middle_page), updates)
+        corrected_middle_pages = [res for res in results if res is not None]
 
-# Sum of middle pages from corrected updates
-result = sum(corrected_middle_pages)
+    # Sum of middle pages from corrected updates
+    result = sum(corrected_middle_pages)
 
-# Outputs
-print("Sum of Corrected Middle Pages:", result)
-end_time = time.time()  # End timer
-print(f"Execution Time: {end_time - start_time:.4f} seconds")
\ No newline at end of file
+    # Outputs
+    print("Sum of Corrected Middle Pages:", result)
+    end_time = time.time()  # End timer
+    print(f"Execution Time: {end_time - start_time:.4f} seconds")
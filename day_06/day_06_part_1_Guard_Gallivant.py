@@ -90,6 +90,14 @@ Predict the path of the guard. How many distinct positions will the guard visit
 
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.profiling import hot
+from aoc.registry import input_path, register
+
 # Define the directions and their corresponding movements
 DIRECTIONS = {
     'up': (0, -1),
@@ -119,6 +127,7 @@ def parse_input(file_path):
 
     return grid, start_pos, start_dir
 
+@hot
 def simulate_guard_movement(grid, start_pos, start_dir):
     """Simulate the guard's movement and count distinct positions visited."""
     visited_positions = set()
@@ -148,12 +157,18 @@ def simulate_guard_movement(grid, start_pos, start_dir):
 
     return len(visited_positions)
 
-# Parse the input
-file_path = "day_06_input.txt"
-grid, start_pos, start_dir = parse_input(file_path)
+@register(day=6, part=1)
+def solve(input_path: str) -> int:
+    grid, start_pos, start_dir = parse_input(input_path)
+    return simulate_guard_movement(grid, start_pos, start_dir)
+
+if __name__ == "__main__":
+    # Parse the input
+    file_path = input_path(6)  # Pass another input file on the command line
+    grid, start_pos, start_dir = parse_input(file_path)
 
-# Simulate the guard's movement and calculate the result
-distinct_positions = simulate_guard_movement(grid, start_pos, start_dir)
+    # Simulate the guard's movement and calculate the result
+    distinct_positions = simulate_guard_movement(grid, start_pos, start_dir)
 
-# Output the result
-print("Distinct Positions Visited:", distinct_positions)
\ No newline at end of file
+    # Output the result
+    print("Distinct Positions Visited:", distinct_positions)
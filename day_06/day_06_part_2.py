@@ -88,10 +88,16 @@ It doesn't really matter what you choose to use as an obstacle so long as you an
 You need to get the guard stuck in a loop by adding a single new obstruction. How many different positions could you choose for this obstruction?
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import copy
 import time
 
-start_time = time.time()
+from aoc.profiling import hot
+from aoc.registry import input_path
 
 # Define the directions and their corresponding movements
 DIRECTIONS = {
@@ -123,6 +129,7 @@ def parse_input(file_path):
 
     return grid, start_pos, start_dir
 
+@hot
 def simulate_with_obstruction(grid, start_pos, start_dir, obstruction):
     """Simulate the guard's movement with an optional obstruction."""
     visited = set()
@@ -179,15 +186,19 @@ def find_obstruction_positions(grid, start_pos, start_dir):
 
     return valid_positions
 
-# Parse the input
-file_path = "day_06_input.txt" # "day_06_input_from_challenge.txt"
-grid, start_pos, start_dir = parse_input(file_path)
+if __name__ == "__main__":
+    start_time = time.time()
+
+    # Parse the input
+    file_path = input_path(6)  # e.g. "day_06_input_from_challenge.txt" on the command line
+    grid, start_pos, start_dir = parse_input(file_path)
+
+    # Find all valid obstruction positions
+    valid_positions = find_obstruction_positions(grid, start_pos, start_dir)
 
-# Find all valid obstruction positions
-valid_positions = find_obstruction_positions(grid, start_pos, start_dir)
+    # Output the result
+    print("Valid Obstruction Positions:", valid_positions)
 
-# Output the result
-print("Valid Obstruction Positions:", valid_positions)
+    end_time = time.time()  # End timer
+    print(f"Execution Time: {end_time - start_time:.4f} seconds")
 
-end_time = time.time()  # End timer
-print(f"Execution Time: {end_time - start_time:.4f} seconds")
@@ -1,6 +1,14 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import copy
 from concurrent.futures import ThreadPoolExecutor
 
+from aoc.profiling import hot
+from aoc.registry import input_path
+
 # Define the directions and their corresponding movements
 DIRECTIONS = {
     'up': (0, -1),
@@ -30,6 +38,7 @@ def parse_input(file_path):
 
     return grid, start_pos, start_dir
 
+@hot
 def simulate_with_obstruction(grid, start_pos, start_dir, obstruction):
     """Simulate the guard's movement with an optional obstruction."""
     visited = set()
@@ -123,12 +132,13 @@ def find_obstruction_positions(grid, start_pos, start_dir):
 
     return valid_positions
 
-# Parse the input
-file_path = "day_06_input.txt"
-grid, start_pos, start_dir = parse_input(file_path)
+if __name__ == "__main__":
+    # Parse the input
+    file_path = input_path(6)  # Pass another input file on the command line
+    grid, start_pos, start_dir = parse_input(file_path)
 
-# Find all valid obstruction positions
-valid_positions = find_obstruction_positions(grid, start_pos, start_dir)
+    # Find all valid obstruction positions
+    valid_positions = find_obstruction_positions(grid, start_pos, start_dir)
 
-# Output the result
-print("Valid Obstruction Positions:", valid_positions)
\ No newline at end of file
+    # Output the result
+    print("Valid Obstruction Positions:", valid_positions)
@@ -1,7 +1,15 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import copy
 from concurrent.futures import ProcessPoolExecutor
 import time
 
+from aoc.profiling import hot
+from aoc.registry import input_path
+
 # Define the directions and their corresponding movements
 DIRECTIONS = {
     'up': (0, -1),
@@ -31,6 +39,7 @@ def parse_input(file_path):
 
     return grid, start_pos, start_dir
 
+@hot
 def simulate_with_obstruction(grid, start_pos, start_dir, obstruction):
     """Simulate the guard's movement with an optional obstruction."""
     visited = set()
@@ -103,7 +112,7 @@ if __name__ == "__main__":
     start_time = time.time()
 
     # Parse the input
-    file_path = "day_06_input.txt"
+    file_path = input_path(6)  # Pass another input file on the command line
     grid, start_pos, start_dir = parse_input(file_path)
 
     # Find all valid obstruction positions
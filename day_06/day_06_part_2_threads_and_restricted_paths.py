@@ -1,7 +1,17 @@
-import copy
-from concurrent.futures import ProcessPoolExecutor
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import time
 
+import numpy as np
+
+from aoc.grid import load_grid
+from aoc.parallel import parallel_map
+from aoc.profiling import hot
+from aoc.registry import input_path, register
+
 # Define the directions and their corresponding movements
 DIRECTIONS = {
     'up': (0, -1),
@@ -10,46 +20,41 @@ DIRECTIONS = {
     'left': (-1, 0)
 }
 TURN_ORDER = ['up', 'right', 'down', 'left']  # Order of turns (90 degrees right)
+WALL = ord('#')
+GUARD_DIRECTIONS = {ord('^'): 'up', ord('>'): 'right', ord('v'): 'down', ord('<'): 'left'}
 
 def parse_input(file_path):
     """Parse the map input and extract initial state and grid."""
-    with open(file_path, "r") as f:
-        grid = [list(line.strip()) for line in f.readlines()]
+    # The map as a uint8 grid, which can be shared between processes
+    grid = load_grid(file_path)
 
     # Find the starting position and direction
-    start_pos = None
-    start_dir = None
-    for y, row in enumerate(grid):
-        for x, cell in enumerate(row):
-            if cell in "^>v<":
-                start_pos = (x, y)
-                start_dir = {'^': 'up', '>': 'right', 'v': 'down', '<': 'left'}[cell]
-                grid[y][x] = '.'  # Replace the starting position with a walkable path
-                break
-        if start_pos:
-            break
+    y, x = np.argwhere(np.isin(grid, list(GUARD_DIRECTIONS)))[0]
+    start_pos = (int(x), int(y))
+    start_dir = GUARD_DIRECTIONS[grid[y, x]]
+    grid[y, x] = ord('.')  # Replace the starting position with a walkable path
 
     return grid, start_pos, start_dir
 
-def simulate_with_obstruction(grid, start_pos, start_dir, obstruction):
-    """Simulate the guard's movement with an optional obstruction."""
+@hot
+def simulate_with_obstruction(obstruction, grid, start_pos, start_dir):
+    """
+    Simulate the guard's movement with an extra obstruction.
+
+    `grid` is the uint8 map shared by all workers (see aoc.parallel), so it is never
+    modified: the obstruction is checked next to the walls instead of written into it.
+    """
+    cells = grid.data  # memoryview of the array, much faster to index cell by cell
     visited = set()
     current_pos = start_pos
     current_dir = start_dir
-    rows, cols = len(grid), len(grid[0])
-
-    # Modify grid in place to avoid deep copy overhead
-    if obstruction:
-        grid[obstruction[1]][obstruction[0]] = '#'
+    rows, cols = grid.shape
 
     while True:
         # Record the current position and direction
         state = (current_pos, current_dir)
         if state in visited:
-            # Loop detected
-            if obstruction:
-                grid[obstruction[1]][obstruction[0]] = '.'  # Restore the grid
-            return True
+            return True  # Loop detected
 
         visited.add(state)
 
@@ -59,29 +64,21 @@ def simulate_with_obstruction(grid, start_pos, start_dir, obstruction):
 
         # Check if the next position is within bounds and walkable
         if 0 <= next_pos[1] < rows and 0 <= next_pos[0] < cols:
-            if grid[next_pos[1]][next_pos[0]] == '.':
-                current_pos = next_pos
-                continue
-            elif grid[next_pos[1]][next_pos[0]] == '#':
+            if next_pos == obstruction or cells[next_pos[1], next_pos[0]] == WALL:
                 # Obstacle encountered, turn right
                 current_dir = TURN_ORDER[(TURN_ORDER.index(current_dir) + 1) % 4]
+            else:
+                current_pos = next_pos
         else:
-            # Guard exits the grid
-            if obstruction:
-                grid[obstruction[1]][obstruction[0]] = '.'  # Restore the grid
-            return False  # No loop detected, simulation ends
-
-def simulate_position(pos, grid, start_pos, start_dir):
-    """Simulate guard movement for a specific obstruction position."""
-    grid_copy = copy.deepcopy(grid)  # Each process gets its own copy
-    return simulate_with_obstruction(grid_copy, start_pos, start_dir, obstruction=pos)
+            return False  # Guard exits the grid, no loop detected
 
 def get_guard_route(grid, start_pos, start_dir):
     """Simulate the guard's initial route and collect visited positions."""
+    cells = grid.data
     visited = set()
     current_pos = start_pos
     current_dir = start_dir
-    rows, cols = len(grid), len(grid[0])
+    rows, cols = grid.shape
 
     while True:
         # Record the current position
@@ -93,10 +90,10 @@ def get_guard_route(grid, start_pos, start_dir):
 
         # Check if the next position is within bounds and walkable
         if 0 <= next_pos[1] < rows and 0 <= next_pos[0] < cols:
-            if grid[next_pos[1]][next_pos[0]] == '.':
+            if cells[next_pos[1], next_pos[0]] != WALL:
                 current_pos = next_pos
                 continue
-            elif grid[next_pos[1]][next_pos[0]] == '#':
+            else:
                 # Obstacle encountered, turn right
                 current_dir = TURN_ORDER[(TURN_ORDER.index(current_dir) + 1) % 4]
         else:
@@ -113,22 +110,24 @@ def find_obstruction_positions(grid, start_pos, start_dir):
     # Use the route as candidate positions for obstructions
     candidate_positions = list(guard_route)
 
-    with ProcessPoolExecutor() as executor:
-        results = executor.map(
-            simulate_position, candidate_positions, 
-            [grid] * len(candidate_positions), 
-            [start_pos] * len(candidate_positions), 
-            [start_dir] * len(candidate_positions)
-        )
-        valid_positions = sum(results)
+    # The grid is published once in shared memory instead of being pickled into every task
+    results = parallel_map(
+        simulate_with_obstruction, candidate_positions,
+        shared={"grid": grid},
+        constants={"start_pos": start_pos, "start_dir": start_dir},
+    )
+    return sum(results)
 
-    return valid_positions
+@register(day=6, part=2)
+def solve(input_path: str) -> int:
+    grid, start_pos, start_dir = parse_input(input_path)
+    return find_obstruction_positions(grid, start_pos, start_dir)
 
 if __name__ == "__main__":
     start_time = time.time()
 
     # Parse the input
-    file_path = "day_06_input.txt"
+    file_path = input_path(6)  # Pass another input file on the command line
     grid, start_pos, start_dir = parse_input(file_path)
 
     # Find all valid obstruction positions
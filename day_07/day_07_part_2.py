@@ -14,21 +14,47 @@ Adding up all six test values (the three that could be made before using only +
 Using your new knowledge of elephant hiding spots, determine which equations could possibly be true. What is their total calibration result?
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import itertools
 import time
 from concurrent.futures import ProcessPoolExecutor
 
-def parse_input(file_path):
-    """Parse the input file into target values and number sequences."""
-    equations = []
+import numpy as np
+
+from aoc.cache import load_cached
+from aoc.memory import stage
+from aoc.profiling import hot
+from aoc.registry import input_path, register
+
+def read_equations(file_path):
+    """Parse the input file into arrays: the targets, all numbers in a row and where each equation's numbers start."""
+    targets, numbers, offsets = [], [], [0]
     with open(file_path, "r") as f:
         for line in f:
-            target, numbers = line.strip().split(":")
-            target = int(target)
-            numbers = list(map(int, numbers.split()))
-            equations.append((target, numbers))
-    return equations
-
+            target, values = line.strip().split(":")
+            targets.append(int(target))
+            numbers.extend(map(int, values.split()))
+            offsets.append(len(numbers))
+    return {
+        "targets": np.array(targets, dtype=np.int64),
+        "numbers": np.array(numbers, dtype=np.int64),
+        "offsets": np.array(offsets, dtype=np.int64),
+    }
+
+@stage("parse")
+def parse_input(file_path):
+    """Parse the input file into target values and number sequences (cached, see aoc.cache)."""
+    arrays = load_cached(file_path, read_equations)
+    targets = arrays["targets"].tolist()
+    numbers = arrays["numbers"].tolist()
+    offsets = arrays["offsets"].tolist()
+    return [(target, numbers[start:end]) for target, start, end in zip(targets, offsets, offsets[1:])]
+
+@hot
 def is_equation_solvable(target, numbers):
     """Check if any operator combination makes the equation true."""
     operators = ["+", "*", "||"]
@@ -70,6 +96,7 @@ def calculate_single_equation(equation):
     target, numbers = equation
     return target if is_equation_solvable(target, numbers) else 0   
 
+@stage("solve")
 def calculate_total_calibration(equations):
 
     """Calculate the total calibration result using parallel processing."""
@@ -78,12 +105,16 @@ def calculate_total_calibration(equations):
         results = executor.map(calculate_single_equation, equations)
     return sum(results)
 
+@register(day=7, part=2)
+def solve(input_path: str) -> int:
+    return calculate_total_calibration(parse_input(input_path))
+
 if __name__ == "__main__":
     # Start timing
     start_time = time.time()
 
     # Parse input
-    file_path = "day_07_input.txt"  # Replace with your actual input file path
+    file_path = input_path(7)  # Pass another input file on the command line
     equations = parse_input(file_path)
 
     # Calculate total calibration result
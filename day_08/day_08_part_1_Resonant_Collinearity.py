@@ -75,9 +75,16 @@ Because the topmost A-frequency antenna overlaps with a 0-frequency antinode, th
 Calculate the impact of the signal. How many unique locations within the bounds of the map contain an antinode?
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import numpy as np
 from collections import defaultdict
 
+from aoc.registry import input_path, register
+
 def parse_input(file_path):
     """Parse the input file into a NumPy array."""
     with open(file_path, 'r') as f:
@@ -125,9 +132,14 @@ def mark_antinode(grid, x, y):
     if grid[y, x] == '.':
         grid[y, x] = '#'
 
+@register(day=8, part=1)
+def solve(input_path: str) -> int:
+    grid = parse_input(input_path)
+    return len(find_antinodes(extract_antennas(grid), grid))
+
 def main():
     # Load the input file
-    input_file = "./day_08/day_08_input.txt"
+    input_file = input_path(8)  # Pass another input file on the command line
     grid = parse_input(input_file)
     
     antennas = extract_antennas(grid)
@@ -37,20 +37,30 @@ The original example now has 34 antinodes, including the antinodes that appear o
 Calculate the impact of the signal using this updated model. How many unique locations within the bounds of the map contain an antinode?
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import numpy as np
 import itertools
 
+from aoc.grid import load_grid
+from aoc.memory import stage
+from aoc.registry import input_path, register
+
+@stage("parse")
 def parse_input(filename):
-    """Parse the input grid into a NumPy array and frequency mapping."""
-    with open(filename, 'r') as file:
-        grid = np.genfromtxt(file, dtype='str', delimiter=1)
-    frequencies = set(char for row in grid for char in row if char != '.')
+    """Parse the input grid into a uint8 NumPy array and frequency mapping."""
+    grid = load_grid(filename)
+    frequencies = np.unique(grid[grid != ord('.')])
     freq_coords = {
-        freq: [(x, y) for x, row in enumerate(grid) for y, char in enumerate(row) if char == freq]
+        chr(freq): [tuple(coord) for coord in np.argwhere(grid == freq).tolist()]
         for freq in frequencies
     }
     return grid, freq_coords
 
+@stage("solve")
 def calculate_antinodes(freq_coords, grid_shape):
     """Calculate all antinodes for the given frequency coordinates."""
     shapex, shapey = grid_shape
@@ -77,10 +87,15 @@ def calculate_antinodes(freq_coords, grid_shape):
 
     return antinodes
 
+@register(day=8, part=2)
+def solve(input_path: str) -> int:
+    grid, freq_coords = parse_input(input_path)
+    return len(calculate_antinodes(freq_coords, grid.shape))
+
 def main(filename):
     grid, freq_coords = parse_input(filename)
     antinodes = calculate_antinodes(freq_coords, grid.shape)
     print(f"Total unique antinodes: {len(antinodes)}")
 
 if __name__ == "__main__":
-    main('./day_08/day_08_input.txt')
\ No newline at end of file
+    main(input_path(8))  # Pass another input file on the command line
\ No newline at end of file
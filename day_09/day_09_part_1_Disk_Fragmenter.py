@@ -46,6 +46,16 @@ Continuing the first example, the first few blocks' position multiplied by its f
 Compact the amphipod's hard drive using the process he requested. What is the resulting filesystem checksum? (Be careful copy/pasting the input for this puzzle; it is a single, very long line.)
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.memory import stage
+from aoc.profiling import hot
+from aoc.registry import input_path, register
+
+@stage("build")
 def parse_disk_map(disk_map):
     """Parse the input disk map into a visual representation."""
     representation = []
@@ -67,6 +77,8 @@ def parse_disk_map(disk_map):
     return representation
 
 
+@stage("solve")
+@hot
 def compact_disk(representation):
     """Compact the disk by moving file blocks to the leftmost free space."""
     for i in range(len(representation)):
@@ -80,6 +92,7 @@ def compact_disk(representation):
     return representation
 
 
+@stage("checksum")
 def calculate_checksum(representation):
     """Calculate the checksum of the compacted disk."""
     checksum = 0
@@ -91,8 +104,15 @@ def calculate_checksum(representation):
     return checksum
 
 
+@register(day=9, part=1)
+def solve(input_path: str) -> int:
+    with open(input_path, 'r') as file:
+        input_disk_map = file.read().strip()
+    return calculate_checksum(compact_disk(parse_disk_map(input_disk_map)))
+
+
 def main():
-    filename = "./day_09/day_09_input.txt"
+    filename = input_path(9)  # Pass another input file on the command line
     # Input string (example from challenge)
     # input_disk_map = "2333133121414131402"
     with open(filename, 'r') as file:
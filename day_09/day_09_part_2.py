@@ -18,6 +18,16 @@ The process of updating the filesystem checksum is the same; now, this example's
 Start over, now compacting the amphipod's hard drive using this new method instead. What is the resulting filesystem checksum?
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.memory import stage
+from aoc.profiling import hot
+from aoc.registry import input_path, register
+
+@stage("parse")
 def parse_disk_map(filename):
     # e.g. 2333133121414131402
     file_content = open(filename).read()
@@ -28,6 +38,8 @@ def parse_disk_map(filename):
         disk_map.append((first_value, second_value))
     return disk_map
 
+@stage("solve")
+@hot
 def compact_disk(disk_map):
     for i in range(len(disk_map))[::-1]:
         for j in range(i):
@@ -40,25 +52,28 @@ def compact_disk(disk_map):
                 disk_map.insert(j, (i_data, i_size))   
     return disk_map
 
+@stage("checksum")
 def calculate_checksum(disk_map):
     # create a flattened list from the disk map
     flattened_disk_map = []
     for data, size in disk_map:
         # Repeat each file ID (data) according to its size
         flattened_disk_map.extend([data] * size)
-    print (flattened_disk_map)
 
     checksum = 0
     for index, file_id in enumerate(flattened_disk_map):
         if file_id:
             checksum += index * (file_id - 1)
+    return checksum
 
-    print(checksum)
+@register(day=9, part=2)
+def solve(input_path: str) -> int:
+    return calculate_checksum(compact_disk(parse_disk_map(input_path)))
 
 def main():
-    disk_map = parse_disk_map("./day_09/day_09_input.txt")
+    disk_map = parse_disk_map(input_path(9))  # Pass another input file on the command line
     disk_map = compact_disk(disk_map)
-    calculate_checksum(disk_map)
+    print(calculate_checksum(disk_map))
     
 if __name__ == "__main__":
     main()
\ No newline at end of file
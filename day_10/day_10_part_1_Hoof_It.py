@@ -62,9 +62,17 @@ This larger example has 9 trailheads. Considering the trailheads in reading orde
 The reindeer gleefully carries over a protractor and adds it to the pile. What is the sum of the scores of all trailheads on your topographic map?
 """
 
-import numpy as np
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from collections import deque
 
+from aoc.grid import load_digit_grid
+from aoc.memory import stage
+from aoc.registry import input_path, register
+
 def find_trailheads(grid):
     """Find all positions with height 0."""
     trailheads = []
@@ -99,6 +107,7 @@ def bfs(grid, start):
 
     return reachable_nines
 
+@stage("solve")
 def calculate_trailhead_scores(grid, trailheads):
     """Calculate the total score for all trailheads."""
     total_score = 0
@@ -107,8 +116,14 @@ def calculate_trailhead_scores(grid, trailheads):
         total_score += len(reachable_nines)
     return total_score
 
+@register(day=10, part=1)
+def solve(input_path: str) -> int:
+    grid = load_digit_grid(input_path)
+    return calculate_trailhead_scores(grid, find_trailheads(grid))
+
 def main():
-    grid = np.array([list(map(int, line.strip())) for line in open('./day_10/day_10_input.txt', 'r').readlines()])
+    with stage("parse"):
+        grid = load_digit_grid(input_path(10))  # Pass another input file on the command line
     trailheads = find_trailheads(grid)
     total_score = calculate_trailhead_scores(grid, trailheads)
     print(f"Total score for all trailheads: {total_score}")
@@ -52,8 +52,16 @@ Considering its trailheads in reading order, they have ratings of 20, 24, 10, 4,
 You're not sure how, but the reindeer seems to have crafted some tiny flags out of toothpicks and bits of paper and is using them to mark trailheads on your topographic map. What is the sum of the ratings of all trailheads?
 """
 
-import numpy as np
+import os
+import sys
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.grid import load_digit_grid
+from aoc.memory import stage
+from aoc.registry import input_path, register
+
+@stage("solve")
 def find_all_trails(grid):
 
     def dfs(y, x, path):
@@ -89,8 +97,13 @@ def find_all_trails(grid):
     return all_trails
 
 
+@register(day=10, part=2)
+def solve(input_path: str) -> int:
+    return len(find_all_trails(load_digit_grid(input_path)))
+
 def main():
-    grid = np.array([list(map(int, line.strip())) for line in open('./day_10/day_10_input.txt', 'r').readlines()])
+    with stage("parse"):
+        grid = load_digit_grid(input_path(10))  # Pass another input file on the command line
     trails = find_all_trails(grid)
     print(f"Number of distinct trails that reach `9`: {len(trails)}")
 
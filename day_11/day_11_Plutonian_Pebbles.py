@@ -53,9 +53,18 @@ In this example, after blinking six times, you would have 22 stones. After blink
 Consider the arrangement of stones in front of you. How many stones will you have after blinking 25 times?
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from collections import Counter
 from math import log10
 
+from aoc.memory import stage
+from aoc.profiling import hot
+from aoc.registry import input_path, register
+
 def split_stone(stone):
     num_digits = len(str(stone))
     divisor = 10 ** (num_digits // 2)
@@ -63,6 +72,7 @@ def split_stone(stone):
     right = stone % divisor
     return left, right
 
+@hot
 def blink_stones(stones):
     """
     Simulates one "blink" of the stones' evolution based on the rules.
@@ -83,6 +93,7 @@ def blink_stones(stones):
     return new_stones
 
 
+@stage("solve")
 def simulate_blinks(initial_stones, num_blinks):
     """
     Simulates the evolution of stones over a given number of blinks.
@@ -93,10 +104,23 @@ def simulate_blinks(initial_stones, num_blinks):
     return stones
 
 
+@stage("parse")
+def read_stones(file_path):
+    with open(file_path, 'r') as file:
+        return Counter(int(stone) for stone in file.readline().strip().split())
+
+@register(day=11, part=1)
+def solve_part_1(input_path: str) -> int:
+    return simulate_blinks(read_stones(input_path), 25).total()
+
+@register(day=11, part=2)
+def solve_part_2(input_path: str) -> int:
+    return simulate_blinks(read_stones(input_path), 75).total()
+
 def main():
     # Example input: stones in the line
     # input_stones = [125, 17]  # Modify with your input
-    input_stones = Counter (int (stone) for stone in open('./day_11/day_11_input.txt', 'r').readline().strip().split())
+    input_stones = read_stones(input_path(11))  # Pass another input file on the command line
     num_blinks = 75  # The number of blinks to simulate
     final_stones = simulate_blinks(input_stones, num_blinks)
     print(f"After {num_blinks} blinks, there are {final_stones.total()} stones.")
@@ -80,10 +80,18 @@ So, it has a total price of 1930.
 What is the total price of fencing all regions on your map?
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import random
 from collections import deque
 from colorama import Fore, Style, init
 
+from aoc.profiling import hot
+from aoc.registry import input_path, register
+
 # Initialize colorama
 init()
 
@@ -96,6 +104,7 @@ COLORS = [
     Fore.LIGHTCYAN_EX, Fore.WHITE
 ]
 
+@hot
 def bfs_with_coloring(grid, visited, start, plant_type, color_map, used_colors):
     """Performs BFS to calculate area and perimeter of a region and assigns a random color."""
     queue = deque([start])
@@ -152,8 +161,17 @@ def print_colored_map(grid, color_map):
             print(color + grid[y][x] + Style.RESET_ALL, end='')
         print()
 
+def read_grid(file_path):
+    with open(file_path, 'r') as file:
+        return [list(line.strip()) for line in file.readlines()]
+
+@register(day=12, part=1)
+def solve(input_path: str) -> int:
+    total_cost, _ = calculate_total_cost_and_coloring(read_grid(input_path))
+    return total_cost
+
 def main():
-    grid = [list(line.strip()) for line in open('./day_12/day_12_input.txt', 'r').readlines()]
+    grid = read_grid(input_path(12))  # Pass another input file on the command line
     total_cost, color_map = calculate_total_cost_and_coloring(grid)
     print_colored_map(grid, color_map)
     print(f"\nTotal cost of fencing: {total_cost}")
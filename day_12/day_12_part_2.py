@@ -53,15 +53,24 @@ Adding these together produces its new total price of 1206.
 What is the new total price of fencing all regions on your map?
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import numpy as np
 from collections import defaultdict
 
+from aoc.grid import load_grid
+from aoc.memory import stage
+from aoc.registry import input_path, register
+
+@stage("parse")
 def parse_grid(filename):
-    """Parse the grid from the input file into a NumPy array."""
-    with open(filename, 'r') as file:
-        grid = np.array([list(line.strip()) for line in file.readlines()])
-    return grid
+    """Parse the grid from the input file into a uint8 NumPy array of plant types."""
+    return load_grid(filename)
 
+@stage("build")
 def find_regions(grid):
     """Identify all unique regions in the grid using flood-fill."""
     visited = np.zeros_like(grid, dtype=bool)
@@ -85,7 +94,7 @@ def find_regions(grid):
         for x in range(grid.shape[1]):
             if not visited[y, x]:
                 region_type = grid[y, x]
-                region_id = f"{region_type}_{region_id_counter}"  # Unique ID for this region
+                region_id = f"{chr(region_type)}_{region_id_counter}"  # Unique ID for this region
                 region_id_counter += 1
                 flood_fill(y, x, region_id)
     
@@ -145,6 +154,7 @@ def count_sides(region_type, region_coords):
     
     return sides
 
+@stage("solve")
 def calculate_total_price(grid):
     """Calculate the total price for fencing all regions."""
     regions = find_regions(grid)
@@ -159,8 +169,12 @@ def calculate_total_price(grid):
 
     return total_price
 
+@register(day=12, part=2)
+def solve(input_path: str) -> int:
+    return calculate_total_price(parse_grid(input_path))
+
 def main():
-    grid = parse_grid("./day_12/day_12_input.txt")
+    grid = parse_grid(input_path(12))  # Pass another input file on the command line
     total_price = calculate_total_price(grid)
     print(f"Total Price: {total_price}")
 
@@ -47,7 +47,18 @@ You estimate that each button would need to be pressed no more than 100 times to
 Figure out how to win as many prizes as possible. What is the fewest tokens you would have to spend to win all possible prizes?
 """
 
-from pulp import LpProblem, LpVariable, LpMinimize, value
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from aoc.cache import load_cached
+from aoc.lazy import lazy_import
+from aoc.registry import input_path, register
+
+pulp = lazy_import("pulp")  # only needed for the ILP fallback
 
 
 
@@ -59,48 +70,70 @@ from pulp import LpProblem, LpVariable, LpMinimize, value
 #     {"A": (69, 23, 3), "B": (27, 71, 1), "Prize": (18641, 10279)},
     # ]
 
-def parse_input(file_path):
+def read_machines(file_path):
+    """Parse the input file into an array with one row per machine: x_a, y_a, x_b, y_b, prize_x, prize_y."""
     machines = []
-    with open(file_path, 'r') as f:
-        lines = f.readlines()
+    with open(file_path, "r") as file:
+        lines = file.readlines()
         for i in range(0, len(lines), 4):  # Each machine has 3 lines of data
             a_line = lines[i].strip().split(", ")
             b_line = lines[i + 1].strip().split(", ")
             prize_line = lines[i + 2].strip().split(", ")
-            
+
             # Extract values
             x_a, y_a = map(int, [a_line[0].split("+")[1], a_line[1].split("+")[1]])
             x_b, y_b = map(int, [b_line[0].split("+")[1], b_line[1].split("+")[1]])
             prize_x, prize_y = map(int, [prize_line[0].split("=")[1], prize_line[1].split("=")[1]])
-            
-            machines.append({
-                "A": (x_a, y_a, 3),  # A button moves and costs 3 tokens
-                "B": (x_b, y_b, 1),  # B button moves and costs 1 token
-                "Prize": (prize_x, prize_y),
-            })
+            machines.append((x_a, y_a, x_b, y_b, prize_x, prize_y))
+    return np.array(machines, dtype=np.int64).reshape(-1, 6)
+
+def parse_input(file_path):
+    machines = []
+    for x_a, y_a, x_b, y_b, prize_x, prize_y in load_cached(file_path, read_machines).tolist():
+        machines.append({
+            "A": (x_a, y_a, 3),  # A button moves and costs 3 tokens
+            "B": (x_b, y_b, 1),  # B button moves and costs 1 token
+            "Prize": (prize_x, prize_y),
+        })
     return machines
 
-input_file = "./day_13/day_13_input.txt"
-machines = parse_input(input_file)
+def solve_exact(machine, max_presses):
+    """
+    Solve the 2x2 linear system with Cramer's rule.
+
+    Returns:
+        tuple: (presses_a, presses_b) of the only solution, None if there is no valid
+        solution, or "ambiguous" if the buttons are collinear and the ILP has to decide.
+    """
+    x_a, y_a, _ = machine["A"]
+    x_b, y_b, _ = machine["B"]
+    prize_x, prize_y = machine["Prize"]
+
+    determinant = x_a * y_b - x_b * y_a
+    if determinant == 0:
+        return "ambiguous"
 
-# Define the maximum button presses
-max_presses = 100
+    presses_a, remainder_a = divmod(prize_x * y_b - prize_y * x_b, determinant)
+    presses_b, remainder_b = divmod(x_a * prize_y - y_a * prize_x, determinant)
+    if remainder_a or remainder_b:
+        return None  # no integer solution
+    if not (0 <= presses_a <= max_presses and 0 <= presses_b <= max_presses):
+        return None
+    return presses_a, presses_b
 
-# Results storage
-total_tokens = 0
-prizes_won = 0
 
-for i, machine in enumerate(machines):
+def solve_ilp(i, machine, max_presses):
+    """Find the cheapest presses with an integer linear program. Returns None if infeasible."""
     x_a, y_a, cost_a = machine["A"]
     x_b, y_b, cost_b = machine["B"]
     prize_x, prize_y = machine["Prize"]
 
     # Define the optimization problem
-    prob = LpProblem(f"Machine_{i+1}", LpMinimize)
+    prob = pulp.LpProblem(f"Machine_{i+1}", pulp.LpMinimize)
 
     # Variables: number of presses for A and B
-    presses_a = LpVariable("Presses_A", lowBound=0, upBound=max_presses, cat="Integer")
-    presses_b = LpVariable("Presses_B", lowBound=0, upBound=max_presses, cat="Integer")
+    presses_a = pulp.LpVariable("Presses_A", lowBound=0, upBound=max_presses, cat="Integer")
+    presses_b = pulp.LpVariable("Presses_B", lowBound=0, upBound=max_presses, cat="Integer")
 
     # Objective: Minimize the cost (tokens spent)
     prob += presses_a * cost_a + presses_b * cost_b, "Total_Cost"
@@ -110,17 +143,56 @@ for i, machine in enumerate(machines):
     prob += presses_a * y_a + presses_b * y_b == prize_y, "Y_Position"
 
     # Solve the problem
-    status = prob.solve()
+    status = prob.solve(pulp.PULP_CBC_CMD(msg=False))
 
     # Check if the problem has a feasible solution
     if status == 1:  # Solution found
-        tokens = value(presses_a * cost_a + presses_b * cost_b)
-        total_tokens += tokens
-        prizes_won += 1
-        print(f"Machine {i+1}: Won the prize with {value(presses_a)} A presses and {value(presses_b)} B presses. Tokens spent: {tokens}")
-    else:
-        print(f"Machine {i+1}: No solution found. Prize cannot be won.")
-
-# Output results
-print(f"\nTotal prizes won: {prizes_won}")
-print(f"Total tokens spent: {total_tokens}")
\ No newline at end of file
+        return round(pulp.value(presses_a)), round(pulp.value(presses_b))
+    return None
+
+
+def play_machines(machines, max_presses, verbose=False):
+    """
+    Returns:
+        tuple: (total tokens spent, prizes won)
+    """
+    total_tokens = 0
+    prizes_won = 0
+
+    for i, machine in enumerate(machines):
+        # Only buttons moving in the same direction leave a choice, which is what the ILP is for
+        presses = solve_exact(machine, max_presses)
+        if presses == "ambiguous":
+            presses = solve_ilp(i, machine, max_presses)
+
+        if presses:
+            presses_a, presses_b = presses
+            tokens = presses_a * machine["A"][2] + presses_b * machine["B"][2]
+            total_tokens += tokens
+            prizes_won += 1
+            if verbose:
+                print(f"Machine {i+1}: Won the prize with {presses_a} A presses and {presses_b} B presses. Tokens spent: {tokens}")
+        elif verbose:
+            print(f"Machine {i+1}: No solution found. Prize cannot be won.")
+
+    return total_tokens, prizes_won
+
+
+@register(day=13, part=1)
+def solve(input_path: str) -> int:
+    total_tokens, _ = play_machines(parse_input(input_path), max_presses=100)
+    return total_tokens
+
+
+if __name__ == "__main__":
+    input_file = input_path(13)  # Pass another input file on the command line
+    machines = parse_input(input_file)
+
+    # Define the maximum button presses
+    max_presses = 100
+
+    total_tokens, prizes_won = play_machines(machines, max_presses, verbose=True)
+
+    # Output results
+    print(f"\nTotal prizes won: {prizes_won}")
+    print(f"Total tokens spent: {total_tokens}")
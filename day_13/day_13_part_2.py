@@ -24,24 +24,57 @@ Now, it is only possible to win a prize on the second and fourth claw machines.
 Using the corrected prize coordinates, figure out how to win as many prizes as possible. What is the fewest tokens you would have to spend to win all possible prizes?
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import numpy as np
 import logging
 from typing import List, Dict, Tuple
 
+from aoc.cache import load_cached
+from aoc.registry import input_path, register
+
 # Constants
 PRIZE_OFFSET = 10**13
 COST_A = 3
 COST_B = 1
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
 
 
+def read_machines(file_path: str) -> np.ndarray:
+    """
+    Parses the input file into an array of machine configurations.
+
+    Args:
+        file_path (str): Path to the input file.
+
+    Returns:
+        np.ndarray: One row per machine: x_a, y_a, x_b, y_b, prize_x, prize_y.
+    """
+    machines = []
+    with open(file_path, "r") as file:
+        lines = file.readlines()
+        for i in range(0, len(lines), 4):  # Each machine has 3 lines of data
+            a_line = lines[i].strip().split(", ")
+            b_line = lines[i + 1].strip().split(", ")
+            prize_line = lines[i + 2].strip().split(", ")
+
+            # Extract values
+            x_a, y_a = map(int, [a_line[0].split("+")[1], a_line[1].split("+")[1]])
+            x_b, y_b = map(int, [b_line[0].split("+")[1], b_line[1].split("+")[1]])
+            prize_x, prize_y = map(int, [prize_line[0].split("=")[1], prize_line[1].split("=")[1]])
+            machines.append((x_a, y_a, x_b, y_b, prize_x, prize_y))
+    return np.array(machines, dtype=np.int64).reshape(-1, 6)
+
+
 def parse_input(file_path: str) -> List[Dict[str, Tuple[int, int, int]]]:
     """
     Parses the input file to extract machine configurations.
-    
+    The parsed numbers are cached next to the input, see aoc.cache.
+
     Args:
         file_path (str): Path to the input file.
 
@@ -50,29 +83,17 @@ def parse_input(file_path: str) -> List[Dict[str, Tuple[int, int, int]]]:
     """
     machines = []
     try:
-        with open(file_path, "r") as file:
-            lines = file.readlines()
-            for i in range(0, len(lines), 4):  # Each machine has 3 lines of data
-                a_line = lines[i].strip().split(", ")
-                b_line = lines[i + 1].strip().split(", ")
-                prize_line = lines[i + 2].strip().split(", ")
-
-                # Extract values
-                x_a, y_a = map(int, [a_line[0].split("+")[1], a_line[1].split("+")[1]])
-                x_b, y_b = map(int, [b_line[0].split("+")[1], b_line[1].split("+")[1]])
-                prize_x, prize_y = map(
-                    int, [prize_line[0].split("=")[1], prize_line[1].split("=")[1]]
-                )
-                prize_x += PRIZE_OFFSET
-                prize_y += PRIZE_OFFSET
-
-                machines.append(
-                    {
-                        "A": (x_a, y_a, COST_A),  # A button moves and costs COST_A tokens
-                        "B": (x_b, y_b, COST_B),  # B button moves and costs COST_B tokens
-                        "Prize": (prize_x, prize_y),
-                    }
-                )
+        for x_a, y_a, x_b, y_b, prize_x, prize_y in load_cached(file_path, read_machines).tolist():
+            prize_x += PRIZE_OFFSET
+            prize_y += PRIZE_OFFSET
+
+            machines.append(
+                {
+                    "A": (x_a, y_a, COST_A),  # A button moves and costs COST_A tokens
+                    "B": (x_b, y_b, COST_B),  # B button moves and costs COST_B tokens
+                    "Prize": (prize_x, prize_y),
+                }
+            )
         return machines
     except FileNotFoundError:
         logger.error("Input file not found.")
@@ -82,12 +103,15 @@ def parse_input(file_path: str) -> List[Dict[str, Tuple[int, int, int]]]:
         raise
 
 
-def solve_with_matrix(machines: List[Dict[str, Tuple[int, int, int]]]) -> None:
+def solve_with_matrix(machines: List[Dict[str, Tuple[int, int, int]]]) -> int:
     """
     Solves the problem using matrix algebra for each machine.
 
     Args:
         machines (List[Dict[str, Tuple[int, int, int]]]): A list of machine configurations.
+
+    Returns:
+        int: Total tokens spent.
     """
     total_tokens = 0
     prizes_won = 0
@@ -139,10 +163,19 @@ def solve_with_matrix(machines: List[Dict[str, Tuple[int, int, int]]]) -> None:
     logger.info("\nSummary:")
     logger.info(f"Total prizes won: {prizes_won}")
     logger.info(f"Total tokens spent: {total_tokens}")
+    return int(total_tokens)
+
+
+@register(day=13, part=2)
+def solve(input_path: str) -> int:
+    return solve_with_matrix(parse_input(input_path))
 
 
 if __name__ == "__main__":
-    INPUT_FILE = "./day_13/day_13_input.txt"
+    # Configure logging
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    INPUT_FILE = input_path(13)  # Pass another input file on the command line
 
     try:
         machines = parse_input(INPUT_FILE)
@@ -115,6 +115,16 @@ In this example, the quadrants contain 1, 3, 4, and 1 robot. Multiplying these t
 Predict the motion of the robots in your list within a space which is 101 tiles wide and 103 tiles tall. What will the safety factor be after exactly 100 seconds have elapsed?
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from aoc.cache import load_cached
+from aoc.registry import input_path, register
+
 # Grid dimensions
 WIDTH = 101
 HEIGHT = 103
@@ -124,22 +134,33 @@ MIDDLE_ROW = HEIGHT // 2    # Middle row (0-indexed)
 # Time step
 T = 100
 
-def parse_input_file(filename):
+def read_robots(filename):
     """
-    Reads the input file and parses the positions and velocities of robots.
+    Reads the input file into an array with one row per robot: px, py, vx, vy.
     Each line in the file has the format: p=x,y v=dx,dy
     """
     robots = []
     with open(filename, "r") as file:
         for line in file:
             line = line.strip()
+            if not line:
+                continue
             parts = line.split()
             pos = parts[0].split("=")[1]  # Extract position
             vel = parts[1].split("=")[1]  # Extract velocity
             px, py = map(int, pos.split(","))
             vx, vy = map(int, vel.split(","))
-            robots.append({"px": px, "py": py, "vx": vx, "vy": vy})
-    return robots
+            robots.append((px, py, vx, vy))
+    return np.array(robots, dtype=np.int64).reshape(-1, 4)
+
+def parse_input_file(filename):
+    """
+    Reads the positions and velocities of robots (cached, see aoc.cache).
+    """
+    return [
+        {"px": px, "py": py, "vx": vx, "vy": vy}
+        for px, py, vx, vy in load_cached(filename, read_robots).tolist()
+    ]
 
 def calculate_safety_factor(robots, width, height, time_step):
     middle_column = width // 2
@@ -154,8 +175,6 @@ def calculate_safety_factor(robots, width, height, time_step):
         px_final = (robot["px"] + time_step * robot["vx"]) % width
         py_final = (robot["py"] + time_step * robot["vy"]) % height
 
-        print ("px_final:", px_final, "py_final:", py_final)
-
         # Ignore robots in the middle row or middle column
         if px_final == middle_column or py_final == middle_row:
             continue
@@ -177,8 +196,13 @@ def calculate_safety_factor(robots, width, height, time_step):
 
     return quadrant_counts, safety_factor
 
+@register(day=14, part=1)
+def solve(input_path: str) -> int:
+    _, safety_factor = calculate_safety_factor(parse_input_file(input_path), WIDTH, HEIGHT, T)
+    return safety_factor
+
 def main ():
-    input_file = "./day_14/day_14_input.txt"
+    input_file = input_path(14)  # Pass another input file on the command line
     robots = parse_input_file(input_file)
     quadrant_counts, safety_factor = calculate_safety_factor(robots, WIDTH, HEIGHT, T)
     print("Final Quadrant Counts:", quadrant_counts)
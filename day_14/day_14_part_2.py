@@ -1,14 +1,24 @@
 import os
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from aoc.cache import load_cached
+from aoc.lazy import lazy_import
+from aoc.registry import input_path
+
+plt = lazy_import("matplotlib.pyplot")
+mcolors = lazy_import("matplotlib.colors")
 
 # Grid dimensions
 WIDTH = 101
 HEIGHT = 103
 
-def parse_input_file(filename):
+def read_robots(filename):
     """
-    Reads the input file and parses the positions and velocities of robots.
+    Reads the input file into an array with one row per robot: px, py, vx, vy.
     Each line in the file has the format: p=x,y v=dx,dy
     """
     robots = []
@@ -18,12 +28,21 @@ def parse_input_file(filename):
             if not line:
                 continue
             parts = line.split()
-            pos = parts[0].split("=")[1]
-            vel = parts[1].split("=")[1]
+            pos = parts[0].split("=")[1]  # Extract position
+            vel = parts[1].split("=")[1]  # Extract velocity
             px, py = map(int, pos.split(","))
             vx, vy = map(int, vel.split(","))
-            robots.append({"px": px, "py": py, "vx": vx, "vy": vy})
-    return robots
+            robots.append((px, py, vx, vy))
+    return np.array(robots, dtype=np.int64).reshape(-1, 4)
+
+def parse_input_file(filename):
+    """
+    Reads the positions and velocities of robots (cached, see aoc.cache).
+    """
+    return [
+        {"px": px, "py": py, "vx": vx, "vy": vy}
+        for px, py, vx, vy in load_cached(filename, read_robots).tolist()
+    ]
 
 def generate_grid(robots, width, height):
     """
@@ -72,6 +91,6 @@ def simulate_and_save(robots, width, height, max_iterations=10000, save_folder="
 
 # Main function
 if __name__ == "__main__":
-    input_file = "./day_14/day_14_input.txt"
+    input_file = input_path(14)  # Pass another input file on the command line
     robots = parse_input_file(input_file)
     simulate_and_save(robots, WIDTH, HEIGHT)
\ No newline at end of file
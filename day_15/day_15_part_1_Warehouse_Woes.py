@@ -236,6 +236,13 @@ The lanternfish would like to know the sum of all boxes' GPS coordinates after t
 Predict the motion of the robot and boxes in the warehouse. After the robot is finished moving, what is the sum of all boxes' GPS coordinates?
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.registry import input_path, register
+
 def simulate_warehouse(grid, movements):
     # Parse the grid into a 2D list and find initial positions
     warehouse = [list(row) for row in grid.strip().splitlines()]
@@ -293,8 +300,12 @@ def parse_input_file(filename):
         movement_sequence = movement_sequence.replace("\n", "")
     return grid, movement_sequence
 
+@register(day=15, part=1)
+def solve(input_path: str) -> int:
+    return simulate_warehouse(*parse_input_file(input_path))
+
 def main():
-    input_file = "./day_15/day_15_input.txt"
+    input_file = input_path(15)  # Pass another input file on the command line
     initial_grid, movement_sequence = parse_input_file(input_file)
     result = simulate_warehouse(initial_grid, movement_sequence)
     print(result)
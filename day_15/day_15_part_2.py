@@ -166,10 +166,18 @@ The sum of these boxes' GPS coordinates is 9021.
 Predict the motion of the robot and boxes in this new, scaled-up warehouse. What is the sum of all boxes' final GPS coordinates?
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import numpy as np
 from io import StringIO
 import time
 
+from aoc.profiling import hot
+from aoc.registry import input_path, register
+
 def load_input(file_path):
     with open(file_path, "r") as f:
         data = f.read().split("\n\n")
@@ -223,6 +231,7 @@ def compute_gps_coordinates(grid, target_symbol = "["):
     positions = np.vstack(np.where(grid == target_symbol)).T
     return int(np.sum(positions[:, 0] * 100 + positions[:, 1]))
 
+@hot
 def process_horizontal_movement(warehouse, robot_pos, move):
     if move == "<":
         ahead = warehouse[robot_pos[0], robot_pos[1]::-1]
@@ -242,6 +251,7 @@ def process_horizontal_movement(warehouse, robot_pos, move):
             break
 
 
+@hot
 def process_vertical_movement(field, robot_pos, dir):
     """
     Handle vertical robot movement and manage connected boxes.
@@ -300,8 +310,15 @@ def simulate_robot_movements(field, movements):
         # print_grid(field)  # Optional: Visualize grid after every move
 
 
+@register(day=15, part=2)
+def solve(input_path: str) -> int:
+    grid, movements = load_input(input_path)
+    warehouse = double_width(grid)
+    simulate_robot_movements(warehouse, movements)
+    return compute_gps_coordinates(warehouse)
+
 if __name__ == "__main__":
-    grid, movements = load_input("./day_15/day_15_input.txt")
+    grid, movements = load_input(input_path(15))  # Pass another input file on the command line
     warehouse = double_width(grid)
     print_grid(warehouse) 
 
@@ -236,23 +236,35 @@ The lanternfish would like to know the sum of all boxes' GPS coordinates after t
 Predict the motion of the robot and boxes in the warehouse. After the robot is finished moving, what is the sum of all boxes' GPS coordinates?
 """
 
-import networkx as nx
+import os
+import sys
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from aoc.grid import load_grid
+from aoc.lazy import lazy_import
+from aoc.memory import stage
+from aoc.profiling import hot
+from aoc.registry import input_path, register
+
+nx = lazy_import("networkx")
+
+
+@stage("parse")
 def parse_input(file_path):
     """
-    Reads the maze input from a file and returns the lines as a list of strings.
+    Reads the maze input from a file into a uint8 grid (see aoc/grid.py).
     """
-    with open(file_path, "r") as f:
-        return f.read().strip().split("\n")
+    return load_grid(file_path)
 
 
-def build_graph(lines):
+@stage("build")
+def build_graph(maze):
     """
     Builds a directed graph (DiGraph) from the maze input.
 
     Parameters:
-        lines (list of str): The maze input as a list of strings.
+        maze (np.ndarray): The maze as a uint8 grid.
 
     Returns:
         nx.DiGraph: The graph representing the maze.
@@ -263,17 +275,16 @@ def build_graph(lines):
     start, end = None, None
 
     # Parse the maze and add nodes
-    for i, line in enumerate(lines):
-        for j, char in enumerate(line):
-            if char == "#":
-                continue  # Skip walls
-            position = i + 1j * j
-            if char == "S":
-                start = (position, 1j)  # Start node with initial direction (down)
-            if char == "E":
-                end = position  # End position
-            for direction in directions:
-                graph.add_node((position, direction))
+    rows, cols = (maze != ord("#")).nonzero()  # Skip walls
+    for i, j in zip(rows.tolist(), cols.tolist()):
+        position = i + 1j * j
+        char = maze[i, j]
+        if char == ord("S"):
+            start = (position, 1j)  # Start node with initial direction (down)
+        if char == ord("E"):
+            end = position  # End position
+        for direction in directions:
+            graph.add_node((position, direction))
 
     # Add edges for movements and rotations
     for position, direction in graph.nodes:
@@ -294,6 +305,8 @@ def build_graph(lines):
     return graph, start
 
 
+@stage("solve")
+@hot
 def solve_part_1(graph, start):
     """
     Solves Part 1: Finds the shortest path length (cost) from start to end.
@@ -308,6 +321,8 @@ def solve_part_1(graph, start):
     return nx.shortest_path_length(graph, start, "end", weight="weight")
 
 
+@stage("solve")
+@hot
 def solve_part_2(graph, start):
     """
     Solves Part 2: Finds the number of unique positions visited across all shortest paths.
@@ -328,8 +343,20 @@ def solve_part_2(graph, start):
     return len(unique_positions)
 
 
+@register(day=16, part=1)
+def lowest_score(input_path: str) -> int:
+    graph, start = build_graph(parse_input(input_path))
+    return solve_part_1(graph, start)
+
+
+@register(day=16, part=2)
+def best_path_tiles(input_path: str) -> int:
+    graph, start = build_graph(parse_input(input_path))
+    return solve_part_2(graph, start)
+
+
 def main():
-    maze = [line.strip() for line in open("./day_16/day_16_input.txt", "r").readlines()]
+    maze = parse_input(input_path(16))  # Pass another input file on the command line
     graph, start = build_graph(maze)
 
     # Solve Part 1 and Part 2
@@ -60,14 +60,43 @@ OO.#OOO
 Simulate the first kilobyte (1024 bytes) falling onto your memory space. Afterward, what is the minimum number of steps needed to reach the exit?
 """
 
-import networkx as nx
-import matplotlib.pyplot as plt
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import numpy as np
 
+from aoc.cache import load_cached
+from aoc.lazy import lazy_import
+from aoc.registry import input_path, register
+
+nx = lazy_import("networkx")
+plt = lazy_import("matplotlib.pyplot")  # only needed with --visualize
+
+
+def read_all_coordinates(file_path):
+    """
+    Reads all corrupted coordinates from a file.
+
+    Args:
+        file_path (str): Path to the input file.
+
+    Returns:
+        np.ndarray: Array of shape (n, 2) with the (x, y) coordinates in falling order.
+    """
+    coordinates = []
+    with open(file_path, "r") as file:
+        for line in file:
+            x, y = map(int, line.strip().split(","))
+            coordinates.append((x, y))
+    return np.array(coordinates, dtype=np.int64).reshape(-1, 2)
+
 
 def read_corrupted_coordinates(file_path, limit):
     """
     Reads until the `limit` of corrupted coordinates from a file.
+    The parsed coordinates are cached next to the input, see aoc.cache.
 
     Args:
         file_path (str): Path to the input file.
@@ -76,14 +105,8 @@ def read_corrupted_coordinates(file_path, limit):
     Returns:
         list of tuple: List of corrupted coordinates as (x, y) tuples.
     """
-    corrupted_coordinates = []
-    with open(file_path, "r") as file:
-        for line in file:
-            x, y = map(int, line.strip().split(","))
-            corrupted_coordinates.append((x, y))
-            if len(corrupted_coordinates) == limit:
-                break
-    return corrupted_coordinates
+    coordinates = load_cached(file_path, read_all_coordinates)
+    return [tuple(coord) for coord in coordinates[:limit].tolist()]
 
 
 def create_grid_with_obstacles(grid_size, corrupted_coordinates):
@@ -144,14 +167,21 @@ def find_shortest_path(graph, start, end):
         return None, float("inf")
 
 
+@register(day=18, part=1)
+def solve(input_path: str) -> int:
+    grid_size = 71
+    graph = create_grid_with_obstacles(grid_size, read_corrupted_coordinates(input_path, 1024))
+    return find_shortest_path(graph, (0, 0), (grid_size - 1, grid_size - 1))
+
 def main():
     grid_size = 71
-    file_path = "./day_18/day_18_input.txt"
+    file_path = input_path(18)  # Pass another input file on the command line
     num_obstacles = 1024
 
     corrupted_coordinates = read_corrupted_coordinates(file_path, num_obstacles)
     graph = create_grid_with_obstacles(grid_size, corrupted_coordinates)
-    visualize_grid(grid_size, corrupted_coordinates)
+    if "--visualize" in sys.argv:
+        visualize_grid(grid_size, corrupted_coordinates)
     
     start = (0, 0)  # Top-left corner
     end = (grid_size - 1, grid_size - 1)  # Bottom-right corner
@@ -110,8 +110,17 @@ So, by asking the monkey to sell the first time each buyer's prices go down 2, t
 Figure out the best sequence to tell the monkey so that by looking for that same sequence of changes in every buyer's future prices, you get the most bananas in total. What is the most bananas you can get?
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from collections import defaultdict
 
+from aoc.memory import stage
+from aoc.profiling import hot
+from aoc.registry import input_path, register
+
 def mix_result_into_secret_number (secret_number, new_secret_number):
     "bitwise XOR of both numbers"
     return secret_number ^ new_secret_number
@@ -133,6 +142,7 @@ def multiply_by_2048 (secret_number):
     """Calculate the result of multiplying the secret number by 2048."""
     return secret_number * 2048
 
+@hot
 def pseudorandom_sequence (secret_number):
     # Step 1: Multiply by 64, mix, prune
     new_secret_number = multiply_by_64(secret_number)
@@ -151,6 +161,8 @@ def pseudorandom_sequence (secret_number):
 
     return new_secret_number
 
+@stage("solve")
+@hot
 def find_best_sequence(buyers_initial_secret_numbers, num_sequences=2000):
     """ Let's go through all buyers, generate their secrets, then the prices, generate the price changes from these. 
     Then we will find the best sequence of 4 changes that will give us the most bananas.
@@ -182,8 +194,28 @@ def find_best_sequence(buyers_initial_secret_numbers, num_sequences=2000):
     best_sequence = max(sequence_banana_sums, key=sequence_banana_sums.get)
     return best_sequence, sequence_banana_sums[best_sequence]
 
+@stage("parse")
+def read_secret_numbers(file_path):
+    with open(file_path) as f:
+        return f.read().splitlines()
+
+@register(day=22, part=1)
+def sum_of_2000th_secret_numbers(input_path: str) -> int:
+    total = 0
+    for monkey_secret_number in read_secret_numbers(input_path):
+        monkey_secret_number = int(monkey_secret_number)
+        for _ in range (2000):
+            monkey_secret_number = pseudorandom_sequence (monkey_secret_number)
+        total += monkey_secret_number
+    return total
+
+@register(day=22, part=2)
+def most_bananas(input_path: str) -> int:
+    _, max_bananas = find_best_sequence(read_secret_numbers(input_path))
+    return max_bananas
+
 def main():
-    with open("./day_22/day_22_input.txt") as f:
+    with open(input_path(22)) as f:  # Pass another input file on the command line
         buyers_initial_secret_numbers = f.read().splitlines()
     
     # part 1
@@ -1,5 +1,12 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from collections import defaultdict
 
+from aoc.registry import input_path, register
+
 def find_triangles_with_t(connections):
     # Step 1: Parse input into adjacency list
     graph = defaultdict(set)
@@ -25,8 +32,17 @@ def find_triangles_with_t(connections):
     # Step 4: Return results
     return len(triangles), triangles
 
+def read_connections(file_path):
+    with open(file_path, "r") as f:
+        return f.read().split("\n")
+
+@register(day=23, part=1)
+def solve(input_path: str) -> int:
+    count, _ = find_triangles_with_t(read_connections(input_path))
+    return count
+
 def main():
-    connections = open ("./day_23/day_23_input.txt", "r").read().split("\n")
+    connections = read_connections(input_path(23))  # Pass another input file on the command line
 
     # Solve the problem
     count, triangles_with_t = find_triangles_with_t(connections)
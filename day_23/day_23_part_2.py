@@ -1,5 +1,15 @@
-import networkx as nx
+import os
+import sys
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.lazy import lazy_import
+from aoc.memory import stage
+from aoc.registry import input_path, register
+
+nx = lazy_import("networkx")
+
+@stage("solve")
 def find_largest_clique(connections):
     # Step 1: Build the graph
     G = nx.Graph()
@@ -17,8 +27,17 @@ def find_largest_clique(connections):
     password = ",".join(sorted(largest_clique))
     return password
 
+@stage("parse")
+def read_connections(file_path):
+    with open(file_path, "r") as f:
+        return f.read().split("\n")
+
+@register(day=23, part=2)
+def solve(input_path: str) -> str:
+    return find_largest_clique(read_connections(input_path))
+
 def main():
-    connections = open ("./day_23/day_23_input.txt", "r").read().split("\n")
+    connections = read_connections(input_path(23))  # Pass another input file on the command line
     password = find_largest_clique(connections)
     print("Password to the LAN party:", password)
 
@@ -1,5 +1,15 @@
-import networkx as nx
-connections = open ("./day_23/day_23_input.txt", "r").read().split("\n")
-G = nx.Graph([conn.split("-") for conn in connections])
-password = ",".join(sorted(max(nx.find_cliques(G), key=len)))
-print("Password to the LAN party:", password)
\ No newline at end of file
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.lazy import lazy_import
+from aoc.registry import input_path
+
+nx = lazy_import("networkx")
+
+if __name__ == "__main__":
+    connections = open (input_path(23), "r").read().split("\n")
+    G = nx.Graph([conn.split("-") for conn in connections])
+    password = ",".join(sorted(max(nx.find_cliques(G), key=len)))
+    print("Password to the LAN party:", password)
@@ -103,6 +103,16 @@ So, in this example, the number of unique lock/key pairs that fit together witho
 Analyze your lock and key schematics. How many unique lock/key pairs fit together without overlapping in any column?
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from aoc.cache import load_cached
+from aoc.registry import input_path, register
+
 def count_valid_pairs(locks, keys):
     valid_pairs = 0
     MAX = 5
@@ -134,9 +144,21 @@ def parse_schematics(schematics):
             keys.append(key)
     return locks, keys
 
-def main():
-    schematics = open("./day_25/day_25_input.txt", "r").read().strip().split("\n\n")
+def read_locks_and_keys(file_path):
+    """Parse the schematics file into arrays of lock and key heights."""
+    schematics = open(file_path, "r").read().strip().split("\n\n")
     locks, keys = parse_schematics(schematics)
+    return {"locks": np.array(locks, dtype=np.int64), "keys": np.array(keys, dtype=np.int64)}
+
+@register(day=25, part=1)
+def solve(input_path: str) -> int:
+    heights = load_cached(input_path, read_locks_and_keys)
+    return count_valid_pairs(heights["locks"].tolist(), heights["keys"].tolist())
+
+
+def main():
+    heights = load_cached(input_path(25), read_locks_and_keys)  # Pass another input file on the command line
+    locks, keys = heights["locks"].tolist(), heights["keys"].tolist()
     valid_pairs = count_valid_pairs(locks, keys)
     print(valid_pairs)
 
@@ -0,0 +1,33 @@
+"""
+Seeded, reproducible input generators for every puzzle.
+
+Each `generators/day_XX.py` module provides `generate(size, seed=0)` returning the
+text of a valid puzzle input. What `size` means depends on the puzzle (lines, side
+length of a map, digits, nodes, ...) and is documented in each module. The same
+(size, seed) always produces the same input, so the benchmark suite can measure how
+the runtime of a solver grows with the size of its input.
+"""
+
+import glob
+import importlib
+import os
+
+
+def available_days():
+    """Return the sorted list of days that have a generator."""
+    folder = os.path.dirname(os.path.abspath(__file__))
+    names = glob.glob(os.path.join(folder, "day_*.py"))
+    return sorted(int(os.path.basename(name)[4:6]) for name in names)
+
+
+def get_generator(day):
+    """Return the `generate(size, seed=0)` function for a day."""
+    return importlib.import_module(f"generators.day_{day:02d}").generate
+
+
+def write_input(day, size, file_path, seed=0):
+    """Generate an input for `day` and write it to `file_path`. Returns the size in bytes."""
+    text = get_generator(day)(size, seed=seed)
+    with open(file_path, "w") as f:
+        f.write(text)
+    return len(text)
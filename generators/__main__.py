@@ -0,0 +1,31 @@
+"""
+Write a generated puzzle input to stdout or a file.
+
+Usage:
+    python -m generators 9 --size 10000000 --seed 1 -o day_09_big.txt
+"""
+
+import argparse
+import sys
+
+from generators import available_days, get_generator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic puzzle input.")
+    parser.add_argument("day", type=int, choices=available_days())
+    parser.add_argument("--size", type=int, required=True, help="size of the input, see the day's generator")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    args = parser.parse_args()
+
+    text = get_generator(args.day)(args.size, seed=args.seed)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+"""
+Day 1: Historian Hysteria. `size` is the number of lines (location ID pairs).
+
+IDs are five-digit numbers like in the real input. Part of the right list is drawn
+from the left list so that the similarity score is not trivially zero.
+"""
+
+import random
+
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    left = [rng.randint(10000, 99999) for _ in range(size)]
+    right = [rng.choice(left) if rng.random() < 0.3 else rng.randint(10000, 99999) for _ in range(size)]
+    return "\n".join(f"{a}   {b}" for a, b in zip(left, right))
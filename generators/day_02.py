@@ -0,0 +1,27 @@
+"""
+Day 2: Red-Nosed Reports. `size` is the number of reports.
+
+Reports are gradually increasing or decreasing sequences of 5 to 8 levels. Some of
+them get one or two bad levels so that safe, dampener-safe and unsafe reports are
+all present.
+"""
+
+import random
+
+
+def generate_report(rng, length):
+    step = 1 if rng.random() < 0.5 else -1
+    levels = [rng.randint(10, 90)]
+    for _ in range(length - 1):
+        levels.append(levels[-1] + step * rng.randint(1, 3))
+
+    # Spoil zero, one or two levels
+    for _ in range(rng.choice((0, 0, 1, 1, 2))):
+        levels[rng.randrange(length)] += rng.choice((-4, -1, 0, 1, 5))
+    return levels
+
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    reports = [generate_report(rng, rng.randint(5, 8)) for _ in range(size)]
+    return "\n".join(" ".join(map(str, levels)) for levels in reports)
@@ -0,0 +1,42 @@
+"""
+Day 3: Mull It Over. `size` is the approximate number of bytes of corrupted memory.
+
+Valid `mul(X,Y)`, `do()` and `don't()` instructions are mixed with noise and with
+corrupted look-alikes such as `mul(4*`, `mul ( 2 , 4 )` or `mul(32,64]`.
+"""
+
+import random
+
+LINE_LENGTH = 3000
+NOISE = "!@#$%^&*()[]{}<>?/\\'-+~_:;, whenwhyhowselectfrom"
+CORRUPTED = ("mul(4*", "mul(6,9!", "?(12,34)", "mul ( 2 , 4 )", "mul[3,7]", "mul(32,64]", "do_not_mul", "don't", "do(")
+
+
+def generate_token(rng):
+    roll = rng.random()
+    if roll < 0.25:
+        return f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+    if roll < 0.28:
+        return "do()"
+    if roll < 0.31:
+        return "don't()"
+    if roll < 0.40:
+        return rng.choice(CORRUPTED)
+    return "".join(rng.choices(NOISE, k=rng.randint(1, 6)))
+
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    lines, line, length = [], [], 0
+    written = 0
+    while written < size:
+        token = generate_token(rng)
+        line.append(token)
+        length += len(token)
+        written += len(token)
+        if length >= LINE_LENGTH:
+            lines.append("".join(line))
+            line, length = [], 0
+    if line:
+        lines.append("".join(line))
+    return "\n".join(lines)
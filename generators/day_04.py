@@ -0,0 +1,10 @@
+"""
+Day 4: Ceres Search. `size` is the side length of the (square) word search.
+"""
+
+import random
+
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    return "\n".join("".join(rng.choices("XMAS", k=size)) for _ in range(size))
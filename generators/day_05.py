@@ -0,0 +1,31 @@
+"""
+Day 5: Print Queue. `size` is the number of updates.
+
+Like the real input, the rules define a complete order over 49 two-digit pages
+(one rule per pair of pages). Updates are odd-length subsets of these pages, about
+half of them already in the right order.
+"""
+
+import random
+
+NUM_PAGES = 49
+
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    pages = rng.sample(range(10, 100), NUM_PAGES)  # `pages` is the correct order
+    rank = {page: i for i, page in enumerate(pages)}
+
+    rules = [(x, y) for i, x in enumerate(pages) for y in pages[i + 1:]]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(size):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=rank.get)
+        updates.append(update)
+
+    rule_lines = "\n".join(f"{x}|{y}" for x, y in rules)
+    update_lines = "\n".join(",".join(map(str, update)) for update in updates)
+    return rule_lines + "\n\n" + update_lines
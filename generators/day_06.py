@@ -0,0 +1,18 @@
+"""
+Day 6: Guard Gallivant. `size` is the side length of the (square) map.
+
+Obstacles cover about 2% of the map and the guard starts facing up on a free cell.
+"""
+
+import random
+
+OBSTACLE_DENSITY = 0.02
+
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    grid = [["#" if rng.random() < OBSTACLE_DENSITY else "." for _ in range(size)] for _ in range(size)]
+
+    x, y = rng.randrange(size), rng.randrange(size)
+    grid[y][x] = "^"
+    return "\n".join("".join(row) for row in grid)
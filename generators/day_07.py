@@ -0,0 +1,30 @@
+"""
+Day 7: Bridge Repair. `size` is the number of equations.
+
+Each equation has 3 to 12 numbers. About half of the targets are computed from a
+random combination of `+`, `*` and `||` so that they are solvable.
+"""
+
+import random
+
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        numbers = [rng.randint(1, 999) if rng.random() < 0.2 else rng.randint(1, 9) for _ in range(rng.randint(3, 12))]
+        target = 0
+        if rng.random() < 0.5:
+            target = numbers[0]
+            for number in numbers[1:]:
+                operator = rng.choice("+*|")
+                if operator == "+":
+                    target += number
+                elif operator == "*":
+                    target *= number
+                else:
+                    target = int(f"{target}{number}")
+        if not 0 < target < 10 ** 15:
+            target = rng.randint(1, 10 ** rng.randint(3, 15))  # also keeps targets within int64
+        lines.append(f"{target}: {' '.join(map(str, numbers))}")
+    return "\n".join(lines)
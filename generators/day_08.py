@@ -0,0 +1,18 @@
+"""
+Day 8: Resonant Collinearity. `size` is the side length of the (square) map.
+
+About one cell in 25 holds an antenna, with frequencies 0-9, a-z and A-Z.
+"""
+
+import random
+import string
+
+FREQUENCIES = string.digits + string.ascii_letters
+
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    return "\n".join(
+        "".join(rng.choice(FREQUENCIES) if rng.random() < 0.04 else "." for _ in range(size))
+        for _ in range(size)
+    )
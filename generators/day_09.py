@@ -0,0 +1,20 @@
+"""
+Day 9: Disk Fragmenter. `size` is the number of digits of the disk map.
+
+Files are 1-9 blocks long and free spaces 0-9 blocks. The map always ends with a file
+and has no trailing newline, like the real input.
+"""
+
+import random
+
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    if size % 2 == 0:
+        size += 1  # end with a file
+    files = rng.choices("123456789", k=size // 2 + 1)
+    gaps = rng.choices("0123456789", k=size // 2)
+    digits = [None] * size
+    digits[::2] = files
+    digits[1::2] = gaps
+    return "".join(digits)
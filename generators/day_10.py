@@ -0,0 +1,22 @@
+"""
+Day 10: Hoof It. `size` is the side length of the (square) topographic map.
+
+The map is random noise with hiking trails (0 to 9, one step at a time) drawn over
+it as random walks, so that every trailhead reaches at least one 9.
+"""
+
+import random
+
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    grid = [[rng.randint(0, 9) for _ in range(size)] for _ in range(size)]
+
+    for _ in range(size * size // 20):
+        y, x = rng.randrange(size), rng.randrange(size)
+        for height in range(10):
+            grid[y][x] = height
+            dy, dx = rng.choice(((-1, 0), (1, 0), (0, -1), (0, 1)))
+            y, x = min(max(y + dy, 0), size - 1), min(max(x + dx, 0), size - 1)
+
+    return "\n".join("".join(map(str, row)) for row in grid)
@@ -0,0 +1,10 @@
+"""
+Day 11: Plutonian Pebbles. `size` is the number of stones in the initial line.
+"""
+
+import random
+
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    return " ".join(str(rng.randint(0, 10 ** rng.randint(1, 7))) for _ in range(size))
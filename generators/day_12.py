@@ -0,0 +1,28 @@
+"""
+Day 12: Garden Groups. `size` is the side length of the (square) garden.
+
+Plants are laid out in 4x4 patches of one type with some cells flipped, which gives
+regions of various shapes, including regions inside other regions.
+"""
+
+import random
+import string
+
+PATCH_SIZE = 4
+
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    patches = size // PATCH_SIZE + 1
+    patch_types = [[rng.choice(string.ascii_uppercase) for _ in range(patches)] for _ in range(patches)]
+
+    rows = []
+    for y in range(size):
+        row = []
+        for x in range(size):
+            if rng.random() < 0.1:
+                row.append(rng.choice(string.ascii_uppercase))
+            else:
+                row.append(patch_types[y // PATCH_SIZE][x // PATCH_SIZE])
+        rows.append("".join(row))
+    return "\n".join(rows)
@@ -0,0 +1,26 @@
+"""
+Day 13: Claw Contraption. `size` is the number of claw machines.
+
+About half of the prizes are reachable with at most 100 presses of each button.
+"""
+
+import random
+
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    machines = []
+    for _ in range(size):
+        ax, ay = rng.randint(10, 99), rng.randint(10, 99)
+        bx, by = rng.randint(10, 99), rng.randint(10, 99)
+        if rng.random() < 0.5:
+            a, b = rng.randint(0, 100), rng.randint(0, 100)
+            prize_x, prize_y = a * ax + b * bx, a * ay + b * by
+        else:
+            prize_x, prize_y = rng.randint(1000, 20000), rng.randint(1000, 20000)
+        machines.append(
+            f"Button A: X+{ax}, Y+{ay}\n"
+            f"Button B: X+{bx}, Y+{by}\n"
+            f"Prize: X={prize_x}, Y={prize_y}\n"
+        )
+    return "\n".join(machines)
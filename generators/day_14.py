@@ -0,0 +1,16 @@
+"""
+Day 14: Restroom Redoubt. `size` is the number of robots on the 101x103 floor.
+"""
+
+import random
+
+WIDTH = 101
+HEIGHT = 103
+
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    return "\n".join(
+        f"p={rng.randrange(WIDTH)},{rng.randrange(HEIGHT)} v={rng.randint(-99, 99)},{rng.randint(-99, 99)}"
+        for _ in range(size)
+    )
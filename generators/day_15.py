@@ -0,0 +1,26 @@
+"""
+Day 15: Warehouse Woes. `size` is the side length of the (square) warehouse.
+
+The warehouse is walled in, about 25% of the inside holds boxes and 3% walls. The
+robot gets 8 moves per cell of the warehouse, 1000 moves per line.
+"""
+
+import random
+
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    grid = [["#"] * size]
+    for _ in range(size - 2):
+        row = ["#"]
+        for _ in range(size - 2):
+            roll = rng.random()
+            row.append("O" if roll < 0.25 else "#" if roll < 0.28 else ".")
+        row.append("#")
+        grid.append(row)
+    grid.append(["#"] * size)
+    grid[size // 2][size // 2] = "@"
+
+    moves = rng.choices("<>^v", k=8 * size * size)
+    move_lines = ["".join(moves[i:i + 1000]) for i in range(0, len(moves), 1000)]
+    return "\n".join("".join(row) for row in grid) + "\n\n" + "\n".join(move_lines)
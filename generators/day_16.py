@@ -0,0 +1,45 @@
+"""
+Day 16: Reindeer Maze. `size` is the side length of the (square) maze, rounded up to
+an odd number.
+
+The maze is carved with a randomised depth-first search and a few extra walls are
+knocked out so that there are several best paths. S is in the bottom-left corner and
+E in the top-right corner, like in the real input.
+"""
+
+import random
+
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    size = max(size, 5) | 1
+    grid = [["#"] * size for _ in range(size)]
+
+    # Iterative depth-first search over the odd cells
+    start = (size - 2, 1)
+    grid[start[0]][start[1]] = "."
+    stack = [start]
+    while stack:
+        y, x = stack[-1]
+        neighbours = [
+            (y + dy, x + dx)
+            for dy, dx in ((-2, 0), (2, 0), (0, -2), (0, 2))
+            if 0 < y + dy < size - 1 and 0 < x + dx < size - 1 and grid[y + dy][x + dx] == "#"
+        ]
+        if not neighbours:
+            stack.pop()
+            continue
+        ny, nx = rng.choice(neighbours)
+        grid[(y + ny) // 2][(x + nx) // 2] = "."
+        grid[ny][nx] = "."
+        stack.append((ny, nx))
+
+    # Knock out some walls to create loops
+    for _ in range(size * size // 50):
+        y, x = rng.randrange(1, size - 1), rng.randrange(1, size - 1)
+        if (y + x) % 2 == 1:
+            grid[y][x] = "."
+
+    grid[size - 2][1] = "S"
+    grid[1][size - 2] = "E"
+    return "\n".join("".join(row) for row in grid)
@@ -0,0 +1,18 @@
+"""
+Day 18: RAM Run. `size` is the number of falling bytes.
+
+The bytes fall on distinct cells of the `grid_size` x `grid_size` memory space
+(71x71 like the real puzzle), never on the start or the exit.
+"""
+
+import random
+
+
+def generate(size, seed=0, grid_size=71):
+    rng = random.Random(seed)
+    cells = [(x, y) for y in range(grid_size) for x in range(grid_size)]
+    cells.remove((0, 0))
+    cells.remove((grid_size - 1, grid_size - 1))
+    if size > len(cells):
+        raise ValueError(f"At most {len(cells)} bytes fit in a {grid_size}x{grid_size} memory space.")
+    return "\n".join(f"{x},{y}" for x, y in rng.sample(cells, size))
@@ -0,0 +1,10 @@
+"""
+Day 22: Monkey Market. `size` is the number of buyers.
+"""
+
+import random
+
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    return "\n".join(str(rng.randrange(1, 16777216)) for _ in range(size))
@@ -0,0 +1,47 @@
+"""
+Day 23: LAN Party. `size` is the number of computers.
+
+Computer names have two letters like in the real input, or more when there are more
+than 26 * 26 computers. Every computer gets about 13 random connections and one LAN
+party of 13 fully connected computers is planted in the network.
+"""
+
+import random
+import string
+
+AVERAGE_DEGREE = 13
+PARTY_SIZE = 13
+
+
+def computer_names(count):
+    width = 2
+    while 26 ** width < count:
+        width += 1
+    names = []
+    for i in range(count):
+        name = ""
+        for _ in range(width):
+            i, letter = divmod(i, 26)
+            name = string.ascii_lowercase[letter] + name
+        names.append(name)
+    return names
+
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    names = computer_names(size)
+    rng.shuffle(names)
+
+    edges = set()
+    for _ in range(size * AVERAGE_DEGREE // 2):
+        a, b = rng.sample(range(size), 2)
+        edges.add((min(a, b), max(a, b)))
+
+    party = rng.sample(range(size), min(PARTY_SIZE, size))
+    for i, a in enumerate(party):
+        for b in party[i + 1:]:
+            edges.add((min(a, b), max(a, b)))
+
+    edges = list(edges)
+    rng.shuffle(edges)
+    return "\n".join(f"{names[a]}-{names[b]}" for a, b in edges)
@@ -0,0 +1,29 @@
+"""
+Day 25: Code Chronicle. `size` is the number of schematics (locks and keys).
+"""
+
+import random
+
+HEIGHT = 5  # available space between the full top and bottom rows
+COLUMNS = 5
+
+
+def draw_schematic(heights, is_lock):
+    rows = []
+    for level in range(HEIGHT):
+        if is_lock:
+            rows.append("".join("#" if h > level else "." for h in heights))
+        else:
+            rows.append("".join("#" if h >= HEIGHT - level else "." for h in heights))
+    if is_lock:
+        return "\n".join(["#" * COLUMNS] + rows + ["." * COLUMNS])
+    return "\n".join(["." * COLUMNS] + rows + ["#" * COLUMNS])
+
+
+def generate(size, seed=0):
+    rng = random.Random(seed)
+    schematics = [
+        draw_schematic([rng.randint(0, HEIGHT) for _ in range(COLUMNS)], is_lock=rng.random() < 0.5)
+        for _ in range(size)
+    ]
+    return "\n\n".join(schematics)
@@ -0,0 +1,140 @@
+"""
+Run the registered solvers (see aoc/registry.py) from a single entry point.
+
+By default every solver runs warm, in this interpreter: the solver modules are
+imported once and the answer and the time spent in the solver itself are reported.
+With `--cold` each solver runs in a fresh interpreter instead, so the time includes
+the interpreter startup and the imports, like running the day's script by hand.
+
+Usage:
+    python run.py                           # every registered day and part
+    python run.py 6 9:2                     # both parts of day 6 and part 2 of day 9
+    python run.py 9 --input 9=big_input.txt # another input for day 9
+    python run.py --cold                    # every solver in a fresh interpreter
+    python run.py --json results.json       # also write the answers and timings as JSON
+    python run.py 1 --json -                # only print the JSON
+    python run.py 22 --profile              # count the calls of the hot functions (aoc/profiling.py)
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+from aoc import profiling
+from aoc.registry import default_input_path, load_solvers
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def parse_selector(selector):
+    """"6" -> (6, None) for both parts, "6:2" -> (6, 2)."""
+    day, _, part = selector.partition(":")
+    return int(day), int(part) if part else None
+
+
+def parse_inputs(values):
+    """["9=big_input.txt"] -> {9: "big_input.txt"}"""
+    inputs = {}
+    for value in values or []:
+        day, _, path = value.partition("=")
+        inputs[int(day)] = os.path.abspath(path)
+    return inputs
+
+
+def select(solvers, selectors):
+    """The (day, part) keys of the registered solvers matching the selectors."""
+    if not selectors:
+        return list(solvers)
+    keys = []
+    for day, part in map(parse_selector, selectors):
+        matching = [key for key in solvers if key[0] == day and part in (None, key[1])]
+        if not matching:
+            raise SystemExit(f"No solver registered for {day}:{part}" if part else f"No solver registered for day {day}")
+        keys.extend(key for key in matching if key not in keys)
+    return keys
+
+
+def run_warm(solver, input_file):
+    """Call the solver in this interpreter. Anything it prints goes to stderr."""
+    start_wall, start_cpu = time.perf_counter(), time.process_time()
+    with contextlib.redirect_stdout(sys.stderr):
+        answer = solver(input_file)
+    wall_time, cpu_time = time.perf_counter() - start_wall, time.process_time() - start_cpu
+    if hasattr(answer, "item"):
+        answer = answer.item()  # NumPy scalar
+    return answer, wall_time, cpu_time
+
+
+def run_cold(day, part, input_file):
+    """Run `run.py day:part` in a fresh interpreter and read back its JSON result."""
+    env = dict(os.environ)
+    if profiling.ENABLED:
+        # one profile per solver, instead of every run overwriting the same file
+        env["AOC_PROFILE"] = f"{os.path.splitext(profiling.output_path())[0]}.day_{day:02d}_part_{part}.folded"
+
+    children_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    start_wall = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, os.path.join(ROOT, "run.py"), f"{day}:{part}",
+         "--input", f"{day}={input_file}", "--json", "-"],
+        cwd=ROOT, env=env, check=True, stdout=subprocess.PIPE, text=True,
+    ).stdout
+    wall_time = time.perf_counter() - start_wall
+    children_after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu_time = (children_after.ru_utime + children_after.ru_stime
+                - children_before.ru_utime - children_before.ru_stime)
+    return json.loads(output)[0]["answer"], wall_time, cpu_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the registered solvers.")
+    parser.add_argument("selectors", nargs="*", help="days or day:part, e.g. 6 or 9:2 (default: all)")
+    parser.add_argument("--input", action="append", metavar="DAY=PATH", help="input file of a day")
+    parser.add_argument("--cold", action="store_true", help="run every solver in a fresh interpreter")
+    parser.add_argument("--json", metavar="FILE", help="write the results as JSON to FILE, or stdout with -")
+    parser.add_argument("--profile", nargs="?", const=profiling.DEFAULT_OUTPUT, metavar="FILE",
+                        help=f"profile the hot functions, flamegraph stacks to FILE (default: {profiling.DEFAULT_OUTPUT})")
+    args = parser.parse_args()
+
+    if args.profile:
+        profiling.enable(args.profile)  # before the solvers are imported and decorated
+
+    days = sorted({parse_selector(selector)[0] for selector in args.selectors})
+    solvers = load_solvers(days)
+    inputs = parse_inputs(args.input)
+    quiet = args.json == "-"
+
+    results = []
+    for day, part in select(solvers, args.selectors):
+        input_file = inputs.get(day, default_input_path(day))
+        if args.cold:
+            answer, wall_time, cpu_time = run_cold(day, part, input_file)
+        else:
+            answer, wall_time, cpu_time = run_warm(solvers[(day, part)], input_file)
+        results.append({
+            "day": day,
+            "part": part,
+            "input": input_file,
+            "answer": answer,
+            "wall_seconds": round(wall_time, 6),
+            "cpu_seconds": round(cpu_time, 6),
+        })
+        if not quiet:
+            print(f"Day {day:2d} part {part}: {answer!s:<20} {wall_time:>9.3f}s wall {cpu_time:>9.3f}s CPU")
+
+    if args.json:
+        text = json.dumps(results, indent=2)
+        if quiet:
+            print(text)
+        else:
+            with open(args.json, "w") as f:
+                f.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from aoc import cache
+from aoc.cache import CACHE_FOLDER, load_cached, parser_digest
+
+
+def read_int64(file_path):
+    return np.array(open(file_path).read().split(), dtype=np.int64)
+
+
+def read_int32(file_path):
+    return np.array(open(file_path).read().split(), dtype=np.int32)
+
+
+def read_float(file_path):
+    return np.array(list(map(float, open(file_path).read().split())))
+
+
+def read_int(file_path):
+    return np.array(list(map(int, open(file_path).read().split())))
+
+
+def test_digest_changes_with_names():
+    assert parser_digest(read_int64) != parser_digest(read_int32)
+    assert parser_digest(read_int) != parser_digest(read_float)
+
+
+def test_stale_entries_removed(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1 2 3")
+    load_cached(str(input_file), read_int64)
+    input_file.write_text("4 5 6")
+    assert load_cached(str(input_file), read_int64).tolist() == [4, 5, 6]
+    assert len(os.listdir(tmp_path / CACHE_FOLDER)) == 1
+
+
+def test_entries_of_older_parsers_removed(tmp_path, monkeypatch):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1 2 3")
+    load_cached(str(input_file), read_int64)
+    monkeypatch.setattr(read_int32, "__name__", "read_int64")  # a new version of read_int64
+    assert load_cached(str(input_file), read_int32).dtype == np.int32
+    assert len(os.listdir(tmp_path / CACHE_FOLDER)) == 1
+
+
+def test_unwritable_folder(tmp_path, monkeypatch):
+    def read_only(*args, **kwargs):
+        raise PermissionError("read-only file system")
+
+    monkeypatch.setattr(cache.os, "makedirs", read_only)
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1 2 3")
+    assert load_cached(str(input_file), read_int64).tolist() == [1, 2, 3]
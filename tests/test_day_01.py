@@ -0,0 +1,25 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+
+from day_01.day_01_optimised import total_distance_and_similarity
+
+
+def brute_force(first, second):
+    distance = sum(abs(a - b) for a, b in zip(sorted(first), sorted(second)))
+    similarity = sum(a * second.count(a) for a in first)
+    return distance, similarity
+
+
+@pytest.mark.parametrize("first, second", [
+    ([3, 4, 2, 1, 3, 3], [4, 3, 5, 3, 9, 3]),  # the puzzle example
+    ([3, 4, 5], [-1, 4, 4]),  # negative ID in the right list only
+    ([-3, 4, 5], [3, 4, 4]),  # negative ID in the left list only
+])
+def test_total_distance_and_similarity(first, second):
+    result = total_distance_and_similarity(np.array(first), np.array(second))
+    assert result == brute_force(first, second)
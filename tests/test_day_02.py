@@ -0,0 +1,27 @@
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from day_02.day_02_part_1_red_nosed_reports import is_safe_report
+from day_02.day_02_part_2 import is_safe_with_dampener
+
+
+def is_safe_with_any_removal(levels):
+    """Brute force: the report is safe, or safe once one of its levels is removed."""
+    return is_safe_report(levels) or any(is_safe_report(levels[:i] + levels[i + 1:]) for i in range(len(levels)))
+
+
+def test_example():
+    reports = [[7, 6, 4, 2, 1], [1, 2, 7, 8, 9], [9, 7, 6, 2, 1], [1, 3, 2, 4, 5], [8, 6, 4, 4, 1], [1, 3, 6, 7, 9]]
+    assert [is_safe_with_dampener(levels) for levels in reports] == [True, False, False, True, True, True]
+
+
+def test_random_reports_against_brute_force():
+    rng = random.Random(2)
+    for _ in range(5000):
+        levels = [rng.randint(1, 10)]
+        for _ in range(rng.randint(0, 7)):
+            levels.append(levels[-1] + rng.choice((-4, -3, -2, -1, 0, 1, 2, 3, 4)))
+        assert is_safe_with_dampener(levels) == is_safe_with_any_removal(levels), levels
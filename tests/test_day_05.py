@@ -0,0 +1,52 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from day_05.day_05_part_1_print_queue import build_rule_index, is_valid_update
+from day_05.day_05_part_2 import correct_update, middle_page
+
+EXAMPLE_RULES = [
+    (47, 53), (97, 13), (97, 61), (97, 47), (75, 29), (61, 13), (75, 53), (29, 13),
+    (97, 29), (53, 29), (61, 53), (97, 53), (61, 29), (47, 13), (75, 47), (97, 75),
+    (47, 61), (75, 61), (47, 29), (75, 13), (53, 13),
+]
+
+
+@pytest.mark.parametrize("update, corrected", [
+    ([75, 97, 47, 61, 53], [97, 75, 47, 61, 53]),
+    ([61, 13, 29], [61, 29, 13]),
+    ([97, 13, 75, 29, 47], [97, 75, 47, 29, 13]),
+])
+def test_complete_rules(update, corrected):
+    successors = build_rule_index(EXAMPLE_RULES)
+    assert correct_update(successors, update) == corrected
+    assert middle_page(successors, update) == corrected[len(corrected) // 2]
+
+
+def test_missing_rule():
+    # only a|c: b is not ordered against a or c, but a must still end up before c
+    a, b, c = 1, 2, 3
+    successors = build_rule_index([(a, c)])
+    corrected = correct_update(successors, [c, b, a])
+    assert is_valid_update(successors, corrected)
+    assert corrected.index(a) < corrected.index(c)
+    assert middle_page(successors, [c, b, a]) == corrected[1]
+
+
+def test_missing_rule_between_two_pages():
+    # 1|2, 1|3, 2|4, 3|4: nothing orders 2 and 3
+    successors = build_rule_index([(1, 2), (1, 3), (2, 4), (3, 4)])
+    corrected = correct_update(successors, [4, 3, 2, 1])
+    assert corrected in ([1, 2, 3, 4], [1, 3, 2, 4])
+    assert middle_page(successors, [4, 3, 2, 1]) == corrected[2]
+
+
+def test_cycle():
+    successors = build_rule_index([(1, 2), (2, 3), (3, 1)])
+    with pytest.raises(ValueError):
+        correct_update(successors, [1, 2, 3])
+    with pytest.raises(ValueError):
+        middle_page(successors, [1, 2, 3])